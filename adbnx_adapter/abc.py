@@ -2,11 +2,11 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
 
 from arango.graph import Graph as ADBGraph
 from networkx.classes.graph import Graph as NXGraph
-from networkx.classes.multidigraph import MultiGraph as NXMultiDiGraph
+from networkx.classes.multidigraph import MultiDiGraph as NXMultiDiGraph
 
 from .typings import ArangoMetagraph, Json, NxData, NxId
 
@@ -20,9 +20,76 @@ class Abstract_ADBNX_Adapter(ABC):
         name: str,
         metagraph: ArangoMetagraph,
         explicit_metagraph: bool = True,
-        nx_graph: Optional[NXMultiDiGraph] = None,
+        nx_graph: Optional[NXGraph] = None,
+        max_workers: Optional[int] = None,
+        partitions: Optional[Dict[str, int]] = None,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        memory_budget: Optional[int] = None,
+        target_batch_bytes: Optional[int] = None,
+        target_batch_latency: Optional[float] = None,
         **adb_export_kwargs: Any,
-    ) -> NXMultiDiGraph:
+    ) -> NXGraph:
+        raise NotImplementedError  # pragma: no cover
+
+    def arangodb_to_networkx_incremental(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        nx_graph: Optional[NXGraph] = None,
+        incremental_attribute: Optional[str] = None,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
+        raise NotImplementedError  # pragma: no cover
+
+    def arangodb_to_networkx_edge_driven(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        nx_graph: Optional[NXGraph] = None,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        memory_budget: Optional[int] = None,
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
+        raise NotImplementedError  # pragma: no cover
+
+    def arangodb_to_networkx_checkpointed(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        checkpoint_path: str,
+        checkpoint_interval: float = 60.0,
+        explicit_metagraph: bool = True,
+        nx_graph: Optional[NXGraph] = None,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        memory_budget: Optional[int] = None,
+        target_batch_bytes: Optional[int] = None,
+        target_batch_latency: Optional[float] = None,
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
+        raise NotImplementedError  # pragma: no cover
+
+    def resume_arangodb_to_networkx(
+        self, checkpoint_path: str, **adb_export_kwargs: Any
+    ) -> NXGraph:
         raise NotImplementedError  # pragma: no cover
 
     def arangodb_collections_to_networkx(
@@ -30,17 +97,85 @@ class Abstract_ADBNX_Adapter(ABC):
         name: str,
         v_cols: Set[str],
         e_cols: Set[str],
-        nx_graph: Optional[NXMultiDiGraph] = None,
+        nx_graph: Optional[NXGraph] = None,
+        *,
+        incremental: bool = False,
         **adb_export_kwargs: Any,
-    ) -> NXMultiDiGraph:
+    ) -> NXGraph:
         raise NotImplementedError  # pragma: no cover
 
     def arangodb_graph_to_networkx(
         self,
         name: str,
-        nx_graph: Optional[NXMultiDiGraph] = None,
+        nx_graph: Optional[NXGraph] = None,
+        *,
+        incremental: bool = False,
         **adb_export_kwargs: Any,
-    ) -> NXMultiDiGraph:
+    ) -> NXGraph:
+        raise NotImplementedError  # pragma: no cover
+
+    def arangodb_neighborhood_to_networkx(
+        self,
+        name: str,
+        seeds: List[str],
+        depth: int = 1,
+        direction: str = "any",
+        nx_graph: Optional[NXGraph] = None,
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
+        raise NotImplementedError  # pragma: no cover
+
+    def arangodb_to_csr(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        **adb_export_kwargs: Any,
+    ) -> Json:
+        raise NotImplementedError  # pragma: no cover
+
+    def estimate_export(
+        self,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        sample_size: int = 100,
+        **adb_export_kwargs: Any,
+    ) -> Json:
+        raise NotImplementedError  # pragma: no cover
+
+    def arangodb_to_networkx_stream(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        target_batch_bytes: Optional[int] = None,
+        target_batch_latency: Optional[float] = None,
+        **adb_export_kwargs: Any,
+    ) -> Iterator[Tuple[str, bool, List[Tuple[Any, ...]]]]:
+        raise NotImplementedError  # pragma: no cover
+
+    async def arangodb_to_networkx_async(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        nx_graph: Optional[NXGraph] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        session: Optional[Any] = None,
+        url: Optional[str] = None,
+        auth: Union[Tuple[str, str], str, None] = None,
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
         raise NotImplementedError  # pragma: no cover
 
     def networkx_to_arangodb(
@@ -52,6 +187,30 @@ class Abstract_ADBNX_Adapter(ABC):
         overwrite_graph: bool = False,
         batch_size: Optional[int] = None,
         use_async: bool = False,
+        max_workers: Optional[int] = None,
+        queue_depth: Optional[int] = None,
+        preserve_nx_graph: bool = False,
+        node_routing: Optional[Json] = None,
+        edge_routing: Optional[Json] = None,
+        import_result: Optional[Json] = None,
+        **adb_import_kwargs: Any,
+    ) -> ADBGraph:
+        raise NotImplementedError  # pragma: no cover
+
+    async def networkx_to_arangodb_async(
+        self,
+        name: str,
+        nx_graph: NXGraph,
+        edge_definitions: Optional[List[Json]] = None,
+        orphan_collections: Optional[List[str]] = None,
+        overwrite_graph: bool = False,
+        batch_size: Optional[int] = None,
+        session: Optional[Any] = None,
+        url: Optional[str] = None,
+        auth: Union[Tuple[str, str], str, None] = None,
+        preserve_nx_graph: bool = False,
+        node_routing: Optional[Json] = None,
+        edge_routing: Optional[Json] = None,
         **adb_import_kwargs: Any,
     ) -> ADBGraph:
         raise NotImplementedError  # pragma: no cover
@@ -64,6 +223,12 @@ class Abstract_ADBNX_Controller(ABC):
     def _prepare_arangodb_edge(self, adb_edge: Json, col: str) -> None:
         raise NotImplementedError  # pragma: no cover
 
+    def _prepare_arangodb_vertices(self, adb_vertices: List[Json], col: str) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    def _prepare_arangodb_edges(self, adb_edges: List[Json], col: str) -> None:
+        raise NotImplementedError  # pragma: no cover
+
     def _identify_networkx_node(
         self, nx_node_id: NxId, nx_node: NxData, adb_v_cols: List[str]
     ) -> str:
@@ -95,6 +260,33 @@ class Abstract_ADBNX_Controller(ABC):
     ) -> Union[str, None]:
         raise NotImplementedError  # pragma: no cover
 
+    def _identify_networkx_nodes(
+        self, nx_nodes: List[Tuple[NxId, NxData]], adb_v_cols: List[str]
+    ) -> List[str]:
+        raise NotImplementedError  # pragma: no cover
+
+    def _identify_networkx_edges(
+        self,
+        nx_edges: List[Tuple[NxId, NxId, NxData]],
+        nx_map: Dict[NxId, str],
+        adb_e_cols: List[str],
+    ) -> List[str]:
+        raise NotImplementedError  # pragma: no cover
+
+    def _keyify_networkx_nodes(
+        self, i: int, nx_nodes: List[Tuple[NxId, NxData]], cols: List[str]
+    ) -> List[str]:
+        raise NotImplementedError  # pragma: no cover
+
+    def _keyify_networkx_edges(
+        self,
+        i: int,
+        nx_edges: List[Tuple[NxId, NxId, NxData]],
+        nx_map: Dict[NxId, str],
+        cols: List[str],
+    ) -> List[Union[str, None]]:
+        raise NotImplementedError  # pragma: no cover
+
     def _prepare_networkx_node(
         self,
         nx_node: Json,
@@ -1,12 +1,55 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import asyncio
+import base64
+import hashlib
+import json
 import logging
+import os
+import pickle
+import tempfile
+import tracemalloc
+from array import array
 from collections import defaultdict
-from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from itertools import islice
+from numbers import Number
+from queue import Empty, Full, Queue
+from threading import BoundedSemaphore, Condition, Event, Thread
+from time import perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from arango.cursor import Cursor
 from arango.database import StandardDatabase
+from arango.exceptions import (
+    AQLQueryExecuteError,
+    ArangoServerError,
+    CursorCloseError,
+    CursorNextError,
+    DocumentInsertError,
+    GraphCreateError,
+    GraphDeleteError,
+    GraphPropertiesError,
+)
 from arango.graph import Graph as ADBGraph
+from arango.request import Request
+from arango.response import Response
 from networkx.classes.graph import Graph as NXGraph
 from networkx.classes.multidigraph import MultiDiGraph as NXMultiDiGraph
 from rich.console import Group
@@ -36,14 +79,59 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
     :param logging_lvl: Defaults to logging.INFO. Other useful options are
         logging.DEBUG (more verbose), and logging.WARNING (less verbose).
     :type logging_lvl: str | int
+    :param cache_dir: If specified, the NetworkX graphs created from ArangoDB are
+        cached (pickled) in this local directory, and re-used by the following
+        exports of the same (unmodified) collections, with the same metagraph,
+        controller class and export options. Only applies when no **nx_graph**
+        is provided, and when no collection is sampled at "random". Defaults to
+        None (i.e no caching).
+    :type cache_dir: str | None
+    :param cache_max_bytes: The maximum size of **cache_dir**. The least recently
+        used graphs are evicted first. Defaults to None (i.e no limit).
+    :type cache_max_bytes: int | None
     :raise ValueError: If invalid parameters
     """
 
+    # Maps the supported edge aggregations to their AQL function
+    __AQL_AGGREGATE_FUNCTIONS = {
+        "count": "LENGTH",
+        "sum": "SUM",
+        "min": "MIN",
+        "max": "MAX",
+        "avg": "AVERAGE",
+        "count_distinct": "COUNT_DISTINCT",
+    }
+
+    # The options of the arangodb_to_networkx*() entry points (along with the
+    # former mode flags), which are not AQL query options
+    __ADB_EXPORT_OPTIONS = {
+        "max_workers",
+        "partitions",
+        "prefetch_depth",
+        "prefetch_max_docs",
+        "nx_graph_class",
+        "structure_only",
+        "system_attributes",
+        "memory_budget",
+        "target_batch_bytes",
+        "target_batch_latency",
+        "incremental",
+        "incremental_attribute",
+        "edge_driven",
+        "checkpoint_path",
+        "checkpoint_interval",
+    }
+
+    # The maximum number of NetworkX nodes (or edges) processed at once
+    __NX_CHUNK_SIZE = 10000
+
     def __init__(
         self,
         db: StandardDatabase,
         controller: ADBNX_Controller = ADBNX_Controller(),
         logging_lvl: Union[str, int] = logging.INFO,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: Optional[int] = None,
     ):
         self.set_logging(logging_lvl)
 
@@ -55,6 +143,15 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
             msg = "**controller** parameter must inherit from ADBNX_Controller"
             raise TypeError(msg)
 
+        if cache_max_bytes is not None and cache_max_bytes < 1:
+            raise ValueError("**cache_max_bytes** must be greater than 0")
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self.__cache_dir = cache_dir
+        self.__cache_max_bytes = cache_max_bytes
+
         self.__db = db
         self.__async_db = db.begin_async_execution(return_result=False)
 
@@ -62,6 +159,26 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         self.__prepare_adb_vertex_method_is_empty = (
             controller.__class__._prepare_arangodb_vertex
             is ADBNX_Controller._prepare_arangodb_vertex
+            and controller.__class__._prepare_arangodb_vertices
+            is ADBNX_Controller._prepare_arangodb_vertices
+        )
+        self.__prepare_adb_edge_method_is_empty = (
+            controller.__class__._prepare_arangodb_edge
+            is ADBNX_Controller._prepare_arangodb_edge
+            and controller.__class__._prepare_arangodb_edges
+            is ADBNX_Controller._prepare_arangodb_edges
+        )
+        self.__process_nx_nodes_in_batches = not (
+            controller.__class__._identify_networkx_nodes
+            is ADBNX_Controller._identify_networkx_nodes
+            and controller.__class__._keyify_networkx_nodes
+            is ADBNX_Controller._keyify_networkx_nodes
+        )
+        self.__process_nx_edges_in_batches = not (
+            controller.__class__._identify_networkx_edges
+            is ADBNX_Controller._identify_networkx_edges
+            and controller.__class__._keyify_networkx_edges
+            is ADBNX_Controller._keyify_networkx_edges
         )
 
         logger.info(f"Instantiated ADBNX_Adapter with database '{db.name}'")
@@ -86,29 +203,119 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         name: str,
         metagraph: ArangoMetagraph,
         explicit_metagraph: bool = True,
-        nx_graph: Optional[NXMultiDiGraph] = None,
+        nx_graph: Optional[NXGraph] = None,
+        max_workers: Optional[int] = None,
+        partitions: Optional[Dict[str, int]] = None,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        memory_budget: Optional[int] = None,
+        target_batch_bytes: Optional[int] = None,
+        target_batch_latency: Optional[float] = None,
         **adb_export_kwargs: Any,
-    ) -> NXMultiDiGraph:
+    ) -> NXGraph:
         """Create a NetworkX graph from graph attributes.
 
+        The other export modes have their own entry points, i.e
+        `arangodb_to_networkx_incremental()`, `arangodb_to_networkx_edge_driven()`
+        & `arangodb_to_networkx_checkpointed()`.
+
         :param name: The NetworkX graph name.
         :type name: str
         :param metagraph: An object defining vertex & edge collections to import to
-            NetworkX, along with their associated attributes to keep.
+            NetworkX, along with their associated attributes to keep, and optional
+            server-side **collectionFilters** (see below).
         :type metagraph: adbnx_adapter.typings.ArangoMetagraph
         :param explicit_metagraph: Only keep the document attributes specified in
             **metagraph** when importing to NetworkX (is True by default). Otherwise,
-            all document attributes are included. Defaults to True.
+            all document attributes are included. If True, and if the controller
+            does not prepare the ArangoDB edges, the edges are fetched as compact
+            arrays rather than as documents. Defaults to True.
         :type explicit_metagraph: bool
         :param adb_export_kwargs: Keyword arguments to specify AQL query options when
             fetching documents from the ArangoDB instance. Full parameter list:
             https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
         :type adb_export_kwargs: Any
         :param nx_graph: An existing NetworkX graph to append to (optional).
-        :type nx_graph: networkx.classes.multidigraph.MultiDiGraph | None
-        :return: A Multi-Directed NetworkX Graph containing the ArangoDB data.
-        :rtype: networkx.classes.multidigraph.MultiDiGraph
-        :raise ValueError: If missing required keys in metagraph
+        :type nx_graph: networkx.classes.graph.Graph | None
+        :param max_workers: If specified, fetches the ArangoDB collections
+            concurrently, using at most **max_workers** in-flight cursors. Edge
+            cursors may start streaming while vertex collections are still being
+            loaded (up to 2 * **max_workers** buffered batches, after which they
+            wait, so the **ttl** AQL query option may need to be raised), but
+            edges are only inserted into **nx_graph** once all vertices have been
+            processed. If an edge collection is restricted to the exported
+            vertices, the edge collections are instead fetched one at a time
+            after the vertices. Not compatible with **prefetch_depth** nor
+            **prefetch_max_docs**. Defaults to None (i.e one collection at a time).
+        :type max_workers: int | None
+        :param partitions: Maps ArangoDB collection names to a number of disjoint
+            slices to read in parallel cursors. Each slice is a range of document
+            _key (of about the same number of documents), so that its cursor only
+            scans its own part of the primary index. The range bounds are looked
+            up beforehand, with one (index-only) query per bound. Useful for
+            collections that dominate the export time. Implies concurrent
+            fetching, where **max_workers** defaults to the largest number of
+            partitions if not specified.
+        :type partitions: Dict[str, int] | None
+        :param prefetch_depth: The number of cursor batches to fetch ahead on a
+            background thread, while the current batch is being processed. Not
+            compatible with **max_workers** nor **partitions**. Defaults to 0
+            (i.e no prefetching).
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents held
+            in memory at once (a single batch is always allowed through). Defaults
+            to None (i.e only bounded by **prefetch_depth**).
+        :type prefetch_max_docs: int | None
+        :param nx_graph_class: The class of the NetworkX graph to create if
+            **nx_graph** is not provided: Graph, DiGraph, MultiGraph or MultiDiGraph.
+            Non-multigraph classes collapse parallel ArangoDB edges into a single
+            NetworkX edge, whose attributes are updated by each duplicate (i.e the
+            last edge fetched wins). Defaults to MultiDiGraph.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param structure_only: Only import the topology of the graph: the
+            documents are fetched without their attributes, and the NetworkX
+            nodes & edges are created with empty attribute dictionaries. The
+            attributes in **metagraph** (and **explicit_metagraph**) are then
+            ignored. The controller is still called, so that custom NetworkX
+            node IDs are honoured. Defaults to False.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes
+            (i.e _id, _key, _rev, _from & _to) of the NetworkX nodes & edges, which
+            are otherwise duplicated by the NetworkX node IDs. Either "keep" (as
+            is), "drop" (removed), or "compact" (only _key is kept, along with a
+            **_collection** attribute referencing a single shared collection name
+            string). Applied after the controller. Defaults to "keep".
+        :type system_attributes: str
+        :param memory_budget: If specified, the export is first estimated with
+            `estimate_export()`, and aborted before fetching any document if the
+            estimated memory of the new NetworkX nodes & edges exceeds this
+            number of bytes. Defaults to None (i.e no budget).
+        :type memory_budget: int | None
+        :param target_batch_bytes: If specified, the documents are fetched in
+            pages (sorted by _key) whose size is continuously adapted so that
+            their JSON payload approaches this number of bytes. The
+            **batch_size** AQL query option is used as the initial page size
+            (or 1000 if not specified). Not compatible with **max_workers** nor
+            **partitions**. Defaults to None.
+        :type target_batch_bytes: int | None
+        :param target_batch_latency: Same as **target_batch_bytes**, but the
+            page size is adapted so that fetching a page approaches this number
+            of seconds. If both are specified, the smallest page size wins.
+            Defaults to None.
+        :type target_batch_latency: float | None
+        :return: A NetworkX Graph containing the ArangoDB data.
+        :rtype: networkx.classes.graph.Graph
+        :raise ValueError: If missing required keys in metagraph, if invalid
+            (or conflicting) **max_workers**, **partitions**, **prefetch_depth**,
+            **system_attributes**, **target_batch_bytes**,
+            **target_batch_latency** or metagraph **collectionFilters** values,
+            or if an option of another `arangodb_to_networkx*()` entry point is
+            specified.
+        :raise TypeError: If **nx_graph_class** is not a NetworkX graph class.
+        :raise MemoryError: If the estimated memory exceeds **memory_budget**.
 
         Here is an example entry for parameter **metagraph**:
 
@@ -126,62 +333,524 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
                 },
             },
         }
+
+        The metagraph may also specify (server-side) **collectionFilters**, which
+        are compiled into the AQL query of their collection:
+
+        .. code-block:: python
+        {
+            "vertexCollections": {...},
+            "edgeCollections": {...},
+            "collectionFilters": {
+                "account": {
+                    # An AQL filter expression on `doc`, with its bind parameters
+                    "filter": "doc.Balance >= @min_balance",
+                    "bindVars": {"min_balance": 1000},
+                    # Keep ~5% of the (filtered) documents, either at "random"
+                    # (default), or based on the "hash" of their _key
+                    "sample": 0.05,
+                    "sampling": "hash",
+                    # The maximum number of documents (not with **partitions**)
+                    "limit": 10000,
+                },
+                "transaction": {
+                    # Only keep the edges whose endpoints are nodes of the
+                    # NetworkX graph (this part is done on the client side)
+                    "restrictToVertices": True,
+                },
+            },
+        }
+
+        Parallel edges may also be aggregated on the server side, with
+        **edgeAggregations**: a single edge is then exported per (_from, _to)
+        pair of a (filtered) edge collection, whose attributes are the
+        specified aggregations (i.e "count", or "sum", "min", "max", "avg" &
+        "count_distinct" of a document attribute), instead of the metagraph
+        attributes & system attributes (except _from & _to). The "limit"
+        collection filter then applies to the aggregated edges. Not compatible
+        with **partitions**, the adaptive batch sizing, nor with incremental &
+        checkpointed exports:
+
+        .. code-block:: python
+        {
+            "vertexCollections": {...},
+            "edgeCollections": {"transaction": {}},
+            "edgeAggregations": {
+                "transaction": {
+                    "num_transactions": ["count"],
+                    "total_amt": ["sum", "transaction_amt"],
+                    "max_amt": ["max", "transaction_amt"],
+                },
+            },
+        }
         """
         logger.debug(f"--arangodb_to_networkx('{name}')--")
 
+        self.__validate_adb_export_kwargs("arangodb_to_networkx", adb_export_kwargs)
+
+        # All options are validated before any cache lookup or server request
+        collection_filters = self.__validate_adb_export_options(
+            metagraph,
+            nx_graph_class,
+            prefetch_depth,
+            system_attributes,
+            max_workers,
+            partitions,
+            target_batch_bytes,
+            target_batch_latency,
+            prefetch_max_docs,
+        )
+
+        if partitions:
+            max_workers = max_workers or max(partitions.values())
+
+        def process_adb_cols(
+            metagraph: ArangoMetagraph, explicit_metagraph: bool, nx_graph: NXGraph
+        ) -> None:
+            # This maps the ArangoDB vertex IDs to NetworkX node IDs
+            adb_map: Dict[str, NxId] = dict()
+
+            if max_workers is None:
+                self.__process_adb_cols(
+                    metagraph,
+                    explicit_metagraph,
+                    adb_map,
+                    nx_graph,
+                    structure_only,
+                    system_attributes,
+                    prefetch_depth,
+                    prefetch_max_docs,
+                    target_batch_bytes,
+                    target_batch_latency,
+                    **adb_export_kwargs,
+                )
+            else:
+                self.__process_adb_cols_concurrently(
+                    metagraph,
+                    explicit_metagraph,
+                    max_workers,
+                    partitions or {},
+                    adb_map,
+                    nx_graph,
+                    structure_only,
+                    system_attributes,
+                    **adb_export_kwargs,
+                )
+
+        return self.__export_nx_graph(
+            name,
+            metagraph,
+            explicit_metagraph,
+            nx_graph,
+            nx_graph_class,
+            structure_only,
+            system_attributes,
+            collection_filters,
+            memory_budget,
+            False,
+            process_adb_cols,
+            adb_export_kwargs,
+        )
+
+    def arangodb_to_networkx_incremental(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        nx_graph: Optional[NXGraph] = None,
+        incremental_attribute: Optional[str] = None,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
+        """Create (or sync) a NetworkX graph from graph attributes, by only
+        fetching the documents that were created or modified since the previous
+        incremental export into **nx_graph**, and removing the nodes & edges of
+        the deleted documents.
+
+        The sync state (i.e the per-document revisions, along with the NetworkX
+        IDs of the edges) is stored under the "adbnx_sync" key of
+        **nx_graph.graph**. It holds a few hundred bytes per synced document
+        (i.e about as much as a NetworkX node or edge with a few attributes),
+        and is pickled along with the graph. It can be removed once the graph no
+        longer needs to be synced, in which case the next incremental export
+        fetches all documents again. The first incremental export of a graph
+        fetches all documents. The remaining edges of a deleted vertex are
+        fetched again, so that they are kept (as in a full export). For the
+        non-multigraph classes, a NetworkX edge collapsing parallel ArangoDB
+        edges is only removed along with the last of them (and keeps the
+        attributes of the last one synced). The "limit" & random "sample"
+        collection filters, and the **edgeAggregations**, are not supported.
+
+        :param name: The NetworkX graph name.
+        :type name: str
+        :param metagraph: An object defining vertex & edge collections to import to
+            NetworkX, along with their associated attributes to keep, and optional
+            **collectionFilters** (see `arangodb_to_networkx()`).
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph**. Defaults to True.
+        :type explicit_metagraph: bool
+        :param nx_graph: The NetworkX graph of the previous incremental exports
+            (optional).
+        :type nx_graph: networkx.classes.graph.Graph | None
+        :param incremental_attribute: An attribute (e.g a timestamp) that is
+            increased by the application whenever a document is modified. If
+            specified, the documents whose attribute value reaches the highest
+            value seen so far (i.e the watermark) are fetched, the fetched
+            documents whose _rev is unchanged are skipped, and the deleted
+            documents are detected with a scan of the document IDs. The
+            documents without a value (i.e missing or null) are fetched as long
+            as no document of their collection has one, and are then considered
+            unchanged until they get one. Otherwise, the _rev values of all
+            documents are scanned & compared with the previous ones. Defaults
+            to None.
+        :type incremental_attribute: str | None
+        :param prefetch_depth: The number of cursor batches to fetch ahead on a
+            background thread. Defaults to 0 (i.e no prefetching).
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents held
+            in memory at once. Defaults to None.
+        :type prefetch_max_docs: int | None
+        :param nx_graph_class: The class of the NetworkX graph to create if
+            **nx_graph** is not provided (see `arangodb_to_networkx()`).
+            Defaults to MultiDiGraph.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param structure_only: Only import the topology of the graph. Defaults
+            to False.
+        :type structure_only: bool
+        :param system_attributes: Either "keep", "drop" or "compact" (see
+            `arangodb_to_networkx()`). Defaults to "keep".
+        :type system_attributes: str
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance. Full parameter list:
+            https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
+        :type adb_export_kwargs: Any
+        :return: The (synced) NetworkX Graph.
+        :rtype: networkx.classes.graph.Graph
+        :raise ValueError: If missing required keys in metagraph, if invalid
+            **prefetch_depth**, **system_attributes** or metagraph
+            **collectionFilters** values, or if **incremental_attribute**
+            differs from the previous incremental exports.
+        :raise TypeError: If **nx_graph_class** is not a NetworkX graph class.
+        """
+        logger.debug(f"--arangodb_to_networkx_incremental('{name}')--")
+
+        self.__validate_adb_export_kwargs(
+            "arangodb_to_networkx_incremental", adb_export_kwargs
+        )
+
+        collection_filters = self.__validate_adb_export_options(
+            metagraph, nx_graph_class, prefetch_depth, system_attributes
+        )
+
+        if any("aggregate" in f for f in collection_filters.values()):
+            raise ValueError("**edgeAggregations** cannot be incremental")
+
         # Create a new NetworkX graph if one is not provided
-        nx_graph = nx_graph if nx_graph is not None else NXMultiDiGraph(name=name)
+        nx_graph = nx_graph if nx_graph is not None else nx_graph_class(name=name)
 
-        # This maps the ArangoDB vertex IDs to NetworkX node IDs
-        adb_map: Dict[str, NxId] = dict()
+        metagraph, explicit_metagraph = self.__prepare_adb_metagraph(
+            metagraph, explicit_metagraph, structure_only, collection_filters
+        )
 
-        ######################
-        # Vertex Collections #
-        ######################
+        self.__sync_adb_cols(
+            metagraph,
+            explicit_metagraph,
+            nx_graph,
+            structure_only,
+            system_attributes,
+            incremental_attribute,
+            prefetch_depth,
+            prefetch_max_docs,
+            **adb_export_kwargs,
+        )
 
-        for v_col, atribs in metagraph["vertexCollections"].items():
-            logger.debug(f"Preparing '{v_col}' vertices")
+        logger.info(f"Synced NetworkX '{name}' Graph")
+        return nx_graph
 
-            # 1. Fetch ArangoDB vertices
-            v_col_cursor, v_col_size = self.__fetch_adb_docs(
-                v_col, False, atribs, explicit_metagraph, **adb_export_kwargs
-            )
+    def arangodb_to_networkx_edge_driven(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        nx_graph: Optional[NXGraph] = None,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        memory_budget: Optional[int] = None,
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
+        """Create a NetworkX graph from graph attributes, by fetching the edge
+        collections first, and then only the vertices referenced by the fetched
+        edges (by _id lookups, in chunks of **batch_size** IDs, or 1000 if not
+        specified). Useful when the (filtered) edges only touch a small part of
+        the vertex collections.
 
-            # 2. Process ArangoDB vertices
-            self.__process_adb_cursor(
-                "#079DE8",
-                v_col_cursor,
-                v_col_size,
-                self.__process_adb_vertex,
-                v_col,
-                adb_map,
+        :param name: The NetworkX graph name.
+        :type name: str
+        :param metagraph: An object defining vertex & edge collections to import to
+            NetworkX, along with their associated attributes to keep, and optional
+            **collectionFilters** (see `arangodb_to_networkx()`).
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph**. Defaults to True.
+        :type explicit_metagraph: bool
+        :param nx_graph: An existing NetworkX graph to append to (optional).
+        :type nx_graph: networkx.classes.graph.Graph | None
+        :param prefetch_depth: The number of cursor batches to fetch ahead on a
+            background thread. Defaults to 0 (i.e no prefetching).
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents held
+            in memory at once. Defaults to None.
+        :type prefetch_max_docs: int | None
+        :param nx_graph_class: The class of the NetworkX graph to create if
+            **nx_graph** is not provided (see `arangodb_to_networkx()`).
+            Defaults to MultiDiGraph.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param structure_only: Only import the topology of the graph. Defaults
+            to False.
+        :type structure_only: bool
+        :param system_attributes: Either "keep", "drop" or "compact" (see
+            `arangodb_to_networkx()`). Defaults to "keep".
+        :type system_attributes: str
+        :param memory_budget: If specified, the export is aborted if its
+            estimated memory exceeds this number of bytes (see
+            `arangodb_to_networkx()`). Defaults to None.
+        :type memory_budget: int | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance. Full parameter list:
+            https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
+        :type adb_export_kwargs: Any
+        :return: A NetworkX Graph containing the ArangoDB data.
+        :rtype: networkx.classes.graph.Graph
+        :raise ValueError: If missing required keys in metagraph, or if invalid
+            **prefetch_depth**, **system_attributes** or metagraph
+            **collectionFilters** values.
+        :raise TypeError: If **nx_graph_class** is not a NetworkX graph class.
+        :raise MemoryError: If the estimated memory exceeds **memory_budget**.
+        """
+        logger.debug(f"--arangodb_to_networkx_edge_driven('{name}')--")
+
+        self.__validate_adb_export_kwargs(
+            "arangodb_to_networkx_edge_driven", adb_export_kwargs
+        )
+
+        collection_filters = self.__validate_adb_export_options(
+            metagraph, nx_graph_class, prefetch_depth, system_attributes
+        )
+
+        def process_adb_cols(
+            metagraph: ArangoMetagraph, explicit_metagraph: bool, nx_graph: NXGraph
+        ) -> None:
+            self.__process_adb_cols_edge_driven(
+                metagraph,
+                explicit_metagraph,
+                dict(),
                 nx_graph,
+                structure_only,
+                system_attributes,
+                prefetch_depth,
+                prefetch_max_docs,
+                **adb_export_kwargs,
             )
 
-        ####################
-        # Edge Collections #
-        ####################
+        return self.__export_nx_graph(
+            name,
+            metagraph,
+            explicit_metagraph,
+            nx_graph,
+            nx_graph_class,
+            structure_only,
+            system_attributes,
+            collection_filters,
+            memory_budget,
+            True,
+            process_adb_cols,
+            adb_export_kwargs,
+        )
 
-        for e_col, atribs in metagraph.get("edgeCollections", {}).items():
-            logger.debug(f"Preparing '{e_col}' edges")
+    def arangodb_to_networkx_checkpointed(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        checkpoint_path: str,
+        checkpoint_interval: float = 60.0,
+        explicit_metagraph: bool = True,
+        nx_graph: Optional[NXGraph] = None,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        memory_budget: Optional[int] = None,
+        target_batch_bytes: Optional[int] = None,
+        target_batch_latency: Optional[float] = None,
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
+        """Create a NetworkX graph from graph attributes, by fetching the
+        documents in pages (sorted by _key), and periodically pickling the state
+        of the export (i.e the NetworkX graph built so far, along with the last
+        _key processed in each collection) into **checkpoint_path**, which is
+        removed once the export completes. A failed export can then be
+        continued with `resume_arangodb_to_networkx()`. The **edgeAggregations**
+        are not supported.
 
-            # 1. Fetch ArangoDB edges
-            e_col_cursor, e_col_size = self.__fetch_adb_docs(
-                e_col, True, atribs, explicit_metagraph, **adb_export_kwargs
-            )
+        :param name: The NetworkX graph name.
+        :type name: str
+        :param metagraph: An object defining vertex & edge collections to import to
+            NetworkX, along with their associated attributes to keep, and optional
+            **collectionFilters** (see `arangodb_to_networkx()`).
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param checkpoint_path: The checkpoint file.
+        :type checkpoint_path: str
+        :param checkpoint_interval: The minimum number of seconds between two
+            checkpoints. Defaults to 60.
+        :type checkpoint_interval: float
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph**. Defaults to True.
+        :type explicit_metagraph: bool
+        :param nx_graph: An existing NetworkX graph to append to (optional).
+        :type nx_graph: networkx.classes.graph.Graph | None
+        :param prefetch_depth: The number of cursor batches to fetch ahead on a
+            background thread. Defaults to 0 (i.e no prefetching).
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents held
+            in memory at once. Defaults to None.
+        :type prefetch_max_docs: int | None
+        :param nx_graph_class: The class of the NetworkX graph to create if
+            **nx_graph** is not provided (see `arangodb_to_networkx()`).
+            Defaults to MultiDiGraph.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param structure_only: Only import the topology of the graph. Defaults
+            to False.
+        :type structure_only: bool
+        :param system_attributes: Either "keep", "drop" or "compact" (see
+            `arangodb_to_networkx()`). Defaults to "keep".
+        :type system_attributes: str
+        :param memory_budget: If specified, the export is aborted if its
+            estimated memory exceeds this number of bytes (see
+            `arangodb_to_networkx()`). Defaults to None.
+        :type memory_budget: int | None
+        :param target_batch_bytes: If specified, the page size is adapted to
+            this JSON payload size (see `arangodb_to_networkx()`).
+        :type target_batch_bytes: int | None
+        :param target_batch_latency: If specified, the page size is adapted to
+            this latency (see `arangodb_to_networkx()`).
+        :type target_batch_latency: float | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance. Full parameter list:
+            https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
+        :type adb_export_kwargs: Any
+        :return: A NetworkX Graph containing the ArangoDB data.
+        :rtype: networkx.classes.graph.Graph
+        :raise ValueError: If missing required keys in metagraph, if invalid
+            **checkpoint_interval**, **prefetch_depth**, **system_attributes**,
+            **target_batch_bytes**, **target_batch_latency** or metagraph
+            **collectionFilters** values, or if **checkpoint_path** already
+            exists.
+        :raise TypeError: If **nx_graph_class** is not a NetworkX graph class.
+        :raise MemoryError: If the estimated memory exceeds **memory_budget**.
+        """
+        logger.debug(f"--arangodb_to_networkx_checkpointed('{name}')--")
 
-            # 2. Process ArangoDB edges
-            self.__process_adb_cursor(
-                "#FA7D05",
-                e_col_cursor,
-                e_col_size,
-                self.__process_adb_edge,
-                e_col,
-                adb_map,
-                nx_graph,
-            )
+        self.__validate_adb_export_kwargs(
+            "arangodb_to_networkx_checkpointed", adb_export_kwargs
+        )
+
+        collection_filters = self.__validate_adb_export_options(
+            metagraph,
+            nx_graph_class,
+            prefetch_depth,
+            system_attributes,
+            target_batch_bytes=target_batch_bytes,
+            target_batch_latency=target_batch_latency,
+        )
+
+        if any("aggregate" in f for f in collection_filters.values()):
+            raise ValueError("**edgeAggregations** cannot be checkpointed")
+
+        if checkpoint_interval <= 0:
+            raise ValueError("**checkpoint_interval** must be greater than 0")
+
+        if os.path.exists(checkpoint_path):
+            msg = f"Checkpoint '{checkpoint_path}' already exists "
+            msg += "(see resume_arangodb_to_networkx())"
+            raise ValueError(msg)
+
+        def process_adb_cols(
+            metagraph: ArangoMetagraph, explicit_metagraph: bool, nx_graph: NXGraph
+        ) -> None:
+            checkpoint: Json = {
+                "args": {
+                    "name": name,
+                    "metagraph": metagraph,
+                    "explicit_metagraph": explicit_metagraph,
+                    "prefetch_depth": prefetch_depth,
+                    "prefetch_max_docs": prefetch_max_docs,
+                    "structure_only": structure_only,
+                    "system_attributes": system_attributes,
+                    "target_batch_bytes": target_batch_bytes,
+                    "target_batch_latency": target_batch_latency,
+                    "checkpoint_interval": checkpoint_interval,
+                    "adb_export_kwargs": adb_export_kwargs,
+                },
+                "nx_graph": nx_graph,
+                "adb_map": dict(),
+                "positions": {},
+            }
+
+            self.__process_adb_cols_checkpointed(checkpoint_path, checkpoint)
+
+        return self.__export_nx_graph(
+            name,
+            metagraph,
+            explicit_metagraph,
+            nx_graph,
+            nx_graph_class,
+            structure_only,
+            system_attributes,
+            collection_filters,
+            memory_budget,
+            False,
+            process_adb_cols,
+            adb_export_kwargs,
+        )
+
+    def resume_arangodb_to_networkx(
+        self, checkpoint_path: str, **adb_export_kwargs: Any
+    ) -> NXGraph:
+        """Continue a failed `arangodb_to_networkx_checkpointed()` export from its
+        last checkpoint, instead of fetching all documents again. The export
+        options are restored from the checkpoint, and the adapter is expected
+        to use the same controller as the original export.
+
+        :param checkpoint_path: The **checkpoint_path** of the failed export.
+        :type checkpoint_path: str
+        :param adb_export_kwargs: Keyword arguments to override the AQL query
+            options of the original export.
+        :type adb_export_kwargs: Any
+        :return: A NetworkX Graph containing the ArangoDB data.
+        :rtype: networkx.classes.graph.Graph
+        :raise FileNotFoundError: If there is no checkpoint at **checkpoint_path**.
+        """
+        with open(checkpoint_path, "rb") as f:
+            checkpoint: Json = pickle.load(f)
+
+        name = checkpoint["args"]["name"]
+        logger.debug(f"--resume_arangodb_to_networkx('{name}')--")
+
+        self.__process_adb_cols_checkpointed(
+            checkpoint_path, checkpoint, **adb_export_kwargs
+        )
 
         logger.info(f"Created NetworkX '{name}' Graph")
+        nx_graph: NXGraph = checkpoint["nx_graph"]
         return nx_graph
 
     def arangodb_collections_to_networkx(
@@ -189,9 +858,11 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         name: str,
         v_cols: Set[str],
         e_cols: Set[str],
-        nx_graph: Optional[NXMultiDiGraph] = None,
+        nx_graph: Optional[NXGraph] = None,
+        *,
+        incremental: bool = False,
         **adb_export_kwargs: Any,
-    ) -> NXMultiDiGraph:
+    ) -> NXGraph:
         """Create a NetworkX graph from ArangoDB collections.
 
         :param name: The NetworkX graph name.
@@ -201,19 +872,36 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         :param e_cols: A set of edge collections to import to NetworkX.
         :type e_cols: Set[str]
         :param nx_graph: An existing NetworkX graph to append to (optional).
-        :type nx_graph: networkx.classes.multidigraph.MultiDiGraph | None
+        :type nx_graph: networkx.classes.graph.Graph | None
+        :param incremental: Sync **nx_graph** with the documents created,
+            modified or deleted since its previous incremental export, with
+            `arangodb_to_networkx_incremental()`. Defaults to False.
+        :type incremental: bool
         :param adb_export_kwargs: Keyword arguments to specify AQL query options when
             fetching documents from the ArangoDB instance. Full parameter list:
             https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
+            The export options of `arangodb_to_networkx()` (e.g **max_workers**,
+            **nx_graph_class**, **system_attributes**, **memory_budget**), or of
+            `arangodb_to_networkx_incremental()` if **incremental** is True (e.g
+            **incremental_attribute**), are also accepted.
         :type adb_export_kwargs: Any
-        :return: A Multi-Directed NetworkX Graph.
-        :rtype: networkx.classes.multidigraph.MultiDiGraph
+        :return: A NetworkX Graph (Multi-Directed by default).
+        :rtype: networkx.classes.graph.Graph
         """
         metagraph: ArangoMetagraph = {
             "vertexCollections": {col: set() for col in v_cols},
             "edgeCollections": {col: set() for col in e_cols},
         }
 
+        if incremental:
+            return self.arangodb_to_networkx_incremental(
+                name,
+                metagraph,
+                explicit_metagraph=False,
+                nx_graph=nx_graph,
+                **adb_export_kwargs,
+            )
+
         return self.arangodb_to_networkx(
             name,
             metagraph,
@@ -225,21 +913,31 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
     def arangodb_graph_to_networkx(
         self,
         name: str,
-        nx_graph: Optional[NXMultiDiGraph] = None,
+        nx_graph: Optional[NXGraph] = None,
+        *,
+        incremental: bool = False,
         **adb_export_kwargs: Any,
-    ) -> NXMultiDiGraph:
+    ) -> NXGraph:
         """Create a NetworkX graph from an ArangoDB graph.
 
         :param name: The ArangoDB graph name.
         :type name: str
         :param nx_graph: An existing NetworkX graph to append to (optional).
-        :type nx_graph: networkx.classes.multidigraph.MultiDiGraph | None
+        :type nx_graph: networkx.classes.graph.Graph | None
+        :param incremental: Sync **nx_graph** with the documents created,
+            modified or deleted since its previous incremental export, with
+            `arangodb_to_networkx_incremental()`. Defaults to False.
+        :type incremental: bool
         :param adb_export_kwargs: Keyword arguments to specify AQL query options when
             fetching documents from the ArangoDB instance. Full parameter list:
             https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
+            The export options of `arangodb_to_networkx()` (e.g **max_workers**,
+            **nx_graph_class**, **system_attributes**, **memory_budget**), or of
+            `arangodb_to_networkx_incremental()` if **incremental** is True (e.g
+            **incremental_attribute**), are also accepted.
         :type adb_export_kwargs: Any
-        :return: A Multi-Directed NetworkX Graph.
-        :rtype: networkx.classes.multidigraph.MultiDiGraph
+        :return: A NetworkX Graph (Multi-Directed by default).
+        :rtype: networkx.classes.graph.Graph
         """
         graph = self.__db.graph(name)
         v_cols: Set[str] = graph.vertex_collections()
@@ -247,231 +945,3615 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         e_cols: Set[str] = {c["edge_collection"] for c in edge_definitions}
 
         return self.arangodb_collections_to_networkx(
-            name, v_cols, e_cols, nx_graph, **adb_export_kwargs
+            name,
+            v_cols,
+            e_cols,
+            nx_graph,
+            incremental=incremental,
+            **adb_export_kwargs,
         )
 
-    ################################
-    # Public: NetworkX -> ArangoDB #
-    ################################
-
-    def networkx_to_arangodb(
+    def arangodb_neighborhood_to_networkx(
         self,
         name: str,
-        nx_graph: NXGraph,
-        edge_definitions: Optional[List[Json]] = None,
-        orphan_collections: Optional[List[str]] = None,
-        overwrite_graph: bool = False,
-        batch_size: Optional[int] = None,
-        use_async: bool = False,
-        **adb_import_kwargs: Any,
-    ) -> ADBGraph:
-        """Create an ArangoDB graph from a NetworkX graph, and a set of edge
-        definitions.
+        seeds: List[str],
+        depth: int = 1,
+        direction: str = "any",
+        nx_graph: Optional[NXGraph] = None,
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
+        """Create a NetworkX graph from the k-hop neighborhood of seed vertices
+        within an ArangoDB graph.
+
+        The neighborhood is computed server-side with an AQL traversal, so only
+        the visited vertices are transferred. Similar to `networkx.ego_graph()`,
+        the NetworkX graph contains all edges between the visited vertices.
 
         :param name: The ArangoDB graph name.
         :type name: str
-        :param nx_graph: The existing NetworkX graph.
-        :type nx_graph: networkx.classes.graph.Graph
-        :param edge_definitions: List of edge definitions, where each edge
-            definition entry is a dictionary with fields "edge_collection",
-            "from_vertex_collections" and "to_vertex_collections" (see below
-            for example). Can be omitted if the graph already exists.
-        :type edge_definitions: List[Dict[str, Any]]
-        :param orphan_collections: A list of vertex collections that will be stored as
-            orphans in the ArangoDB graph. Can be omitted if the graph already exists.
-        :type orphan_collections: List[str]
-        :param overwrite_graph: Overwrites the graph if it already exists.
-            Does not drop associated collections.
-        :type overwrite_graph: bool
-        :param batch_size: If specified, runs the ArangoDB Data Ingestion
-            process for every **batch_size** NetworkX nodes/edges within **nx_graph**.
-            Defaults to `len(nx_nodes)` & `len(nx_edges)`.
-        :type batch_size: int | None
-        :param use_async: Performs asynchronous ArangoDB ingestion if enabled.
-            Defaults to False.
-        :type use_async: bool
-        :param adb_import_kwargs: Keyword arguments to specify additional
-            parameters for ArangoDB document insertion. Full parameter list:
-            https://docs.python-arango.com/en/main/specs.html#arango.collection.Collection.import_bulk
-        :type adb_import_kwargs: Any
-        :return: The ArangoDB Graph API wrapper.
-        :rtype: arango.graph.Graph
-
-        Here is an example entry for parameter **edge_definitions**:
-
-        .. code-block:: python
-        [
-            {
-                "edge_collection": "teach",
-                "from_vertex_collections": ["teachers"],
-                "to_vertex_collections": ["lectures"]
-            }
-        ]
+        :param seeds: The ArangoDB IDs of the seed vertices (e.g "account/123").
+        :type seeds: List[str]
+        :param depth: The maximum number of hops away from the seeds. Defaults to 1.
+        :type depth: int
+        :param direction: The direction of the traversal, i.e "outbound",
+            "inbound" or "any". Defaults to "any".
+        :type direction: str
+        :param nx_graph: An existing NetworkX graph to append to (optional).
+        :type nx_graph: networkx.classes.graph.Graph | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance. Full parameter list:
+            https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
+        :type adb_export_kwargs: Any
+        :return: A NetworkX Graph (Multi-Directed by default).
+        :rtype: networkx.classes.graph.Graph
+        :raise ValueError: If no seeds, if a seed is not the ID of an existing
+            vertex of the graph, or if invalid **depth** or **direction**.
         """
-        logger.debug(f"--networkx_to_arangodb('{name}')--")
-
-        adb_graph = self.__create_adb_graph(
-            name, overwrite_graph, edge_definitions, orphan_collections
-        )
+        logger.debug(f"--arangodb_neighborhood_to_networkx('{name}')--")
 
-        adb_v_cols: List[str] = adb_graph.vertex_collections()
-        adb_e_cols: List[str] = [
-            c["edge_collection"] for c in adb_graph.edge_definitions()
-        ]
+        if not seeds:
+            raise ValueError("**seeds** must not be empty")
 
-        has_one_v_col = len(adb_v_cols) == 1
-        has_one_e_col = len(adb_e_cols) == 1
-        logger.debug(f"Is '{name}' homogeneous? {has_one_v_col and has_one_e_col}")
+        if depth < 0:
+            raise ValueError("**depth** must be greater than or equal to 0")
 
-        # This maps NetworkX node IDs to ArangoDB vertex IDs
-        nx_map: Dict[NxId, str] = dict()
+        if direction.lower() not in {"outbound", "inbound", "any"}:
+            raise ValueError("**direction** must be 'outbound', 'inbound' or 'any'")
 
-        # Stores to-be-inserted ArangoDB documents by collection name
-        adb_docs: DefaultDict[str, List[Json]] = defaultdict(list)
+        v_cols: Set[str] = set(self.__db.graph(name).vertex_collections())
+        for seed in seeds:
+            v_col, _, key = str(seed).partition("/")
+            if v_col not in v_cols or not key:
+                msg = f"Seed {seed!r} is not the ID of a '{name}' vertex "
+                msg += "(i.e 'collection/key')"
+                raise ValueError(msg)
 
-        spinner_progress = get_import_spinner_progress("    ")
+        missing_seeds: List[str] = list(
+            self.__db.aql.execute(
+                "FOR seed IN @seeds FILTER DOCUMENT(seed) == null RETURN seed",
+                bind_vars={"seeds": seeds},
+            )
+        )
 
-        ##################
-        # NetworkX Nodes #
-        ##################
+        if missing_seeds:
+            raise ValueError(f"Seed vertices not found: {missing_seeds}")
 
-        nx_id: NxId
-        nx_node: NxData
+        nx_graph = nx_graph if nx_graph is not None else NXMultiDiGraph(name=name)
 
-        nx_nodes = nx_graph.nodes(data=True)
-        node_batch_size = batch_size or len(nx_nodes)
+        # This maps the ArangoDB vertex IDs to NetworkX node IDs
+        adb_map: Dict[str, NxId] = dict()
+
+        # The ArangoDB IDs of the visited vertices
+        adb_ids: List[str] = []
+
+        def process_adb_docs(adb_docs: List[Json], is_edge: bool) -> None:
+            adb_docs_by_col: DefaultDict[str, List[Json]] = defaultdict(list)
+            for adb_doc in adb_docs:
+                adb_id: str = adb_doc["_id"]
+                adb_docs_by_col[adb_id.split("/", 1)[0]].append(adb_doc)
+
+                if not is_edge:
+                    adb_ids.append(adb_id)
+
+            for col, docs in adb_docs_by_col.items():
+                self.__process_adb_batch(docs, col, is_edge, adb_map, nx_graph)
+
+        aql_options = {**adb_export_kwargs, **{"stream": True}}
+
+        ####################
+        # Visited Vertices #
+        ####################
+
+        v_cursor: Cursor = self.__db.aql.execute(
+            f"""
+                FOR seed IN @seeds
+                    FOR v IN 0..@depth {direction.upper()} seed GRAPH @graph
+                        OPTIONS {{uniqueVertices: "global", order: "bfs"}}
+                        RETURN DISTINCT v
+            """,
+            bind_vars={"seeds": seeds, "depth": depth, "graph": name},
+            **aql_options,
+        )
+
+        self.__process_adb_cursor(
+            "#079DE8",
+            v_cursor,
+            None,
+            partial(process_adb_docs, is_edge=False),
+            f"{name} vertices",
+        )
+
+        #################
+        # Induced Edges #
+        #################
+
+        e_cursor: Cursor = self.__db.aql.execute(
+            """
+                LET visited = ZIP(@ids, @ids)
+                FOR v_id IN @ids
+                    FOR w, e IN 1..1 OUTBOUND v_id GRAPH @graph
+                        FILTER HAS(visited, w._id)
+                        RETURN e
+            """,
+            bind_vars={"ids": adb_ids, "graph": name},
+            **aql_options,
+        )
+
+        self.__process_adb_cursor(
+            "#FA7D05",
+            e_cursor,
+            None,
+            partial(process_adb_docs, is_edge=True),
+            f"{name} edges",
+        )
+
+        logger.info(f"Created NetworkX '{name}' Graph ({len(adb_ids)} vertices)")
+        return nx_graph
+
+    def arangodb_to_csr(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        **adb_export_kwargs: Any,
+    ) -> Json:
+        """Create a compact, columnar representation of an ArangoDB graph:
+        an integer node index, a CSR adjacency (i.e **indptr** & **indices**
+        arrays), and NumPy columns for the attributes specified in **metagraph**
+        (or for the **edgeAggregations** of the aggregated edge collections).
+
+        Much lighter than a NetworkX graph for analytics jobs that do not need
+        per-node/edge Python dictionaries. Requires the `numpy` package.
+
+        :param name: The graph name (used for logging).
+        :type name: str
+        :param metagraph: An object defining vertex & edge collections to export,
+            along with their associated attributes to store as NumPy columns, and
+            optional **collectionFilters** (see `arangodb_to_networkx()`).
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param prefetch_depth: The number of cursor batches to fetch ahead on a
+            background thread. Defaults to 0 (i.e no prefetching).
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents held
+            in memory at once. Defaults to None.
+        :type prefetch_max_docs: int | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance. Full parameter list:
+            https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
+        :type adb_export_kwargs: Any
+        :return: A dictionary with the following entries:
+            - "node_ids": The NetworkX node ID of each node index.
+            - "node_index": Maps NetworkX node IDs to their node index.
+            - "indptr": The CSR row pointers (int64 array of length n + 1).
+            - "indices": The CSR column indices (int64 array of length m).
+            - "node_attributes": Maps attribute names to arrays of length n.
+            - "edge_attributes": Maps attribute names to arrays of length m,
+                aligned with **indices**.
+        :rtype: Dict[str, Any]
+        :raise ImportError: If numpy is not installed.
+
+        Attribute values missing from a document are stored as NaN in numeric
+        columns, and as None otherwise. The columns of non-scalar (e.g list)
+        or mixed-type values are 1-D arrays of Python objects. Edge endpoints
+        that are not part of the exported vertex collections are still
+        assigned a node index.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:  # pragma: no cover
+            msg = "arangodb_to_csr() requires numpy: pip install numpy"
+            raise ImportError(msg) from e
+
+        logger.debug(f"--arangodb_to_csr('{name}')--")
+
+        collection_filters = self.__validate_collection_filters(metagraph, {})
+
+        # This maps the ArangoDB vertex IDs to NetworkX node IDs
+        adb_map: Dict[str, NxId] = dict()
+
+        node_ids: List[NxId] = []
+        node_index: Dict[NxId, int] = dict()
+        node_attributes: Dict[str, List[Any]] = {
+            atrib: []
+            for atribs in metagraph["vertexCollections"].values()
+            for atrib in atribs
+        }
+
+        # The aggregated edge collections only have their aggregations as attributes
+        e_col_attributes: Dict[str, Set[str]] = {}
+        for e_col, atribs in metagraph.get("edgeCollections", {}).items():
+            aggregations: Json = collection_filters.get(e_col, {}).get("aggregate", {})
+            e_col_attributes[e_col] = set(aggregations) if aggregations else atribs
+
+        src: "array[int]" = array("q")
+        dst: "array[int]" = array("q")
+        edge_attributes: Dict[str, List[Any]] = {
+            atrib: [] for atribs in e_col_attributes.values() for atrib in atribs
+        }
+
+        def get_node_index(nx_id: NxId) -> int:
+            i = node_index.get(nx_id)
+            if i is None:
+                i = node_index[nx_id] = len(node_ids)
+                node_ids.append(nx_id)
+                for values in node_attributes.values():
+                    values.append(None)
+
+            return i
+
+        def process_adb_vertices(adb_vertices: List[Json], v_col: str) -> None:
+            self.__prepare_adb_vertices(adb_vertices, v_col, adb_map)
+
+            for adb_v in adb_vertices:
+                i = get_node_index(adb_v["_id"])
+                for atrib, values in node_attributes.items():
+                    values[i] = adb_v.get(atrib)
+
+        def process_adb_edges(adb_edges: List[Json], e_col: str) -> None:
+            if collection_filters.get(e_col, {}).get("restrictToVertices", False):
+                adb_edges = self.__restrict_adb_edges(
+                    adb_edges, adb_map, node_index.__contains__
+                )
+
+            nx_edges = self.__prepare_adb_edges(adb_edges, e_col, adb_map)
+
+            for from_node_id, to_node_id, adb_e in nx_edges:
+                src.append(get_node_index(from_node_id))
+                dst.append(get_node_index(to_node_id))
+                for atrib, values in edge_attributes.items():
+                    values.append(adb_e.get(atrib))
+
+        for v_col, atribs in metagraph["vertexCollections"].items():
+            v_col_cursor, v_col_size = self.__fetch_adb_docs(
+                v_col,
+                False,
+                atribs,
+                True,
+                collection_filters.get(v_col, {}),
+                **adb_export_kwargs,
+            )
+
+            self.__process_adb_cursor(
+                "#079DE8",
+                v_col_cursor,
+                v_col_size,
+                partial(process_adb_vertices, v_col=v_col),
+                v_col,
+                prefetch_depth,
+                prefetch_max_docs,
+            )
+
+        for e_col, atribs in metagraph.get("edgeCollections", {}).items():
+            e_col_cursor, e_col_size = self.__fetch_adb_docs(
+                e_col,
+                True,
+                atribs,
+                True,
+                collection_filters.get(e_col, {}),
+                **adb_export_kwargs,
+            )
+
+            self.__process_adb_cursor(
+                "#FA7D05",
+                e_col_cursor,
+                e_col_size,
+                partial(process_adb_edges, e_col=e_col),
+                e_col,
+                prefetch_depth,
+                prefetch_max_docs,
+            )
+
+        def to_column(values: List[Any]) -> Any:
+            # Only the columns of numbers (or of strings) are typed arrays
+            if all(isinstance(v, Number) for v in values) or all(
+                isinstance(v, str) for v in values
+            ):
+                return np.array(values)
+
+            if all(
+                v is None or (isinstance(v, Number) and not isinstance(v, bool))
+                for v in values
+            ):
+                return np.array([np.nan if v is None else v for v in values])
+
+            # Filled one by one, so that (equal-length) lists are never
+            # broadcast into a multi-dimensional array
+            column: Any = np.empty(len(values), dtype=object)
+            for i, value in enumerate(values):
+                column[i] = value
+
+            return column
+
+        num_nodes = len(node_ids)
+        src_arr = np.frombuffer(src, dtype=np.int64)
+        dst_arr = np.frombuffer(dst, dtype=np.int64)
+
+        # Sort the edges by source node (stable, to preserve the export order)
+        order = np.argsort(src_arr, kind="stable")
+        out_degrees = np.bincount(src_arr, minlength=num_nodes)
+        indptr = np.concatenate(([0], np.cumsum(out_degrees))).astype(np.int64)
+
+        logger.info(f"Created CSR '{name}' Graph")
+        return {
+            "node_ids": node_ids,
+            "node_index": node_index,
+            "indptr": indptr,
+            "indices": dst_arr[order],
+            "node_attributes": {
+                atrib: to_column(values) for atrib, values in node_attributes.items()
+            },
+            "edge_attributes": {
+                atrib: to_column(values)[order]
+                for atrib, values in edge_attributes.items()
+            },
+        }
+
+    def estimate_export(
+        self,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        sample_size: int = 100,
+        **adb_export_kwargs: Any,
+    ) -> Json:
+        """Estimate the cost of exporting ArangoDB collections to NetworkX,
+        without fetching them: the collection counts are extrapolated from a
+        small sample of documents per collection, which is fetched with the
+        same query as the actual export, and loaded into a throwaway NetworkX
+        graph (through the controller) to measure its memory footprint.
+
+        :param metagraph: An object defining vertex & edge collections to export,
+            along with their associated attributes to keep, and optional
+            **collectionFilters** (see `arangodb_to_networkx()`).
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph**. Defaults to True.
+        :type explicit_metagraph: bool
+        :param nx_graph_class: The class of the NetworkX graph to export to.
+            Defaults to MultiDiGraph.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param structure_only: Only estimate the topology of the graph (see
+            `arangodb_to_networkx()`). Defaults to False.
+        :type structure_only: bool
+        :param system_attributes: Either "keep", "drop" or "compact" (see
+            `arangodb_to_networkx()`). Defaults to "keep".
+        :type system_attributes: str
+        :param sample_size: The maximum number of documents to sample per
+            collection. Defaults to 100.
+        :type sample_size: int
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        :return: A dictionary with the total estimated "documents",
+            "transfer_bytes" (i.e JSON payload), "memory_bytes" (i.e NetworkX
+            nodes & edges, including their attributes) and "duration" (in
+            seconds), along with the same estimates per collection under
+            "collections".
+        :rtype: Dict[str, Any]
+        :raise ValueError: If invalid **sample_size**, or metagraph
+            **collectionFilters** values.
+
+        The document counts account for the "sample" & "limit" collection
+        filters, but not for the "filter" expressions, nor "restrictToVertices"
+        (i.e the estimates are upper bounds in that case). The aggregated edges
+        of **edgeAggregations** are counted on the server side (i.e with all
+        collection filters), which scans their collection. The memory estimate
+        is rather conservative, as the NetworkX adjacency dictionaries of the
+        sampled edges are sparser than in the full graph. The duration is
+        extrapolated from the per-document time of the sampling query, along
+        with the round-trip latency of each cursor batch (measured with an
+        empty query).
+        """
+        logger.debug("--estimate_export--")
+
+        if sample_size < 1:
+            raise ValueError("**sample_size** must be greater than 0")
+
+        collection_filters = self.__validate_collection_filters(metagraph, {})
+
+        if structure_only:
+            explicit_metagraph = True
+
+        # The export makes one round trip per cursor batch
+        batch_size: int = adb_export_kwargs.get("batch_size") or 1000
+        round_trip_duration = self.__measure_adb_round_trip()
+
+        collections: Dict[str, Json] = {}
+        for is_edge, cols in (
+            (False, metagraph["vertexCollections"]),
+            (True, metagraph.get("edgeCollections", {})),
+        ):
+            for col, atribs in cols.items():
+                col_filter = collection_filters.get(col, {})
+
+                num_docs: int
+                if "aggregate" in col_filter:
+                    # (one edge per (_from, _to) pair, counted on the server side)
+                    num_docs = self.__count_adb_aggregated_edges(col, col_filter)
+                else:
+                    num_docs = self.__db.collection(col).count()
+                    if "sample" in col_filter:
+                        num_docs = round(num_docs * col_filter["sample"])
+                    if "limit" in col_filter:
+                        num_docs = min(num_docs, col_filter["limit"])
+
+                start_time = perf_counter()
+                cursor = self.__execute_adb_query(
+                    col,
+                    is_edge,
+                    set() if structure_only else atribs,
+                    explicit_metagraph,
+                    None,
+                    {**col_filter, "limit": min(num_docs, sample_size)},
+                    **adb_export_kwargs,
+                )
+
+                adb_docs = [
+                    adb_doc
+                    for batch in self.__iterate_adb_cursor(cursor)
+                    for adb_doc in batch
+                ]
+                fetch_duration = perf_counter() - start_time
+
+                transfer_bytes = memory_bytes = duration = 0.0
+                if adb_docs:
+                    transfer_bytes = sum(len(json.dumps(d)) for d in adb_docs)
+                    sample_memory, sample_duration = self.__measure_nx_sample(
+                        adb_docs,
+                        col,
+                        is_edge,
+                        nx_graph_class,
+                        structure_only,
+                        system_attributes,
+                    )
+
+                    # Only the per-document time scales with the number of
+                    # documents, unlike the round-trip latency of each batch
+                    sample_round_trips = -(-len(adb_docs) // batch_size)
+                    fetch_duration -= round_trip_duration * sample_round_trips
+                    round_trips = -(-num_docs // batch_size)
+
+                    ratio = num_docs / len(adb_docs)
+                    transfer_bytes *= ratio
+                    memory_bytes = sample_memory * ratio
+                    duration = round_trip_duration * round_trips
+                    duration += (max(fetch_duration, 0) + sample_duration) * ratio
+
+                collections[col] = {
+                    "documents": num_docs,
+                    "transfer_bytes": round(transfer_bytes),
+                    "memory_bytes": round(memory_bytes),
+                    "duration": duration,
+                }
+
+        estimate: Json = {
+            key: sum(col_estimate[key] for col_estimate in collections.values())
+            for key in ("documents", "transfer_bytes", "memory_bytes", "duration")
+        }
+        estimate["collections"] = collections
+
+        logger.info(
+            f"Estimated NetworkX export: {estimate['documents']} documents, "
+            f"{estimate['transfer_bytes']} bytes transferred, "
+            f"{estimate['memory_bytes']} bytes of memory, "
+            f"{estimate['duration']:.1f} seconds"
+        )
+
+        return estimate
+
+    def arangodb_to_networkx_stream(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+        target_batch_bytes: Optional[int] = None,
+        target_batch_latency: Optional[float] = None,
+        **adb_export_kwargs: Any,
+    ) -> Iterator[Tuple[str, bool, List[Tuple[Any, ...]]]]:
+        """Stream the NetworkX nodes & edges of ArangoDB collections, one cursor
+        batch at a time, without building a NetworkX graph.
+
+        The batches are prepared exactly as in `arangodb_to_networkx()` (i.e
+        through the controller, with the custom NetworkX node IDs applied to the
+        edge endpoints), and can be passed to `add_nodes_from()` &
+        `add_edges_from()`. Only the custom NetworkX node IDs (along with the
+        exported node IDs, if an edge collection filter uses
+        "restrictToVertices") are kept in memory between batches.
+
+        :param name: The graph name (used for logging).
+        :type name: str
+        :param metagraph: An object defining vertex & edge collections to export,
+            along with their associated attributes to keep, and optional
+            **collectionFilters** (see `arangodb_to_networkx()`).
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph**. Defaults to True.
+        :type explicit_metagraph: bool
+        :param structure_only: Only stream the topology of the graph, i.e nodes
+            & edges with empty attribute dictionaries. Defaults to False.
+        :type structure_only: bool
+        :param system_attributes: Either "keep", "drop" or "compact" (see
+            `arangodb_to_networkx()`). Defaults to "keep".
+        :type system_attributes: str
+        :param prefetch_depth: The number of cursor batches to fetch ahead on a
+            background thread, while the current batch is being consumed.
+            Defaults to 0 (i.e no prefetching).
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents held
+            in memory at once. Defaults to None.
+        :type prefetch_max_docs: int | None
+        :param target_batch_bytes: If specified, the batch size is adapted to
+            this JSON payload size (see `arangodb_to_networkx()`).
+        :type target_batch_bytes: int | None
+        :param target_batch_latency: If specified, the batch size is adapted to
+            this latency (see `arangodb_to_networkx()`).
+        :type target_batch_latency: float | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance. Full parameter list:
+            https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
+        :type adb_export_kwargs: Any
+        :return: The (collection, is edge collection, batch) tuples, where a
+            batch holds either (node ID, node data) or (from node ID, to node ID,
+            edge data) tuples. All vertex collections are streamed before the
+            edge collections.
+        :rtype: Iterator[Tuple[str, bool, List[Tuple[Any, ...]]]]
+        :raise ValueError: If missing required keys in metagraph, or if invalid
+            **prefetch_depth**, **system_attributes**, **target_batch_bytes**,
+            **target_batch_latency** or metagraph **collectionFilters** values.
+        """
+        logger.debug(f"--arangodb_to_networkx_stream('{name}')--")
+
+        self.__validate_batch_targets(target_batch_bytes, target_batch_latency)
+
+        if prefetch_depth < 0:
+            raise ValueError("**prefetch_depth** must be greater than or equal to 0")
+
+        if system_attributes not in {"keep", "drop", "compact"}:
+            msg = "**system_attributes** must be one of 'keep', 'drop' or 'compact'"
+            raise ValueError(msg)
+
+        collection_filters = self.__validate_collection_filters(metagraph, {})
+
+        if target_batch_bytes is not None or target_batch_latency is not None:
+            if any("aggregate" in f for f in collection_filters.values()):
+                msg = "**edgeAggregations** cannot be combined with "
+                msg += "**target_batch_bytes** nor **target_batch_latency**"
+                raise ValueError(msg)
+
+        # The documents are only fetched once the iteration starts
+        return self.__stream_adb_cols(
+            name,
+            metagraph,
+            explicit_metagraph or structure_only,
+            collection_filters,
+            structure_only,
+            system_attributes,
+            prefetch_depth,
+            prefetch_max_docs,
+            target_batch_bytes,
+            target_batch_latency,
+            **adb_export_kwargs,
+        )
+
+    async def arangodb_to_networkx_async(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool = True,
+        nx_graph: Optional[NXGraph] = None,
+        nx_graph_class: Type[NXGraph] = NXMultiDiGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        session: Optional[Any] = None,
+        url: Optional[str] = None,
+        auth: Union[Tuple[str, str], str, None] = None,
+        **adb_export_kwargs: Any,
+    ) -> NXGraph:
+        """Create a NetworkX graph from graph attributes, without blocking the
+        running event loop on the ArangoDB requests. Requires the `aiohttp`
+        package.
+
+        The requests are sent with an aiohttp session to **url**, with the
+        **auth** credentials, on the database of the python-arango database
+        instance. The collections are fetched concurrently
+        (vertex collections first, then edge collections), and the cursor
+        batches are processed on the event loop as they arrive. No progress bar
+        is displayed, so that many exports may run on the same event loop.
+
+        :param name: The NetworkX graph name.
+        :type name: str
+        :param metagraph: An object defining vertex & edge collections to import to
+            NetworkX, along with their associated attributes to keep, and optional
+            **collectionFilters** (see `arangodb_to_networkx()`).
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph** when importing to NetworkX. Defaults to True.
+        :type explicit_metagraph: bool
+        :param nx_graph: An existing NetworkX graph to append to (optional).
+        :type nx_graph: networkx.classes.graph.Graph | None
+        :param nx_graph_class: The class of the NetworkX graph to create if
+            **nx_graph** is not provided. Defaults to MultiDiGraph.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param structure_only: Only import the topology of the graph (see
+            `arangodb_to_networkx()`). Defaults to False.
+        :type structure_only: bool
+        :param system_attributes: Either "keep", "drop" or "compact" (see
+            `arangodb_to_networkx()`). Defaults to "keep".
+        :type system_attributes: str
+        :param session: An aiohttp session to send the requests with, e.g to share
+            its connection pool between conversions. Defaults to None (i.e a new
+            session is opened & closed by this method).
+        :type session: aiohttp.ClientSession | None
+        :param url: The URL of the ArangoDB host (e.g "http://localhost:8529").
+            Required.
+        :type url: str
+        :param auth: The (username, password) credentials, or a JWT token (which
+            is not refreshed by this method). Defaults to None (i.e no
+            authentication).
+        :type auth: Tuple[str, str] | str | None
+        :param adb_export_kwargs: AQL query options: **batch_size**, **ttl**,
+            **memory_limit**, **max_runtime** & **fail_on_warning**.
+        :type adb_export_kwargs: Any
+        :return: A NetworkX Graph containing the ArangoDB data.
+        :rtype: networkx.classes.graph.Graph
+        :raise ValueError: If missing required keys in metagraph, or if missing
+            **url**, or if invalid **system_attributes**, **adb_export_kwargs**
+            or metagraph **collectionFilters** values.
+        :raise TypeError: If **nx_graph_class** is not a NetworkX graph class,
+            or if invalid **auth**.
+        :raise ImportError: If aiohttp is not installed.
+        """
+        logger.debug(f"--arangodb_to_networkx_async('{name}')--")
+
+        if issubclass(nx_graph_class, NXGraph) is False:
+            msg = "**nx_graph_class** must inherit from networkx.Graph"
+            raise TypeError(msg)
+
+        if system_attributes not in {"keep", "drop", "compact"}:
+            msg = "**system_attributes** must be one of 'keep', 'drop' or 'compact'"
+            raise ValueError(msg)
+
+        cursor_options = self.__get_adb_cursor_options(adb_export_kwargs)
+        collection_filters = self.__validate_collection_filters(metagraph, {})
+        adb_conn = self.__get_adb_conn_async(url, auth)
+
+        # Create a new NetworkX graph if one is not provided
+        nx_graph = nx_graph if nx_graph is not None else nx_graph_class(name=name)
+
+        # This maps the ArangoDB vertex IDs to NetworkX node IDs
+        adb_map: Dict[str, NxId] = dict()
+
+        async def process_adb_col(col: str, is_edge: bool, atribs: Set[str]) -> None:
+            col_filter = collection_filters.get(col, {})
+            query, bind_vars = self.__build_adb_query(
+                col,
+                is_edge,
+                set() if structure_only else atribs,
+                explicit_metagraph or structure_only,
+                None,
+                col_filter,
+            )
+
+            await self.__process_adb_cursor_async(
+                adb_conn,
+                query,
+                bind_vars,
+                cursor_options,
+                partial(
+                    self.__process_adb_batch,
+                    col=col,
+                    is_edge=is_edge,
+                    adb_map=adb_map,
+                    nx_graph=nx_graph,
+                    structure_only=structure_only,
+                    system_attributes=system_attributes,
+                    col_filter=col_filter,
+                ),
+            )
+
+        is_session_owner = session is None
+        session = session or self.__get_aiohttp().ClientSession()
+        adb_conn["session"] = session
+
+        try:
+            await self.__gather_async(
+                process_adb_col(v_col, False, atribs)
+                for v_col, atribs in metagraph["vertexCollections"].items()
+            )
+
+            # Edges are only processed once all vertices have been processed
+            e_cols = metagraph.get("edgeCollections", {})
+            if any(
+                collection_filters.get(e_col, {}).get("restrictToVertices", False)
+                for e_col in e_cols
+            ):
+                # The endpoints created by other edge collections must not
+                # depend on the order in which the batches arrive
+                for e_col, atribs in e_cols.items():
+                    await process_adb_col(e_col, True, atribs)
+            else:
+                await self.__gather_async(
+                    process_adb_col(e_col, True, atribs)
+                    for e_col, atribs in e_cols.items()
+                )
+        finally:
+            if is_session_owner:
+                await session.close()
+
+        logger.info(f"Created NetworkX '{name}' Graph")
+        return nx_graph
+
+    ################################
+    # Public: NetworkX -> ArangoDB #
+    ################################
+
+    def networkx_to_arangodb(
+        self,
+        name: str,
+        nx_graph: NXGraph,
+        edge_definitions: Optional[List[Json]] = None,
+        orphan_collections: Optional[List[str]] = None,
+        overwrite_graph: bool = False,
+        batch_size: Optional[int] = None,
+        use_async: bool = False,
+        max_workers: Optional[int] = None,
+        queue_depth: Optional[int] = None,
+        preserve_nx_graph: bool = False,
+        node_routing: Optional[Json] = None,
+        edge_routing: Optional[Json] = None,
+        import_result: Optional[Json] = None,
+        **adb_import_kwargs: Any,
+    ) -> ADBGraph:
+        """Create an ArangoDB graph from a NetworkX graph, and a set of edge
+        definitions.
+
+        :param name: The ArangoDB graph name.
+        :type name: str
+        :param nx_graph: The existing NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param edge_definitions: List of edge definitions, where each edge
+            definition entry is a dictionary with fields "edge_collection",
+            "from_vertex_collections" and "to_vertex_collections" (see below
+            for example). Can be omitted if the graph already exists.
+        :type edge_definitions: List[Dict[str, Any]]
+        :param orphan_collections: A list of vertex collections that will be stored as
+            orphans in the ArangoDB graph. Can be omitted if the graph already exists.
+        :type orphan_collections: List[str]
+        :param overwrite_graph: Overwrites the graph if it already exists.
+            Does not drop associated collections.
+        :type overwrite_graph: bool
+        :param batch_size: If specified, runs the ArangoDB Data Ingestion
+            process for every **batch_size** NetworkX nodes/edges within **nx_graph**.
+            Defaults to `len(nx_nodes)` & `len(nx_edges)`.
+        :type batch_size: int | None
+        :param use_async: Performs asynchronous ArangoDB ingestion if enabled.
+            Defaults to False.
+        :type use_async: bool
+        :param max_workers: If specified, the (per-collection) batches of
+            documents are imported by a pool of **max_workers** threads, while
+            the next batches are being prepared (i.e the controller & network
+            work overlap). The results of all imports are awaited (and
+            aggregated) before returning. Not compatible with **use_async**.
+            Defaults to None (i.e each batch is imported by the calling thread,
+            unless **queue_depth** is specified).
+        :type max_workers: int | None
+        :param queue_depth: The maximum number of prepared batches waiting for
+            an import thread, beyond which the preparation of the next batches
+            is paused. If specified without **max_workers**, the batches are
+            imported in order by a single background thread. Defaults to
+            **max_workers**.
+        :type queue_depth: int | None
+        :param preserve_nx_graph: If True, **nx_graph** is left untouched: the
+            ArangoDB documents are shallow copies of the NetworkX node & edge
+            data, on which the system attributes (i.e _key, _from & _to) are
+            set, and which are released once imported. The controller may then
+            modify the (top-level) attributes of the documents without affecting
+            **nx_graph**, which may also be read by other threads during the
+            import (i.e the NetworkX data is never modified, even temporarily).
+            Otherwise, the NetworkX node & edge data are modified in place, and
+            imported as is (i.e without any copy). Defaults to False.
+        :type preserve_nx_graph: bool
+        :param node_routing: If specified, the ArangoDB vertex collection of
+            each NetworkX node is looked up from the value of one of its
+            attributes, instead of calling `_identify_networkx_node()`. A
+            dictionary with the fields "attribute" (the node attribute name),
+            "mapping" (maps attribute values to collections, defaults to the
+            vertex collections themselves) and "default" (the collection of
+            the unmapped nodes, defaults to None, i.e unmapped nodes raise a
+            ValueError). A node with an unhashable (e.g list) attribute value
+            also raises a ValueError. The collections are validated against
+            the graph before any node is processed. Defaults to None.
+        :type node_routing: Dict[str, Any] | None
+        :param edge_routing: Same as **node_routing**, for the NetworkX edges
+            and the ArangoDB edge collections (instead of calling
+            `_identify_networkx_edge()`). Defaults to None.
+        :type edge_routing: Dict[str, Any] | None
+        :param import_result: If specified, this dictionary is filled with the
+            combined results of all document imports (i.e the summed "created",
+            "errors", "empty", "updated" & "ignored" counts, and the
+            concatenated "details"), so that partial failures can be detected
+            (e.g with **halt_on_error** set to False). Not filled with
+            **use_async**, as the imports are then asynchronous jobs. Defaults
+            to None.
+        :type import_result: Dict[str, Any] | None
+        :param adb_import_kwargs: Keyword arguments to specify additional
+            parameters for ArangoDB document insertion. Full parameter list:
+            https://docs.python-arango.com/en/main/specs.html#arango.collection.Collection.import_bulk
+        :type adb_import_kwargs: Any
+        :return: The ArangoDB Graph API wrapper.
+        :rtype: arango.graph.Graph
+        :raise ValueError: If invalid **max_workers**, **queue_depth**,
+            **node_routing** or **edge_routing**.
+
+        Here is an example entry for parameter **edge_definitions**:
+
+        .. code-block:: python
+        [
+            {
+                "edge_collection": "teach",
+                "from_vertex_collections": ["teachers"],
+                "to_vertex_collections": ["lectures"]
+            }
+        ]
+
+        Here is an example value for parameter **node_routing**:
+
+        .. code-block:: python
+        {
+            "attribute": "type",
+            "mapping": {"teacher": "teachers", "lecture": "lectures"},
+            "default": "lectures"
+        }
+        """
+        logger.debug(f"--networkx_to_arangodb('{name}')--")
+
+        if max_workers is not None or queue_depth is not None:
+            if max_workers is not None and max_workers < 1:
+                raise ValueError("**max_workers** must be greater than 0")
+
+            if queue_depth is not None and queue_depth < 0:
+                msg = "**queue_depth** must be greater than or equal to 0"
+                raise ValueError(msg)
+
+            if use_async:
+                msg = "**max_workers** & **queue_depth** cannot be combined "
+                msg += "with **use_async**"
+                raise ValueError(msg)
+
+        adb_graph = self.__create_adb_graph(
+            name, overwrite_graph, edge_definitions, orphan_collections
+        )
+
+        adb_v_cols: List[str] = adb_graph.vertex_collections()
+        adb_e_cols: List[str] = [
+            c["edge_collection"] for c in adb_graph.edge_definitions()
+        ]
+
+        has_one_v_col = len(adb_v_cols) == 1
+        has_one_e_col = len(adb_e_cols) == 1
+        logger.debug(f"Is '{name}' homogeneous? {has_one_v_col and has_one_e_col}")
+
+        nx_node_router = self.__compile_nx_routing(
+            "node_routing", node_routing, adb_v_cols
+        )
+        nx_edge_router = self.__compile_nx_routing(
+            "edge_routing", edge_routing, adb_e_cols
+        )
+
+        # This maps NetworkX node IDs to ArangoDB vertex IDs
+        nx_map: Dict[NxId, str] = dict()
+
+        # Stores to-be-inserted ArangoDB documents by collection name
+        adb_docs: DefaultDict[str, List[Json]] = defaultdict(list)
+
+        spinner_progress = get_import_spinner_progress("    ")
+
+        # Imports the batches of documents on a thread pool, if requested, so
+        # that the next batches are prepared while the previous ones are sent
+        import_pool: Optional[Json] = None
+        if max_workers is not None or queue_depth is not None:
+            num_workers = max_workers or 1
+            num_queued = num_workers if queue_depth is None else queue_depth
+
+            import_pool = {
+                "executor": ThreadPoolExecutor(max_workers=num_workers),
+                "slots": BoundedSemaphore(num_workers + num_queued),
+                "futures": [],
+                "result": {} if import_result is None else import_result,
+            }
+
+        insert_adb_docs = partial(
+            self.__insert_adb_docs,
+            spinner_progress,
+            adb_docs,
+            use_async,
+            import_pool,
+            None if use_async else import_result,
+            **adb_import_kwargs,
+        )
+
+        try:
+            ##################
+            # NetworkX Nodes #
+            ##################
+
+            nx_nodes = nx_graph.nodes(data=True)
+            node_batch_size = batch_size or len(nx_nodes)
+
+            bar_progress = get_bar_progress("(NX → ADB): Nodes", "#97C423")
+            bar_progress_task = bar_progress.add_task("Nodes", total=len(nx_nodes))
+
+            with Live(Group(bar_progress, spinner_progress)):
+                for i, nx_node_chunk, ends_batch in self.__chunk_nx_items(
+                    nx_nodes, node_batch_size
+                ):
+                    bar_progress.advance(bar_progress_task, len(nx_node_chunk))
+
+                    # 1. Process chunk of NetworkX nodes
+                    self.__process_nx_nodes(
+                        i,
+                        nx_node_chunk,
+                        nx_map,
+                        adb_docs,
+                        adb_v_cols,
+                        has_one_v_col,
+                        preserve_nx_graph,
+                        nx_node_router,
+                    )
+
+                    # 2. Insert batch of nodes
+                    if ends_batch:
+                        insert_adb_docs()
+
+                # Insert remaining nodes
+                insert_adb_docs()
+
+            ##################
+            # NetworkX Edges #
+            ##################
+
+            nx_edges = nx_graph.edges(data=True)
+            edge_batch_size = batch_size or len(nx_edges)
+
+            bar_progress = get_bar_progress("(NX → ADB): Edges", "#5E3108")
+            bar_progress_task = bar_progress.add_task("Edges", total=len(nx_edges))
+
+            with Live(Group(bar_progress, spinner_progress)):
+                for i, nx_edge_chunk, ends_batch in self.__chunk_nx_items(
+                    nx_edges, edge_batch_size
+                ):
+                    bar_progress.advance(bar_progress_task, len(nx_edge_chunk))
+
+                    # 1. Process chunk of NetworkX edges
+                    self.__process_nx_edges(
+                        i,
+                        nx_edge_chunk,
+                        nx_map,
+                        adb_docs,
+                        adb_e_cols,
+                        has_one_e_col,
+                        preserve_nx_graph,
+                        nx_edge_router,
+                    )
+
+                    # 2. Insert batch of edges
+                    if ends_batch:
+                        insert_adb_docs()
+
+                # Insert remaining edges
+                insert_adb_docs()
+
+                if import_pool is not None:
+                    # Waiting for the pending imports (re-raises any error)
+                    self.__collect_adb_import_results(import_pool, wait=True)
+        finally:
+            if import_pool is not None:
+                for future in import_pool["futures"]:
+                    future.cancel()
+
+                import_pool["executor"].shutdown(wait=True)
+
+        if import_pool is not None:
+            logger.info(f"Imported ArangoDB documents: {import_pool['result']}")
+
+        logger.info(f"Created ArangoDB '{name}' Graph")
+        return adb_graph
+
+    async def networkx_to_arangodb_async(
+        self,
+        name: str,
+        nx_graph: NXGraph,
+        edge_definitions: Optional[List[Json]] = None,
+        orphan_collections: Optional[List[str]] = None,
+        overwrite_graph: bool = False,
+        batch_size: Optional[int] = None,
+        session: Optional[Any] = None,
+        url: Optional[str] = None,
+        auth: Union[Tuple[str, str], str, None] = None,
+        preserve_nx_graph: bool = False,
+        node_routing: Optional[Json] = None,
+        edge_routing: Optional[Json] = None,
+        **adb_import_kwargs: Any,
+    ) -> ADBGraph:
+        """Create an ArangoDB graph from a NetworkX graph, and a set of edge
+        definitions, without blocking the running event loop on the ArangoDB
+        requests. Requires the `aiohttp` package.
+
+        The requests are sent with an aiohttp session to **url**, with the
+        **auth** credentials, on the database of the python-arango database
+        instance. Each batch is imported into its
+        collections concurrently, and no progress bar is displayed, so that many
+        imports may run on the same event loop. The NetworkX nodes & edges are
+        processed on the event loop: specify **batch_size** to give control back
+        to the event loop regularly when importing large graphs.
+
+        :param name: The ArangoDB graph name.
+        :type name: str
+        :param nx_graph: The existing NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param edge_definitions: List of edge definitions (see
+            `networkx_to_arangodb()`). Can be omitted if the graph already exists.
+        :type edge_definitions: List[Dict[str, Any]]
+        :param orphan_collections: A list of vertex collections that will be stored as
+            orphans in the ArangoDB graph. Can be omitted if the graph already exists.
+        :type orphan_collections: List[str]
+        :param overwrite_graph: Overwrites the graph if it already exists.
+            Does not drop associated collections.
+        :type overwrite_graph: bool
+        :param batch_size: If specified, runs the ArangoDB Data Ingestion
+            process for every **batch_size** NetworkX nodes/edges within **nx_graph**.
+            Defaults to `len(nx_nodes)` & `len(nx_edges)`.
+        :type batch_size: int | None
+        :param session: An aiohttp session to send the requests with, e.g to share
+            its connection pool between conversions. Defaults to None (i.e a new
+            session is opened & closed by this method).
+        :type session: aiohttp.ClientSession | None
+        :param url: The URL of the ArangoDB host (e.g "http://localhost:8529").
+            Required.
+        :type url: str
+        :param auth: The (username, password) credentials, or a JWT token (which
+            is not refreshed by this method). Defaults to None (i.e no
+            authentication).
+        :type auth: Tuple[str, str] | str | None
+        :param preserve_nx_graph: If True, **nx_graph** is not modified (see
+            `networkx_to_arangodb()`). Defaults to False.
+        :type preserve_nx_graph: bool
+        :param node_routing: Routes the NetworkX nodes to their ArangoDB vertex
+            collections by attribute value (see `networkx_to_arangodb()`).
+            Defaults to None.
+        :type node_routing: Dict[str, Any] | None
+        :param edge_routing: Routes the NetworkX edges to their ArangoDB edge
+            collections by attribute value (see `networkx_to_arangodb()`).
+            Defaults to None.
+        :type edge_routing: Dict[str, Any] | None
+        :param adb_import_kwargs: Document import options: **halt_on_error**,
+            **details**, **from_prefix**, **to_prefix**, **overwrite**,
+            **on_duplicate** & **sync**.
+        :type adb_import_kwargs: Any
+        :return: The ArangoDB Graph API wrapper.
+        :rtype: arango.graph.Graph
+        :raise ValueError: If missing **url**, or if invalid
+            **adb_import_kwargs**, **node_routing** or **edge_routing**.
+        :raise TypeError: If invalid **auth**.
+        :raise ImportError: If aiohttp is not installed.
+        """
+        logger.debug(f"--networkx_to_arangodb_async('{name}')--")
+
+        import_params = self.__get_adb_import_params(adb_import_kwargs)
+        adb_conn = self.__get_adb_conn_async(url, auth)
+
+        is_session_owner = session is None
+        session = session or self.__get_aiohttp().ClientSession()
+        adb_conn["session"] = session
+
+        try:
+            adb_v_cols, adb_e_cols = await self.__create_adb_graph_async(
+                adb_conn, name, overwrite_graph, edge_definitions, orphan_collections
+            )
+
+            has_one_v_col = len(adb_v_cols) == 1
+            has_one_e_col = len(adb_e_cols) == 1
+
+            nx_node_router = self.__compile_nx_routing(
+                "node_routing", node_routing, adb_v_cols
+            )
+            nx_edge_router = self.__compile_nx_routing(
+                "edge_routing", edge_routing, adb_e_cols
+            )
+
+            # This maps NetworkX node IDs to ArangoDB vertex IDs
+            nx_map: Dict[NxId, str] = dict()
+
+            # Stores to-be-inserted ArangoDB documents by collection name
+            adb_docs: DefaultDict[str, List[Json]] = defaultdict(list)
+
+            nx_nodes = nx_graph.nodes(data=True)
+            node_batch_size = batch_size or len(nx_nodes)
+
+            for i, nx_node_chunk, ends_batch in self.__chunk_nx_items(
+                nx_nodes, node_batch_size
+            ):
+                self.__process_nx_nodes(
+                    i,
+                    nx_node_chunk,
+                    nx_map,
+                    adb_docs,
+                    adb_v_cols,
+                    has_one_v_col,
+                    preserve_nx_graph,
+                    nx_node_router,
+                )
+
+                if ends_batch:
+                    await self.__insert_adb_docs_async(
+                        adb_conn, adb_docs, import_params
+                    )
+
+            await self.__insert_adb_docs_async(adb_conn, adb_docs, import_params)
+
+            nx_edges = nx_graph.edges(data=True)
+            edge_batch_size = batch_size or len(nx_edges)
+
+            for i, nx_edge_chunk, ends_batch in self.__chunk_nx_items(
+                nx_edges, edge_batch_size
+            ):
+                self.__process_nx_edges(
+                    i,
+                    nx_edge_chunk,
+                    nx_map,
+                    adb_docs,
+                    adb_e_cols,
+                    has_one_e_col,
+                    preserve_nx_graph,
+                    nx_edge_router,
+                )
+
+                if ends_batch:
+                    await self.__insert_adb_docs_async(
+                        adb_conn, adb_docs, import_params
+                    )
+
+            await self.__insert_adb_docs_async(adb_conn, adb_docs, import_params)
+        finally:
+            if is_session_owner:
+                await session.close()
+
+        logger.info(f"Created ArangoDB '{name}' Graph")
+        return self.__db.graph(name)
+
+    #################################
+    # Private: ArangoDB -> NetworkX #
+    #################################
+
+    def __stream_adb_cols(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool,
+        collection_filters: Dict[str, Json],
+        structure_only: bool,
+        system_attributes: str,
+        prefetch_depth: int,
+        prefetch_max_docs: Optional[int],
+        target_batch_bytes: Optional[int],
+        target_batch_latency: Optional[float],
+        **adb_export_kwargs: Any,
+    ) -> Iterator[Tuple[str, bool, List[Tuple[Any, ...]]]]:
+        """ArangoDB -> NetworkX: Yields the prepared NetworkX nodes & edges of
+        the ArangoDB collections, one cursor batch at a time.
+
+        :param name: The graph name.
+        :type name: str
+        :param metagraph: The metagraph.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the metagraph attributes.
+        :type explicit_metagraph: bool
+        :param collection_filters: The validated metagraph **collectionFilters**.
+        :type collection_filters: Dict[str, Dict[str, Any]]
+        :param structure_only: If True, the NetworkX nodes & edges are yielded
+            without attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :param prefetch_depth: The number of batches to fetch ahead.
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents.
+        :type prefetch_max_docs: int | None
+        :param target_batch_bytes: The target payload size of a batch, if any.
+        :type target_batch_bytes: int | None
+        :param target_batch_latency: The target latency of a batch, if any.
+        :type target_batch_latency: float | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        :return: The (collection, is edge collection, batch) tuples.
+        :rtype: Iterator[Tuple[str, bool, List[Tuple[Any, ...]]]]
+        """
+        # This maps the ArangoDB vertex IDs to NetworkX node IDs
+        adb_map: Dict[str, NxId] = dict()
+
+        # Only tracked if required by a "restrictToVertices" edge collection filter
+        nx_node_ids: Set[NxId] = set()
+        track_nx_node_ids = any(
+            collection_filters.get(e_col, {}).get("restrictToVertices", False)
+            for e_col in metagraph.get("edgeCollections", {})
+        )
+
+        for is_edge, cols in (
+            (False, metagraph["vertexCollections"]),
+            (True, metagraph.get("edgeCollections", {})),
+        ):
+            for col, atribs in cols.items():
+                col_filter = collection_filters.get(col, {})
+                cursor, _ = self.__fetch_adb_docs(
+                    col,
+                    is_edge,
+                    set() if structure_only else atribs,
+                    explicit_metagraph,
+                    col_filter,
+                    target_batch_bytes,
+                    target_batch_latency,
+                    **adb_export_kwargs,
+                )
+
+                for batch in self.__iterate_adb_cursor(
+                    cursor, prefetch_depth, prefetch_max_docs
+                ):
+                    adb_docs = list(batch)
+
+                    nx_batch: List[Tuple[Any, ...]]
+                    if is_edge:
+                        if col_filter.get("restrictToVertices", False):
+                            adb_docs = self.__restrict_adb_edges(
+                                adb_docs, adb_map, nx_node_ids.__contains__
+                            )
+
+                        nx_batch = [
+                            (from_id, to_id, {} if structure_only else adb_e)
+                            for from_id, to_id, adb_e in self.__prepare_adb_edges(
+                                adb_docs, col, adb_map
+                            )
+                        ]
+                    else:
+                        self.__prepare_adb_vertices(adb_docs, col, adb_map)
+
+                        nx_batch = [
+                            (adb_v["_id"], {} if structure_only else adb_v)
+                            for adb_v in adb_docs
+                        ]
+
+                        if track_nx_node_ids:
+                            nx_node_ids.update(nx_id for nx_id, _ in nx_batch)
+
+                    if not structure_only:
+                        self.__strip_adb_system_attributes(
+                            adb_docs, col, system_attributes
+                        )
+
+                    yield col, is_edge, nx_batch
+
+        logger.info(f"Streamed NetworkX '{name}' Graph")
+
+    def __export_nx_graph(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool,
+        nx_graph: Optional[NXGraph],
+        nx_graph_class: Type[NXGraph],
+        structure_only: bool,
+        system_attributes: str,
+        collection_filters: Dict[str, Json],
+        memory_budget: Optional[int],
+        edge_driven: bool,
+        process_adb_cols: Callable[[ArangoMetagraph, bool, NXGraph], None],
+        adb_export_kwargs: Json,
+    ) -> NXGraph:
+        """ArangoDB -> NetworkX: Runs the (validated) export of a NetworkX graph:
+        the cache is looked up first, then the memory of the export is
+        estimated, and the ArangoDB collections are finally processed.
+
+        :param name: The NetworkX graph name.
+        :type name: str
+        :param metagraph: The metagraph of the export.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: The **explicit_metagraph** export option.
+        :type explicit_metagraph: bool
+        :param nx_graph: An existing NetworkX graph to append to, if any (which
+            is never cached).
+        :type nx_graph: networkx.classes.graph.Graph | None
+        :param nx_graph_class: The class of the NetworkX graph to create.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param structure_only: The **structure_only** export option.
+        :type structure_only: bool
+        :param system_attributes: The **system_attributes** export option.
+        :type system_attributes: str
+        :param collection_filters: The validated collection filters of
+            **metagraph**.
+        :type collection_filters: Dict[str, Dict[str, Any]]
+        :param memory_budget: The maximum estimated memory, if any.
+        :type memory_budget: int | None
+        :param edge_driven: True if the export is edge-driven (part of the
+            cache key).
+        :type edge_driven: bool
+        :param process_adb_cols: Processes the ArangoDB collections of the
+            (prepared) metagraph into the NetworkX graph.
+        :type process_adb_cols: Callable[[ArangoMetagraph, bool, NXGraph], None]
+        :param adb_export_kwargs: The AQL query options of the export (passed as
+            a dictionary, as they may otherwise clash with the parameters above).
+        :type adb_export_kwargs: Dict[str, Any]
+        :return: The NetworkX graph.
+        :rtype: networkx.classes.graph.Graph
+        :raise MemoryError: If the estimated memory exceeds **memory_budget**.
+        """
+        # Random samples differ between exports, so they are never cached
+        is_random_sample = any(
+            "sample" in col_filter and col_filter.get("sampling", "random") == "random"
+            for col_filter in collection_filters.values()
+        )
+
+        cache_path = None
+        if self.__cache_dir is not None and nx_graph is None and not is_random_sample:
+            cache_path = self.__get_nx_graph_cache_path(
+                name,
+                metagraph,
+                explicit_metagraph,
+                nx_graph_class,
+                structure_only,
+                system_attributes,
+                edge_driven,
+            )
+
+            cached_nx_graph = self.__load_cached_nx_graph(cache_path)
+            if cached_nx_graph is not None:
+                logger.info(f"Loaded NetworkX '{name}' Graph from cache")
+                return cached_nx_graph
+
+        if memory_budget is not None:
+            estimate = self.estimate_export(
+                metagraph,
+                explicit_metagraph,
+                nx_graph_class,
+                structure_only,
+                system_attributes,
+                **adb_export_kwargs,
+            )
+
+            if estimate["memory_bytes"] > memory_budget:
+                msg = f"NetworkX '{name}' Graph is estimated to require "
+                msg += f"{estimate['memory_bytes']} bytes, which exceeds "
+                msg += f"**memory_budget** ({memory_budget} bytes)"
+                raise MemoryError(msg)
+
+        # Create a new NetworkX graph if one is not provided
+        nx_graph = nx_graph if nx_graph is not None else nx_graph_class(name=name)
+
+        adb_metagraph, explicit_metagraph = self.__prepare_adb_metagraph(
+            metagraph, explicit_metagraph, structure_only, collection_filters
+        )
+
+        process_adb_cols(adb_metagraph, explicit_metagraph, nx_graph)
+
+        if cache_path is not None:
+            self.__cache_nx_graph(cache_path, nx_graph)
+
+        logger.info(f"Created NetworkX '{name}' Graph")
+        return nx_graph
+
+    def __prepare_adb_metagraph(
+        self,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool,
+        structure_only: bool,
+        collection_filters: Dict[str, Json],
+    ) -> Tuple[ArangoMetagraph, bool]:
+        """ArangoDB -> NetworkX: Prepares the metagraph of an export, i.e with
+        its validated collection filters (along with the compiled edge
+        aggregations), and without attributes if **structure_only** is True.
+
+        :param metagraph: The metagraph of the export.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: The **explicit_metagraph** export option.
+        :type explicit_metagraph: bool
+        :param structure_only: The **structure_only** export option.
+        :type structure_only: bool
+        :param collection_filters: The validated collection filters of
+            **metagraph**.
+        :type collection_filters: Dict[str, Dict[str, Any]]
+        :return: The prepared metagraph, along with its **explicit_metagraph**
+            option.
+        :rtype: Tuple[adbnx_adapter.typings.ArangoMetagraph, bool]
+        """
+        if structure_only:
+            # Only fetch the system attributes required to build the topology
+            metagraph = {
+                "vertexCollections": {
+                    v_col: set() for v_col in metagraph["vertexCollections"]
+                },
+                "edgeCollections": {
+                    e_col: set() for e_col in metagraph.get("edgeCollections", {})
+                },
+                "collectionFilters": collection_filters,
+            }
+
+            return metagraph, True
+
+        # The aggregations are compiled along with the collection filters
+        return {
+            **metagraph,
+            "collectionFilters": collection_filters,
+        }, explicit_metagraph
+
+    def __get_nx_graph_cache_path(
+        self,
+        name: str,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool,
+        nx_graph_class: Type[NXGraph],
+        structure_only: bool,
+        system_attributes: str,
+        edge_driven: bool,
+    ) -> str:
+        """ArangoDB -> NetworkX: Returns the cache file path of an export, based
+        on its parameters and on the current revisions of its collections.
+
+        :param name: The NetworkX graph name.
+        :type name: str
+        :param metagraph: The metagraph of the export.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: The **explicit_metagraph** export option.
+        :type explicit_metagraph: bool
+        :param nx_graph_class: The class of the NetworkX graph.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param structure_only: The **structure_only** export option.
+        :type structure_only: bool
+        :param system_attributes: The **system_attributes** export option.
+        :type system_attributes: str
+        :param edge_driven: True if the export is edge-driven.
+        :type edge_driven: bool
+        :return: The cache file path.
+        :rtype: str
+        """
+        adb_cols = list(metagraph["vertexCollections"])
+        adb_cols += list(metagraph.get("edgeCollections", {}))
+
+        cntrl_class = type(self.__cntrl)
+        cache_key = {
+            "name": name,
+            "metagraph": metagraph,
+            "explicit_metagraph": explicit_metagraph,
+            "nx_graph_class": f"{nx_graph_class.__module__}.{nx_graph_class.__name__}",
+            "structure_only": structure_only,
+            "system_attributes": system_attributes,
+            "edge_driven": edge_driven,
+            "controller": f"{cntrl_class.__module__}.{cntrl_class.__qualname__}",
+            "revisions": {
+                col: self.__db.collection(col).revision() for col in adb_cols
+            },
+        }
+
+        cache_key_json = json.dumps(
+            cache_key,
+            sort_keys=True,
+            default=lambda o: sorted(o) if isinstance(o, (set, frozenset)) else repr(o),
+        )
+
+        digest = hashlib.sha256(cache_key_json.encode("utf-8")).hexdigest()
+        return os.path.join(str(self.__cache_dir), f"{digest}.pickle")
+
+    def __load_cached_nx_graph(self, cache_path: str) -> Optional[NXGraph]:
+        """ArangoDB -> NetworkX: Loads a cached NetworkX graph.
+
+        :param cache_path: The cache file path.
+        :type cache_path: str
+        :return: The NetworkX graph, or None if it is not cached (i.e the file
+            does not exist, or was evicted concurrently).
+        :rtype: networkx.classes.graph.Graph | None
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                nx_graph: NXGraph = pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+        # Marks the cache file as recently used
+        with suppress(FileNotFoundError):
+            os.utime(cache_path)
+
+        return nx_graph
+
+    def __cache_nx_graph(self, cache_path: str, nx_graph: NXGraph) -> None:
+        """ArangoDB -> NetworkX: Caches a NetworkX graph, and evicts the least
+        recently used cache files if **cache_max_bytes** is exceeded.
+
+        :param cache_path: The cache file path.
+        :type cache_path: str
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        """
+        self.__dump_pickle(cache_path, nx_graph)
+        logger.debug(f"Cached NetworkX graph in {cache_path}")
+
+        if self.__cache_max_bytes is None:
+            return
+
+        # (files may be evicted concurrently by other threads or processes)
+        cache_dir = str(self.__cache_dir)
+        cache_files: List[Tuple[float, str]] = []
+        for f in os.listdir(cache_dir):
+            if f.endswith(".pickle"):
+                cache_file = os.path.join(cache_dir, f)
+                with suppress(FileNotFoundError):
+                    cache_files.append((os.path.getmtime(cache_file), cache_file))
+
+        cache_files.sort(reverse=True)
+
+        cache_size = 0
+        for i, (_, cache_file) in enumerate(cache_files):
+            with suppress(FileNotFoundError):
+                cache_size += os.path.getsize(cache_file)
+
+                # (the most recently used file is always kept)
+                if cache_size > self.__cache_max_bytes and i > 0:
+                    logger.debug(f"Evicting {cache_file} from the cache")
+                    os.remove(cache_file)
+
+    def __dump_pickle(self, path: str, obj: Any) -> None:
+        """Pickles an object into a file, through a uniquely named temporary file
+        of the same directory, so that the file is never partial, and that
+        concurrent writers (i.e threads or processes) do not collide.
+
+        :param path: The file path.
+        :type path: str
+        :param obj: The object to pickle.
+        :type obj: Any
+        """
+        f = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(path) or None,
+            prefix=f"{os.path.basename(path)}.",
+            suffix=".tmp",
+            delete=False,
+        )
+
+        try:
+            with f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(f.name, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(f.name)
+
+            raise
+
+    def __measure_adb_round_trip(self) -> float:
+        """ArangoDB -> NetworkX: Measures the round-trip latency of an (empty)
+        AQL query.
+
+        :return: The round-trip latency (in seconds).
+        :rtype: float
+        """
+        start_time = perf_counter()
+        list(self.__db.aql.execute("RETURN 1"))
+        return perf_counter() - start_time
+
+    def __count_adb_aggregated_edges(self, e_col: str, col_filter: Json) -> int:
+        """ArangoDB -> NetworkX: Counts the aggregated edges of an edge
+        collection, i.e its (filtered) distinct (_from, _to) pairs.
+
+        :param e_col: The ArangoDB edge collection.
+        :type e_col: str
+        :param col_filter: The (validated) metagraph **collectionFilters** entry
+            of **e_col**, along with its "aggregate" key.
+        :type col_filter: Dict[str, Any]
+        :return: The number of aggregated edges (capped by the "limit"
+            collection filter, if any).
+        :rtype: int
+        """
+        aql_query, bind_vars = self.__build_adb_query(
+            e_col, True, set(), True, None, col_filter
+        )
+
+        cursor: Cursor = self.__db.aql.execute(
+            f"RETURN LENGTH({aql_query})", bind_vars=bind_vars
+        )
+
+        num_edges: int = next(cursor)
+        return num_edges
+
+    def __measure_nx_sample(
+        self,
+        adb_docs: List[Json],
+        col: str,
+        is_edge: bool,
+        nx_graph_class: Type[NXGraph],
+        structure_only: bool,
+        system_attributes: str,
+    ) -> Tuple[int, float]:
+        """ArangoDB -> NetworkX: Measures the memory footprint & processing time
+        of a sample of ArangoDB documents, once loaded into a NetworkX graph.
+
+        :param adb_docs: The sampled ArangoDB documents (left untouched).
+        :type adb_docs: List[Dict[str, Any]]
+        :param col: The ArangoDB collection of **adb_docs**.
+        :type col: str
+        :param is_edge: True if **col** is an edge collection.
+        :type is_edge: bool
+        :param nx_graph_class: The class of the NetworkX graph.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param structure_only: If True, the NetworkX nodes & edges are created
+            without attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :return: The allocated bytes, along with the processing time (in seconds).
+        :rtype: Tuple[int, float]
+        """
+
+        # The documents are decoded from the JSON payload while tracing, as
+        # their attribute values are stored by the NetworkX graph
+        payload = json.dumps(adb_docs)
+
+        def process_sample(nx_graph: NXGraph) -> float:
+            start_time = perf_counter()
+            self.__process_adb_batch(
+                json.loads(payload),
+                col,
+                is_edge,
+                {},
+                nx_graph,
+                structure_only,
+                system_attributes,
+            )
+
+            return perf_counter() - start_time
+
+        def new_nx_graph() -> NXGraph:
+            nx_graph = nx_graph_class()
+            if is_edge:
+                # The edge endpoints are accounted for by the vertex collections
+                for adb_e in adb_docs:
+                    nx_graph.add_nodes_from((adb_e["_from"], adb_e["_to"]))
+
+            return nx_graph
+
+        duration = process_sample(new_nx_graph())
+
+        nx_graph = new_nx_graph()
+        is_tracing = tracemalloc.is_tracing()
+        if not is_tracing:
+            tracemalloc.start()
+
+        try:
+            allocated_bytes = tracemalloc.get_traced_memory()[0]
+            process_sample(nx_graph)
+            allocated_bytes = tracemalloc.get_traced_memory()[0] - allocated_bytes
+        finally:
+            if not is_tracing:
+                tracemalloc.stop()
+
+        return allocated_bytes, duration
+
+    def __validate_adb_export_options(
+        self,
+        metagraph: ArangoMetagraph,
+        nx_graph_class: Type[NXGraph],
+        prefetch_depth: int,
+        system_attributes: str,
+        max_workers: Optional[int] = None,
+        partitions: Optional[Dict[str, int]] = None,
+        target_batch_bytes: Optional[int] = None,
+        target_batch_latency: Optional[float] = None,
+        prefetch_max_docs: Optional[int] = None,
+    ) -> Dict[str, Json]:
+        """ArangoDB -> NetworkX: Validates the export options shared by the
+        `arangodb_to_networkx*()` entry points (i.e their values, and the
+        options that cannot be combined), without sending any request to the
+        ArangoDB instance.
+
+        :param metagraph: The metagraph.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param nx_graph_class: The class of the NetworkX graph.
+        :type nx_graph_class: Type[networkx.classes.graph.Graph]
+        :param prefetch_depth: The number of batches to fetch ahead.
+        :type prefetch_depth: int
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :param max_workers: The maximum number of in-flight cursors, if any.
+        :type max_workers: int | None
+        :param partitions: Maps ArangoDB collection names to their number of
+            disjoint slices, if any.
+        :type partitions: Dict[str, int] | None
+        :param target_batch_bytes: The target payload size of a batch, if any.
+        :type target_batch_bytes: int | None
+        :param target_batch_latency: The target latency of a batch, if any.
+        :type target_batch_latency: float | None
+        :param prefetch_max_docs: The maximum number of prefetched documents, if
+            any.
+        :type prefetch_max_docs: int | None
+        :return: The validated collection filters of **metagraph** (see
+            `__validate_collection_filters()`).
+        :rtype: Dict[str, Dict[str, Any]]
+        :raise ValueError: If invalid or conflicting options.
+        :raise TypeError: If **nx_graph_class** is not a NetworkX graph class.
+        """
+        if issubclass(nx_graph_class, NXGraph) is False:
+            msg = "**nx_graph_class** must inherit from networkx.Graph"
+            raise TypeError(msg)
+
+        collection_filters = self.__validate_collection_filters(
+            metagraph, partitions or {}
+        )
+
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("**max_workers** must be greater than 0")
+
+        if partitions:
+            e_cols = metagraph.get("edgeCollections", {})
+            adb_cols = set(metagraph["vertexCollections"]) | set(e_cols)
+            invalid_cols = partitions.keys() - adb_cols
+            if invalid_cols:
+                msg = f"Partitioned collections {invalid_cols} are not in the metagraph"
+                raise ValueError(msg)
+
+            if any(n < 1 for n in partitions.values()):
+                raise ValueError("**partitions** values must be greater than 0")
+
+        if prefetch_depth < 0:
+            raise ValueError("**prefetch_depth** must be greater than or equal to 0")
+
+        if prefetch_depth > 0 or prefetch_max_docs is not None:
+            if max_workers is not None or partitions:
+                msg = "**prefetch_depth** & **prefetch_max_docs** cannot be "
+                msg += "combined with **max_workers** nor **partitions**"
+                raise ValueError(msg)
+
+        if system_attributes not in {"keep", "drop", "compact"}:
+            msg = "**system_attributes** must be one of 'keep', 'drop' or 'compact'"
+            raise ValueError(msg)
+
+        if target_batch_bytes is not None or target_batch_latency is not None:
+            self.__validate_batch_targets(target_batch_bytes, target_batch_latency)
+
+            if any("aggregate" in f for f in collection_filters.values()):
+                msg = "**edgeAggregations** cannot be combined with "
+                msg += "**target_batch_bytes** nor **target_batch_latency**"
+                raise ValueError(msg)
+
+            if max_workers is not None or partitions:
+                msg = "**target_batch_bytes** & **target_batch_latency** cannot be "
+                msg += "combined with **max_workers** nor **partitions**"
+                raise ValueError(msg)
+
+        return collection_filters
+
+    def __validate_adb_export_kwargs(
+        self, entry_point: str, adb_export_kwargs: Json
+    ) -> None:
+        """ArangoDB -> NetworkX: Rejects the export options of the other
+        `arangodb_to_networkx*()` entry points, which would otherwise be passed
+        on as AQL query options.
+
+        :param entry_point: The name of the entry point.
+        :type entry_point: str
+        :param adb_export_kwargs: The AQL query options of the export.
+        :type adb_export_kwargs: Dict[str, Any]
+        :raise ValueError: If an export option is not supported by **entry_point**.
+        """
+        invalid_options = adb_export_kwargs.keys() & self.__ADB_EXPORT_OPTIONS
+        if invalid_options:
+            msg = f"{invalid_options} are not options of {entry_point}() "
+            msg += "(see the other arangodb_to_networkx*() entry points)"
+            raise ValueError(msg)
+
+    def __validate_batch_targets(
+        self,
+        target_batch_bytes: Optional[int],
+        target_batch_latency: Optional[float],
+    ) -> None:
+        """ArangoDB -> NetworkX: Validates the adaptive batch size targets.
+
+        :param target_batch_bytes: The target payload size of a batch, if any.
+        :type target_batch_bytes: int | None
+        :param target_batch_latency: The target latency of a batch, if any.
+        :type target_batch_latency: float | None
+        :raise ValueError: If a target is not positive.
+        """
+        if target_batch_bytes is not None and target_batch_bytes < 1:
+            raise ValueError("**target_batch_bytes** must be greater than 0")
+
+        if target_batch_latency is not None and target_batch_latency <= 0:
+            raise ValueError("**target_batch_latency** must be greater than 0")
+
+    def __validate_collection_filters(
+        self, metagraph: ArangoMetagraph, partitions: Dict[str, int]
+    ) -> Dict[str, Json]:
+        """ArangoDB -> NetworkX: Validates the **collectionFilters** of a metagraph.
+
+        :param metagraph: The metagraph.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param partitions: Maps ArangoDB collection names to their number of
+            disjoint slices.
+        :type partitions: Dict[str, int]
+        :return: The collection filters of **metagraph** (if any), along with
+            the validated **edgeAggregations** of each edge collection (under
+            the "aggregate" key).
+        :rtype: Dict[str, Dict[str, Any]]
+        :raise ValueError: If invalid collection filters or edge aggregations.
+        """
+        collection_filters: Dict[str, Json] = metagraph.get("collectionFilters", {})
+
+        e_cols = metagraph.get("edgeCollections", {})
+        adb_cols = set(metagraph["vertexCollections"]) | set(e_cols)
+        filter_keys = {
+            "filter",
+            "bindVars",
+            "sample",
+            "sampling",
+            "limit",
+            "restrictToVertices",
+        }
+
+        for col, col_filter in collection_filters.items():
+            if col not in adb_cols:
+                msg = f"Filtered collection '{col}' is not in the metagraph"
+                raise ValueError(msg)
+
+            invalid_keys = col_filter.keys() - filter_keys
+            if invalid_keys:
+                msg = (
+                    f"Invalid '{col}' filter keys {invalid_keys}, not in {filter_keys}"
+                )
+                raise ValueError(msg)
+
+            reserved_bind_vars = {
+                "@col",
+                "key_start",
+                "key_end",
+                "sample",
+                "limit",
+                "sync_ids",
+                "sync_attribute",
+                "sync_watermark",
+                "vertex_ids",
+                "last_key",
+            }
+            bind_vars = col_filter.get("bindVars", {}).keys()
+            if reserved_bind_vars & bind_vars or any(
+                bind_var.startswith("aggregate_") for bind_var in bind_vars
+            ):
+                msg = f"'{col}' filter bind variables cannot be {reserved_bind_vars}"
+                msg += " nor start with 'aggregate_'"
+                raise ValueError(msg)
+
+            sample = col_filter.get("sample", 1)
+            if not 0 < sample <= 1:
+                raise ValueError(f"'{col}' filter sample must be within (0, 1]")
+
+            if col_filter.get("sampling", "random") not in {"random", "hash"}:
+                raise ValueError(f"'{col}' filter sampling must be 'random' or 'hash'")
+
+            if "limit" in col_filter:
+                if col_filter["limit"] <= 0:
+                    raise ValueError(f"'{col}' filter limit must be positive")
+
+                if partitions.get(col, 1) > 1:
+                    msg = f"'{col}' filter limit cannot be combined with partitions"
+                    raise ValueError(msg)
+
+            if col_filter.get("restrictToVertices") and col not in e_cols:
+                msg = f"'{col}' is not an edge collection, cannot restrictToVertices"
+                raise ValueError(msg)
+
+        edge_aggregations: Dict[str, Json] = metagraph.get("edgeAggregations", {})
+        if not edge_aggregations:
+            return collection_filters
+
+        collection_filters = {col: dict(f) for col, f in collection_filters.items()}
+        for e_col, aggregations in edge_aggregations.items():
+            if e_col not in e_cols:
+                msg = f"Aggregated collection '{e_col}' is not an edge collection "
+                msg += "of the metagraph"
+                raise ValueError(msg)
+
+            if partitions.get(e_col, 1) > 1:
+                msg = f"'{e_col}' edge aggregations cannot be combined with partitions"
+                raise ValueError(msg)
+
+            for atrib, aggregation in aggregations.items():
+                if atrib in {"_id", "_key", "_rev", "_from", "_to"}:
+                    msg = f"'{e_col}' edge aggregation '{atrib}' is a system attribute"
+                    raise ValueError(msg)
+
+                function, *arguments = aggregation
+                if function not in self.__AQL_AGGREGATE_FUNCTIONS:
+                    msg = f"'{e_col}' edge aggregation '{atrib}' function must be in "
+                    msg += f"{sorted(self.__AQL_AGGREGATE_FUNCTIONS)}"
+                    raise ValueError(msg)
+
+                if len(arguments) != (0 if function == "count" else 1):
+                    msg = f"'{e_col}' edge aggregation '{atrib}' expects "
+                    msg += "no attribute" if function == "count" else "one attribute"
+                    raise ValueError(msg)
+
+            collection_filters.setdefault(e_col, {})["aggregate"] = aggregations
+
+        return collection_filters
+
+    def __fetch_adb_docs(
+        self,
+        col: str,
+        is_edge: bool,
+        attributes: Set[str],
+        explicit_metagraph: bool,
+        col_filter: Json,
+        target_batch_bytes: Optional[int] = None,
+        target_batch_latency: Optional[float] = None,
+        aql_return_value: Optional[str] = None,
+        **adb_export_kwargs: Any,
+    ) -> Tuple[Union[Cursor, Iterator[List[Json]]], int]:
+        """ArangoDB -> NetworkX: Fetches ArangoDB documents within a collection.
+
+        :param col: The ArangoDB collection.
+        :type col: str
+        :param is_edge: True if **col** is an edge collection.
+        :type is_edge: bool
+        :param attributes: The set of document attributes.
+        :type attributes: Set[str]
+        :param explicit_metagraph: If True, only return the set of **attributes**
+            specified when fetching the documents of the collection **col**.
+            If False, all document attributes are included.
+        :type explicit_metagraph: bool
+        :param col_filter: The (validated) metagraph **collectionFilters** entry
+            of **col**, if any.
+        :type col_filter: Dict[str, Any]
+        :param target_batch_bytes: If specified (or **target_batch_latency**),
+            the documents are fetched in pages whose size is adapted to this
+            (approximate) JSON payload size.
+        :type target_batch_bytes: int | None
+        :param target_batch_latency: If specified (or **target_batch_bytes**),
+            the documents are fetched in pages whose size is adapted to this
+            round-trip latency (in seconds).
+        :type target_batch_latency: float | None
+        :param aql_return_value: The AQL expression to return for each document
+            (e.g see `__build_adb_edge_row()`), if not the document itself. Not
+            compatible with the adaptive batch sizing.
+        :type aql_return_value: str | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        :return: The document cursor (or the iterator of adaptively sized
+            document batches) along with the total collection size.
+        :rtype: Tuple[arango.cursor.Cursor | Iterator[List[Dict[str, Any]]], int]
+        """
+        col_size: int = self.__db.collection(col).count()
+
+        if target_batch_bytes is not None or target_batch_latency is not None:
+            adb_docs_pages = self.__page_adb_docs(
+                col,
+                is_edge,
+                attributes,
+                explicit_metagraph,
+                col_filter,
+                target_batch_bytes,
+                target_batch_latency,
+                **adb_export_kwargs,
+            )
+
+            return adb_docs_pages, col_size
+
+        with get_export_spinner_progress(f"ADB Export: '{col}' ({col_size})") as p:
+            p.add_task(col)
+
+            cursor = self.__execute_adb_query(
+                col,
+                is_edge,
+                attributes,
+                explicit_metagraph,
+                None,
+                col_filter,
+                aql_return_value,
+                **adb_export_kwargs,
+            )
+
+            return cursor, col_size
+
+    def __page_adb_docs(
+        self,
+        col: str,
+        is_edge: bool,
+        attributes: Set[str],
+        explicit_metagraph: bool,
+        col_filter: Json,
+        target_batch_bytes: Optional[int],
+        target_batch_latency: Optional[float],
+        last_key: Optional[str] = None,
+        **adb_export_kwargs: Any,
+    ) -> Iterator[List[Json]]:
+        """ArangoDB -> NetworkX: Fetches the ArangoDB documents of a collection
+        in pages of increasing _key values, where the size of each page is
+        adapted to the payload size & latency measured for the previous page.
+
+        Stream cursors cannot change their batch size once created, hence
+        the keyset pagination (relying on the primary index).
+
+        :param col: The ArangoDB collection.
+        :type col: str
+        :param is_edge: True if **col** is an edge collection.
+        :type is_edge: bool
+        :param attributes: The set of document attributes.
+        :type attributes: Set[str]
+        :param explicit_metagraph: If True, only return the set of **attributes**.
+        :type explicit_metagraph: bool
+        :param col_filter: The (validated) metagraph **collectionFilters** entry
+            of **col**, if any.
+        :type col_filter: Dict[str, Any]
+        :param target_batch_bytes: The target (approximate) JSON payload size of
+            a page, if any.
+        :type target_batch_bytes: int | None
+        :param target_batch_latency: The target round-trip latency of a page
+            (in seconds), if any. If neither target is specified, all pages
+            have the same size.
+        :type target_batch_latency: float | None
+        :param last_key: If specified, only the documents whose _key is greater
+            than **last_key** are fetched (i.e to resume a previous scan).
+        :type last_key: str | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance. The **batch_size**
+            option is used as the initial page size (defaults to 1000).
+        :type adb_export_kwargs: Any
+        :return: The pages of documents.
+        :rtype: Iterator[List[Dict[str, Any]]]
+        """
+        page_size: int = adb_export_kwargs.pop("batch_size", None) or 1000
+        remaining_docs: Optional[int] = col_filter.get("limit")
+        page_filter = {k: v for k, v in col_filter.items() if k != "limit"}
+        if last_key is not None:
+            page_filter = self.__merge_adb_filter(
+                page_filter, "doc._key > @last_key", {"last_key": last_key}
+            )
+
+        while remaining_docs is None or remaining_docs > 0:
+            if remaining_docs is not None:
+                page_size = min(page_size, remaining_docs)
+
+            start_time = perf_counter()
+            cursor = self.__execute_adb_query(
+                col,
+                is_edge,
+                attributes,
+                explicit_metagraph,
+                None,
+                {**page_filter, "limit": page_size},
+                None,
+                "doc._key",
+                **{**adb_export_kwargs, "batch_size": page_size},
+            )
+
+            adb_docs = [
+                adb_doc
+                for batch in self.__iterate_adb_cursor(cursor)
+                for adb_doc in batch
+            ]
+            latency = perf_counter() - start_time
+
+            if not adb_docs:
+                return
+
+            is_last_page = len(adb_docs) < page_size
+            if remaining_docs is not None:
+                remaining_docs -= len(adb_docs)
+
+            page_filter = self.__merge_adb_filter(
+                {k: v for k, v in col_filter.items() if k != "limit"},
+                "doc._key > @last_key",
+                {"last_key": adb_docs[-1]["_key"]},
+            )
+
+            # The payload size is extrapolated from (up to) 10 documents
+            sample = adb_docs[:: max(1, len(adb_docs) // 10)]
+            batch_bytes = len(json.dumps(sample)) * len(adb_docs) / len(sample)
+
+            # Grow by at most 2x, and shrink by at most 4x per page (or keep
+            # the same page size if there is no target)
+            factors = [2.0 if target_batch_bytes or target_batch_latency else 1.0]
+            if target_batch_bytes is not None:
+                factors.append(target_batch_bytes / max(batch_bytes, 1))
+            if target_batch_latency is not None:
+                factors.append(target_batch_latency / max(latency, 1e-6))
+
+            next_page_size = max(1, round(page_size * max(min(factors), 0.25)))
+            logger.debug(
+                f"'{col}' page: {len(adb_docs)} docs, ~{round(batch_bytes)} bytes, "
+                f"{latency:.3f}s (next page size: {next_page_size})"
+            )
+
+            yield adb_docs
+
+            if is_last_page:
+                return
+
+            page_size = next_page_size
+
+    def __merge_adb_filter(
+        self, col_filter: Json, aql_filter: str, bind_vars: Json
+    ) -> Json:
+        """ArangoDB -> NetworkX: Adds an AQL filter expression to the (validated)
+        metagraph **collectionFilters** entry of a collection.
+
+        :param col_filter: The collection filter.
+        :type col_filter: Dict[str, Any]
+        :param aql_filter: The AQL filter expression on `doc`.
+        :type aql_filter: str
+        :param bind_vars: The bind parameters of **aql_filter**.
+        :type bind_vars: Dict[str, Any]
+        :return: A new collection filter, combining both filter expressions.
+        :rtype: Dict[str, Any]
+        """
+        if "filter" in col_filter:
+            aql_filter = f"({col_filter['filter']}) AND ({aql_filter})"
+
+        return {
+            **col_filter,
+            "filter": aql_filter,
+            "bindVars": {**col_filter.get("bindVars", {}), **bind_vars},
+        }
+
+    def __build_adb_query(
+        self,
+        col: str,
+        is_edge: bool,
+        attributes: Set[str],
+        explicit_metagraph: bool,
+        key_range: Optional[Tuple[Optional[str], Optional[str]]],
+        col_filter: Json,
+        aql_return_value: Optional[str] = None,
+        aql_sort: Optional[str] = None,
+    ) -> Tuple[str, Json]:
+        """ArangoDB -> NetworkX: Builds the AQL query of a collection.
+
+        :param col: The ArangoDB collection.
+        :type col: str
+        :param is_edge: True if **col** is an edge collection.
+        :type is_edge: bool
+        :param attributes: The set of document attributes.
+        :type attributes: Set[str]
+        :param explicit_metagraph: If True, only return the set of **attributes**
+            specified when fetching the documents of the collection **col**.
+            If False, all document attributes are included.
+        :type explicit_metagraph: bool
+        :param key_range: If specified, only fetch the documents whose _key
+            is within the (inclusive start, exclusive end) range, where a None
+            bound is unbounded.
+        :type key_range: Tuple[str | None, str | None] | None
+        :param col_filter: The (validated) metagraph **collectionFilters** entry
+            of **col**, if any.
+        :type col_filter: Dict[str, Any]
+        :param aql_return_value: The AQL expression to return for each document.
+            Defaults to the document itself (restricted to **attributes** if
+            **explicit_metagraph** is True).
+        :type aql_return_value: str | None
+        :param aql_sort: The AQL expression to sort the documents by (applied
+            before the "limit" collection filter). Defaults to None.
+        :type aql_sort: str | None
+        :return: The AQL query, along with its bind parameters.
+        :rtype: Tuple[str, Dict[str, Any]]
+        """
+        if aql_return_value is None:
+            aql_return_value = "doc"
+            if explicit_metagraph:
+                default_keys = ["_id", "_key"]
+                default_keys += ["_from", "_to"] if is_edge else []
+                aql_return_value = f"KEEP(doc, {list(attributes) + default_keys})"
+
+        aql_operations = ["FOR doc IN @@col"]
+        bind_vars: Json = {"@col": col}
+        if key_range is not None:
+            # (served by a range scan of the primary index)
+            key_start, key_end = key_range
+            if key_start is not None:
+                aql_operations.append("FILTER doc._key >= @key_start")
+                bind_vars["key_start"] = key_start
+            if key_end is not None:
+                aql_operations.append("FILTER doc._key < @key_end")
+                bind_vars["key_end"] = key_end
+
+        if "filter" in col_filter:
+            aql_operations.append(f"FILTER {col_filter['filter']}")
+            bind_vars.update(col_filter.get("bindVars", {}))
+
+        if "sample" in col_filter:
+            if col_filter.get("sampling", "random") == "hash":
+                aql_operations.append("FILTER HASH(doc._key) % 1000000 < @sample")
+                bind_vars["sample"] = round(col_filter["sample"] * 1000000)
+            else:
+                aql_operations.append("FILTER RAND() < @sample")
+                bind_vars["sample"] = col_filter["sample"]
+
+        if "aggregate" in col_filter:
+            # One edge per (_from, _to) pair, with the aggregations as attributes
+            aql_aggregations: List[str] = []
+            aql_attributes = ["_from: adb_from", "_to: adb_to"]
+            for i, (atrib, aggregation) in enumerate(col_filter["aggregate"].items()):
+                function, *arguments = aggregation
+                aql_function = self.__AQL_AGGREGATE_FUNCTIONS[function]
+
+                if function == "count":
+                    aql_aggregations.append(f"aggregate_{i} = {aql_function}(1)")
+                else:
+                    aql_aggregations.append(
+                        f"aggregate_{i} = {aql_function}(doc.@aggregate_attribute_{i})"
+                    )
+                    bind_vars[f"aggregate_attribute_{i}"] = arguments[0]
+
+                aql_attributes.append(f"[@aggregate_name_{i}]: aggregate_{i}")
+                bind_vars[f"aggregate_name_{i}"] = atrib
+
+            aql_collect = "COLLECT adb_from = doc._from, adb_to = doc._to"
+            if aql_aggregations:
+                aql_collect += f" AGGREGATE {', '.join(aql_aggregations)}"
+
+            aql_operations.append(aql_collect)
+            aql_return_value = f"{{{', '.join(aql_attributes)}}}"
+
+        if aql_sort is not None:
+            aql_operations.append(f"SORT {aql_sort}")
+
+        if "limit" in col_filter:
+            aql_operations.append("LIMIT @limit")
+            bind_vars["limit"] = col_filter["limit"]
+
+        aql_operations.append(f"RETURN {aql_return_value}")
+
+        return " ".join(aql_operations), bind_vars
+
+    def __build_adb_edge_row(
+        self,
+        attributes: Set[str],
+        explicit_metagraph: bool,
+        structure_only: bool,
+        system_attributes: str,
+        col_filter: Json,
+    ) -> Optional[str]:
+        """ArangoDB -> NetworkX: Builds the AQL expression returning an edge as
+        a compact array, i.e [_from, _to, (system attributes), (attributes)],
+        which is cheaper to transfer & decode than the edge document.
+
+        Only applicable if the edge documents are not needed as such: with an
+        **explicit_metagraph** (without system attributes), no edge controller
+        hooks, and no aggregations.
+
+        :param attributes: The set of edge attributes.
+        :type attributes: Set[str]
+        :param explicit_metagraph: The **explicit_metagraph** export option.
+        :type explicit_metagraph: bool
+        :param structure_only: If True, only the endpoints are returned.
+        :type structure_only: bool
+        :param system_attributes: The system attributes to return after the
+            endpoints: _id & _key ("keep"), _key ("compact"), or none ("drop").
+        :type system_attributes: str
+        :param col_filter: The (validated) metagraph **collectionFilters** entry
+            of the edge collection, if any.
+        :type col_filter: Dict[str, Any]
+        :return: The AQL expression, or None if the edges must be returned as
+            documents.
+        :rtype: str | None
+        """
+        if not explicit_metagraph or "aggregate" in col_filter:
+            return None
+
+        if not {"_id", "_key", "_rev", "_from", "_to"}.isdisjoint(attributes):
+            return None
+
+        if not self.__prepare_adb_edge_method_is_empty:
+            return None
+
+        aql_fields = ["doc._from", "doc._to"]
+        if not structure_only:
+            if system_attributes == "keep":
+                aql_fields += ["doc._id", "doc._key"]
+            elif system_attributes == "compact":
+                aql_fields.append("doc._key")
+
+            # (a missing attribute must not be returned as null)
+            if attributes:
+                aql_fields.append(f"KEEP(doc, {list(attributes)})")
+
+        return f"[{', '.join(aql_fields)}]"
+
+    def __execute_adb_query(
+        self,
+        col: str,
+        is_edge: bool,
+        attributes: Set[str],
+        explicit_metagraph: bool,
+        key_range: Optional[Tuple[Optional[str], Optional[str]]],
+        col_filter: Json,
+        aql_return_value: Optional[str] = None,
+        aql_sort: Optional[str] = None,
+        **adb_export_kwargs: Any,
+    ) -> Cursor:
+        """ArangoDB -> NetworkX: Executes the stream query of a collection.
+
+        :param col: The ArangoDB collection.
+        :type col: str
+        :param is_edge: True if **col** is an edge collection.
+        :type is_edge: bool
+        :param attributes: The set of document attributes.
+        :type attributes: Set[str]
+        :param explicit_metagraph: If True, only return the set of **attributes**
+            specified when fetching the documents of the collection **col**.
+            If False, all document attributes are included.
+        :type explicit_metagraph: bool
+        :param key_range: If specified, only fetch the documents whose _key
+            is within the (inclusive start, exclusive end) range, where a None
+            bound is unbounded.
+        :type key_range: Tuple[str | None, str | None] | None
+        :param col_filter: The (validated) metagraph **collectionFilters** entry
+            of **col**, if any.
+        :type col_filter: Dict[str, Any]
+        :param aql_return_value: The AQL expression to return for each document.
+            Defaults to the document itself (restricted to **attributes** if
+            **explicit_metagraph** is True).
+        :type aql_return_value: str | None
+        :param aql_sort: The AQL expression to sort the documents by. Defaults
+            to None.
+        :type aql_sort: str | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        :return: The document cursor.
+        :rtype: arango.cursor.Cursor
+        """
+        query, bind_vars = self.__build_adb_query(
+            col,
+            is_edge,
+            attributes,
+            explicit_metagraph,
+            key_range,
+            col_filter,
+            aql_return_value,
+            aql_sort,
+        )
+
+        cursor: Cursor = self.__db.aql.execute(
+            query,
+            bind_vars=bind_vars,
+            **{**adb_export_kwargs, **{"stream": True}},
+        )
+
+        return cursor
+
+    def __process_adb_cols(
+        self,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool,
+        adb_map: Dict[str, NxId],
+        nx_graph: NXGraph,
+        structure_only: bool,
+        system_attributes: str,
+        prefetch_depth: int,
+        prefetch_max_docs: Optional[int],
+        target_batch_bytes: Optional[int],
+        target_batch_latency: Optional[float],
+        **adb_export_kwargs: Any,
+    ) -> None:
+        """ArangoDB -> NetworkX: Fetches & processes the ArangoDB collections of
+        **metagraph** one at a time (vertex collections first).
+
+        :param metagraph: An object defining vertex & edge collections to import to
+            NetworkX, along with their associated attributes to keep.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph** when importing to NetworkX.
+        :type explicit_metagraph: bool
+        :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
+        :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param structure_only: If True, the NetworkX nodes & edges are created
+            without attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :param prefetch_depth: The number of batches to fetch ahead.
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents.
+        :type prefetch_max_docs: int | None
+        :param target_batch_bytes: The target payload size of a page, if any.
+        :type target_batch_bytes: int | None
+        :param target_batch_latency: The target latency of a page, if any.
+        :type target_batch_latency: float | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        """
+        collection_filters: Dict[str, Json] = metagraph.get("collectionFilters", {})
+
+        ######################
+        # Vertex Collections #
+        ######################
+
+        for v_col, atribs in metagraph["vertexCollections"].items():
+            logger.debug(f"Preparing '{v_col}' vertices")
+
+            # 1. Fetch ArangoDB vertices
+            v_col_cursor, v_col_size = self.__fetch_adb_docs(
+                v_col,
+                False,
+                atribs,
+                explicit_metagraph,
+                collection_filters.get(v_col, {}),
+                target_batch_bytes,
+                target_batch_latency,
+                **adb_export_kwargs,
+            )
+
+            # 2. Process ArangoDB vertices
+            self.__process_adb_cursor(
+                "#079DE8",
+                v_col_cursor,
+                v_col_size,
+                partial(
+                    self.__process_adb_vertices,
+                    v_col=v_col,
+                    adb_map=adb_map,
+                    nx_graph=nx_graph,
+                    structure_only=structure_only,
+                    system_attributes=system_attributes,
+                ),
+                v_col,
+                prefetch_depth,
+                prefetch_max_docs,
+            )
+
+        ####################
+        # Edge Collections #
+        ####################
+
+        for e_col, atribs in metagraph.get("edgeCollections", {}).items():
+            logger.debug(f"Preparing '{e_col}' edges")
+
+            e_col_filter = collection_filters.get(e_col, {})
+            restrict_to_nodes = e_col_filter.get("restrictToVertices", False)
+
+            # Fetching the edges as arrays, if they do not need to be documents
+            aql_edge_row = None
+            if target_batch_bytes is None and target_batch_latency is None:
+                aql_edge_row = self.__build_adb_edge_row(
+                    atribs,
+                    explicit_metagraph,
+                    structure_only,
+                    system_attributes,
+                    e_col_filter,
+                )
+
+            process_adb_edges: Callable[[List[Any]], None]
+            if aql_edge_row is None:
+                process_adb_edges = partial(
+                    self.__process_adb_edges,
+                    e_col=e_col,
+                    adb_map=adb_map,
+                    nx_graph=nx_graph,
+                    structure_only=structure_only,
+                    system_attributes=system_attributes,
+                    restrict_to_nodes=restrict_to_nodes,
+                )
+            else:
+                process_adb_edges = partial(
+                    self.__process_adb_edge_rows,
+                    e_col=e_col,
+                    adb_map=adb_map,
+                    nx_graph=nx_graph,
+                    structure_only=structure_only,
+                    system_attributes=system_attributes,
+                    has_attributes=bool(atribs),
+                    restrict_to_nodes=restrict_to_nodes,
+                )
+
+            # 1. Fetch ArangoDB edges
+            e_col_cursor, e_col_size = self.__fetch_adb_docs(
+                e_col,
+                True,
+                atribs,
+                explicit_metagraph,
+                e_col_filter,
+                target_batch_bytes,
+                target_batch_latency,
+                aql_edge_row,
+                **adb_export_kwargs,
+            )
+
+            # 2. Process ArangoDB edges
+            self.__process_adb_cursor(
+                "#FA7D05",
+                e_col_cursor,
+                e_col_size,
+                process_adb_edges,
+                e_col,
+                prefetch_depth,
+                prefetch_max_docs,
+            )
+
+    def __process_adb_cols_concurrently(
+        self,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool,
+        max_workers: int,
+        partitions: Dict[str, int],
+        adb_map: Dict[str, NxId],
+        nx_graph: NXGraph,
+        structure_only: bool,
+        system_attributes: str,
+        **adb_export_kwargs: Any,
+    ) -> None:
+        """ArangoDB -> NetworkX: Fetches the ArangoDB collections of **metagraph**
+        on a thread pool, and processes their documents as they arrive.
+
+        The worker threads only perform network I/O, while the NetworkX graph is
+        exclusively modified by the calling thread. The edge cursors start
+        streaming while the vertex collections are still being loaded, but
+        their batches are held in a separate bounded queue (blocking the edge
+        workers once full), and only processed once all vertices have been
+        processed, so that their endpoints can be resolved against **adb_map**.
+        If an edge collection is restricted to the exported vertices, the edge
+        collections are instead fetched one at a time, once all vertices have
+        been processed (as in the sequential export). If a worker (or the
+        calling thread) fails, the other workers are stopped, and the exception
+        is re-raised.
+
+        :param metagraph: An object defining vertex & edge collections to import to
+            NetworkX, along with their associated attributes to keep.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph** when importing to NetworkX.
+        :type explicit_metagraph: bool
+        :param max_workers: The maximum number of in-flight cursors.
+        :type max_workers: int
+        :param partitions: Maps ArangoDB collection names to their number of
+            disjoint slices, each read by a separate cursor.
+        :type partitions: Dict[str, int]
+        :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
+        :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param structure_only: If True, the NetworkX nodes & edges are created
+            without attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        """
+        collection_filters: Dict[str, Json] = metagraph.get("collectionFilters", {})
+
+        adb_v_cols: List[Tuple[str, bool, Set[str]]] = [
+            (v_col, False, atribs)
+            for v_col, atribs in metagraph["vertexCollections"].items()
+        ]
+        adb_e_cols: List[Tuple[str, bool, Set[str]]] = [
+            (e_col, True, atribs)
+            for e_col, atribs in metagraph.get("edgeCollections", {}).items()
+        ]
+
+        # The collections fetched at once (the vertex collections are submitted
+        # first, so that the blocked edge workers cannot starve them)
+        adb_col_groups = [adb_v_cols + adb_e_cols]
+        if any(
+            collection_filters.get(e_col, {}).get("restrictToVertices", False)
+            for e_col, _, _ in adb_e_cols
+        ):
+            # The endpoints created by other edge collections must not
+            # depend on the order in which the batches arrive
+            adb_col_groups = [adb_v_cols] + [[e_col] for e_col in adb_e_cols]
+
+        # The partitioned collections are split into ranges of _key
+        key_ranges: Dict[str, List[Optional[Tuple[Optional[str], Optional[str]]]]] = {
+            col: list(self.__get_adb_key_ranges(col, partitions[col]))
+            for col, _, _ in adb_v_cols + adb_e_cols
+            if partitions.get(col, 1) > 1
+        }
+
+        # Maps is_edge to a queue of (collection, partition, is_edge, collection
+        # size, documents) entries, where a None value for documents marks the
+        # end of a cursor. The edge queue buffers the edges fetched early.
+        batch_queues: Dict[
+            bool, Queue[Tuple[str, int, bool, int, Optional[List[Json]]]]
+        ] = {
+            False: Queue(maxsize=max_workers * 2),
+            True: Queue(maxsize=max_workers * 2),
+        }
+
+        # Tells the workers to stop fetching (e.g if another worker failed)
+        stop_event = Event()
+
+        # The edges that do not need to be documents are fetched as arrays
+        aql_edge_rows: Dict[str, Optional[str]] = {
+            e_col: self.__build_adb_edge_row(
+                atribs,
+                explicit_metagraph,
+                structure_only,
+                system_attributes,
+                collection_filters.get(e_col, {}),
+            )
+            for e_col, atribs in metagraph.get("edgeCollections", {}).items()
+        }
+
+        def process_adb_batch(docs: List[Any], col: str, is_edge: bool) -> None:
+            if is_edge and aql_edge_rows[col] is not None:
+                self.__process_adb_edge_rows(
+                    docs,
+                    col,
+                    adb_map,
+                    nx_graph,
+                    structure_only,
+                    system_attributes,
+                    bool(metagraph["edgeCollections"][col]),
+                    collection_filters.get(col, {}).get("restrictToVertices", False),
+                )
+                return
+
+            self.__process_adb_batch(
+                docs,
+                col,
+                is_edge,
+                adb_map,
+                nx_graph,
+                structure_only,
+                system_attributes,
+                collection_filters.get(col, {}),
+            )
+
+        progress: Dict[str, Progress] = {
+            col: get_bar_progress(
+                f"(ADB → NX): '{col}'", "#FA7D05" if is_edge else "#079DE8"
+            )
+            for col, is_edge, _ in adb_v_cols + adb_e_cols
+        }
+        progress_task_ids = {
+            col: p.add_task(col, total=None) for col, p in progress.items()
+        }
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, Live(
+            Group(*progress.values())
+        ):
+            for adb_cols in adb_col_groups:
+                futures: Dict[Tuple[str, int], Future[None]] = {
+                    (col, i): executor.submit(
+                        self.__enqueue_adb_docs,
+                        batch_queues[is_edge],
+                        stop_event,
+                        col,
+                        i,
+                        key_range,
+                        is_edge,
+                        atribs,
+                        explicit_metagraph,
+                        collection_filters.get(col, {}),
+                        aql_edge_rows.get(col) if is_edge else None,
+                        **adb_export_kwargs,
+                    )
+                    for col, is_edge, atribs in adb_cols
+                    for i, key_range in enumerate(key_ranges.get(col, [None]))
+                }
+
+                try:
+                    # All vertex batches are processed before any edge batch
+                    for is_edge_queue, batch_queue in batch_queues.items():
+                        pending_cursors = sum(
+                            len(key_ranges.get(col, [None]))
+                            for col, is_edge, _ in adb_cols
+                            if is_edge is is_edge_queue
+                        )
+
+                        while pending_cursors > 0:
+                            col, i, is_edge, col_size, docs = batch_queue.get()
+
+                            if docs is None:
+                                pending_cursors -= 1
+                                futures[(col, i)].result()  # Re-raises exceptions
+                                continue
+
+                            col_progress = progress[col]
+                            col_progress.update(progress_task_ids[col], total=col_size)
+                            col_progress.advance(progress_task_ids[col], len(docs))
+
+                            process_adb_batch(docs, col, is_edge)
+                except BaseException:
+                    # Unblocks the workers, so that the executor can be shut down
+                    stop_event.set()
+                    for future in futures.values():
+                        future.cancel()
+
+                    for batch_queue in batch_queues.values():
+                        with suppress(Empty):
+                            while True:
+                                batch_queue.get_nowait()
+
+                    raise
+
+    def __process_adb_cols_edge_driven(
+        self,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool,
+        adb_map: Dict[str, NxId],
+        nx_graph: NXGraph,
+        structure_only: bool,
+        system_attributes: str,
+        prefetch_depth: int,
+        prefetch_max_docs: Optional[int],
+        **adb_export_kwargs: Any,
+    ) -> None:
+        """ArangoDB -> NetworkX: Fetches the ArangoDB edges of **metagraph**, and
+        then only the ArangoDB vertices that they reference.
+
+        The edges are inserted into **nx_graph** as they arrive, unless their
+        endpoints may be re-defined by the controller (or restricted to the
+        fetched vertices), in which case they are held back until all vertices
+        have been processed.
+
+        :param metagraph: An object defining vertex & edge collections to import to
+            NetworkX, along with their associated attributes to keep.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph** when importing to NetworkX.
+        :type explicit_metagraph: bool
+        :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
+        :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param structure_only: If True, the NetworkX nodes & edges are created
+            without attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :param prefetch_depth: The number of batches to fetch ahead.
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents.
+        :type prefetch_max_docs: int | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        """
+        collection_filters: Dict[str, Json] = metagraph.get("collectionFilters", {})
+        e_cols: Dict[str, Set[str]] = metagraph.get("edgeCollections", {})
+
+        restricted_e_cols = {
+            e_col
+            for e_col in e_cols
+            if collection_filters.get(e_col, {}).get("restrictToVertices", False)
+        }
+        hold_back_edges = not self.__prepare_adb_vertex_method_is_empty or bool(
+            restricted_e_cols
+        )
+
+        # Stores the referenced ArangoDB vertex IDs by collection name (in order)
+        referenced_adb_ids: Dict[str, Dict[str, None]] = {
+            v_col: {} for v_col in metagraph["vertexCollections"]
+        }
+        pending_e_batches: List[Tuple[str, List[Json]]] = []
+
+        def process_adb_edges(adb_edges: List[Json], e_col: str) -> None:
+            for adb_e in adb_edges:
+                for adb_id in (adb_e["_from"], adb_e["_to"]):
+                    v_col_adb_ids = referenced_adb_ids.get(adb_id.split("/", 1)[0])
+                    if v_col_adb_ids is not None:
+                        v_col_adb_ids[adb_id] = None
+
+            if hold_back_edges:
+                pending_e_batches.append((e_col, adb_edges))
+            else:
+                self.__process_adb_edges(
+                    adb_edges,
+                    e_col,
+                    adb_map,
+                    nx_graph,
+                    structure_only,
+                    system_attributes,
+                )
+
+        ####################
+        # Edge Collections #
+        ####################
+
+        for e_col, atribs in e_cols.items():
+            e_col_cursor, e_col_size = self.__fetch_adb_docs(
+                e_col,
+                True,
+                atribs,
+                explicit_metagraph,
+                collection_filters.get(e_col, {}),
+                **adb_export_kwargs,
+            )
+
+            self.__process_adb_cursor(
+                "#FA7D05",
+                e_col_cursor,
+                e_col_size,
+                partial(process_adb_edges, e_col=e_col),
+                e_col,
+                prefetch_depth,
+                prefetch_max_docs,
+            )
+
+        #######################
+        # Referenced Vertices #
+        #######################
+
+        chunk_size: int = adb_export_kwargs.get("batch_size") or 1000
+
+        for v_col, atribs in metagraph["vertexCollections"].items():
+            adb_ids = list(referenced_adb_ids[v_col])
+            logger.debug(f"Preparing {len(adb_ids)} referenced '{v_col}' vertices")
+
+            progress = get_bar_progress(f"(ADB → NX): '{v_col}'", "#079DE8")
+            progress_task_id = progress.add_task(v_col, total=len(adb_ids))
+
+            v_col_filter: Json = collection_filters.get(v_col, {})
+
+            # The "limit" applies to the collection, not to each chunk
+            remaining_docs: Optional[int] = v_col_filter.get("limit")
+
+            with Live(Group(progress)):
+                for i in range(0, len(adb_ids), chunk_size):
+                    if remaining_docs == 0:
+                        break
+
+                    adb_ids_chunk = adb_ids[i : i + chunk_size]
+                    chunk_filter = self.__merge_adb_filter(
+                        v_col_filter,
+                        "doc._id IN @vertex_ids",
+                        {"vertex_ids": adb_ids_chunk},
+                    )
+
+                    if remaining_docs is not None:
+                        chunk_filter["limit"] = remaining_docs
+
+                    v_col_cursor = self.__execute_adb_query(
+                        v_col,
+                        False,
+                        atribs,
+                        explicit_metagraph,
+                        None,
+                        chunk_filter,
+                        **adb_export_kwargs,
+                    )
+
+                    for batch in self.__iterate_adb_cursor(
+                        v_col_cursor, prefetch_depth, prefetch_max_docs
+                    ):
+                        batch = list(batch)
+                        if remaining_docs is not None:
+                            remaining_docs -= len(batch)
+
+                        self.__process_adb_vertices(
+                            batch,
+                            v_col,
+                            adb_map,
+                            nx_graph,
+                            structure_only,
+                            system_attributes,
+                        )
+
+                    progress.advance(progress_task_id, len(adb_ids_chunk))
+
+        for e_col, adb_edges in pending_e_batches:
+            self.__process_adb_edges(
+                adb_edges,
+                e_col,
+                adb_map,
+                nx_graph,
+                structure_only,
+                system_attributes,
+                e_col in restricted_e_cols,
+            )
+
+    def __process_adb_cols_checkpointed(
+        self, checkpoint_path: str, checkpoint: Json, **adb_export_kwargs: Any
+    ) -> None:
+        """ArangoDB -> NetworkX: Processes the ArangoDB collections one at a time,
+        in pages of increasing _key values, while periodically saving the state
+        of the export into a checkpoint file (removed once the export completes).
+        The collections that were already (partially) processed according to
+        **checkpoint** are resumed after their last processed _key.
+
+        :param checkpoint_path: The checkpoint file path.
+        :type checkpoint_path: str
+        :param checkpoint: The state of the export, i.e its options ("args"),
+            the NetworkX graph ("nx_graph"), the ArangoDB vertex ID to NetworkX
+            node ID map ("adb_map"), and the progress of each collection
+            ("positions").
+        :type checkpoint: Dict[str, Any]
+        :param adb_export_kwargs: Keyword arguments to override the AQL query
+            options of **checkpoint**.
+        :type adb_export_kwargs: Any
+        """
+        args: Json = checkpoint["args"]
+        metagraph: ArangoMetagraph = args["metagraph"]
+        positions: Dict[str, Json] = checkpoint["positions"]
+        adb_export_kwargs = {**args["adb_export_kwargs"], **adb_export_kwargs}
+
+        collection_filters = self.__validate_collection_filters(metagraph, {})
+
+        last_checkpoint_time = perf_counter()
+        is_processing = False
+
+        def process_adb_docs(
+            adb_docs: List[Json],
+            col: str,
+            is_edge: bool,
+            col_filter: Json,
+            position: Json,
+        ) -> None:
+            nonlocal is_processing, last_checkpoint_time
+
+            # (the hooks may modify or strip the _key of the documents)
+            last_key = adb_docs[-1]["_key"]
+
+            is_processing = True
+            self.__process_adb_batch(
+                adb_docs,
+                col,
+                is_edge,
+                checkpoint["adb_map"],
+                checkpoint["nx_graph"],
+                args["structure_only"],
+                args["system_attributes"],
+                col_filter,
+            )
+            is_processing = False
+
+            position["last_key"] = last_key
+            position["docs"] += len(adb_docs)
+
+            if perf_counter() - last_checkpoint_time >= args["checkpoint_interval"]:
+                self.__save_adb_checkpoint(checkpoint_path, checkpoint)
+                last_checkpoint_time = perf_counter()
+
+        adb_cols = [
+            (v_col, False, atribs)
+            for v_col, atribs in metagraph["vertexCollections"].items()
+        ]
+        adb_cols += [
+            (e_col, True, atribs)
+            for e_col, atribs in metagraph.get("edgeCollections", {}).items()
+        ]
+
+        try:
+            for col, is_edge, atribs in adb_cols:
+                position = positions.setdefault(
+                    col, {"last_key": None, "docs": 0, "done": False}
+                )
+
+                if position["done"]:
+                    logger.debug(f"Skipping '{col}' (already processed)")
+                    continue
+
+                logger.debug(f"Preparing '{col}' documents")
+
+                col_filter = collection_filters.get(col, {})
+                if "limit" in col_filter:
+                    limit = col_filter["limit"] - position["docs"]
+                    col_filter = {**col_filter, "limit": limit}
+
+                col_size: int = self.__db.collection(col).count()
+                adb_docs_pages = self.__page_adb_docs(
+                    col,
+                    is_edge,
+                    atribs,
+                    args["explicit_metagraph"],
+                    col_filter,
+                    args["target_batch_bytes"],
+                    args["target_batch_latency"],
+                    position["last_key"],
+                    **adb_export_kwargs,
+                )
+
+                self.__process_adb_cursor(
+                    "#FA7D05" if is_edge else "#079DE8",
+                    adb_docs_pages,
+                    max(col_size - position["docs"], 0),
+                    partial(
+                        process_adb_docs,
+                        col=col,
+                        is_edge=is_edge,
+                        col_filter=col_filter,
+                        position=position,
+                    ),
+                    col,
+                    args["prefetch_depth"],
+                    args["prefetch_max_docs"],
+                )
+
+                position["done"] = True
+        except BaseException:
+            # The nodes & edges of a partially processed batch would be
+            # duplicated when resuming, hence the previous checkpoint is kept
+            if not is_processing:
+                self.__save_adb_checkpoint(checkpoint_path, checkpoint)
+
+            raise
+
+        with suppress(FileNotFoundError):
+            os.remove(checkpoint_path)
+
+    def __save_adb_checkpoint(self, checkpoint_path: str, checkpoint: Json) -> None:
+        """ArangoDB -> NetworkX: Saves the state of a checkpointed export.
+
+        :param checkpoint_path: The checkpoint file path.
+        :type checkpoint_path: str
+        :param checkpoint: The state of the export.
+        :type checkpoint: Dict[str, Any]
+        """
+        self.__dump_pickle(checkpoint_path, checkpoint)
+
+        positions = checkpoint["positions"]
+        num_docs = sum(position["docs"] for position in positions.values())
+        logger.debug(f"Checkpointed {num_docs} documents in {checkpoint_path}")
+
+    def __sync_adb_cols(
+        self,
+        metagraph: ArangoMetagraph,
+        explicit_metagraph: bool,
+        nx_graph: NXGraph,
+        structure_only: bool,
+        system_attributes: str,
+        incremental_attribute: Optional[str],
+        prefetch_depth: int,
+        prefetch_max_docs: Optional[int],
+        **adb_export_kwargs: Any,
+    ) -> None:
+        """ArangoDB -> NetworkX: Applies the ArangoDB documents created, modified
+        or deleted since the previous sync of **nx_graph**.
 
-        bar_progress = get_bar_progress("(NX → ADB): Nodes", "#97C423")
-        bar_progress_task = bar_progress.add_task("Nodes", total=len(nx_nodes))
+        :param metagraph: An object defining vertex & edge collections to import to
+            NetworkX, along with their associated attributes to keep.
+        :type metagraph: adbnx_adapter.typings.ArangoMetagraph
+        :param explicit_metagraph: Only keep the document attributes specified in
+            **metagraph** when importing to NetworkX.
+        :type explicit_metagraph: bool
+        :param nx_graph: The NetworkX graph, holding the sync state.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param structure_only: If True, the NetworkX nodes & edges are created
+            without attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :param incremental_attribute: The watermark attribute. If None, the _rev
+            values of the documents are compared instead.
+        :type incremental_attribute: str | None
+        :param prefetch_depth: The number of batches to fetch ahead.
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents.
+        :type prefetch_max_docs: int | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        :raise ValueError: If the sync state of **nx_graph** was recorded with
+            another **incremental_attribute**, or if a collection filter cannot
+            be applied incrementally.
+        """
+        collection_filters: Dict[str, Json] = metagraph.get("collectionFilters", {})
+        for col, col_filter in collection_filters.items():
+            is_random = col_filter.get("sampling", "random") == "random"
+            if "limit" in col_filter or ("sample" in col_filter and is_random):
+                msg = f"'{col}' filter limit & random sample cannot be incremental"
+                raise ValueError(msg)
 
-        with Live(Group(bar_progress, spinner_progress)):
-            for i, (nx_id, nx_node) in enumerate(nx_nodes):
-                bar_progress.advance(bar_progress_task)
+        sync_state: Json = nx_graph.graph.setdefault("adbnx_sync", {})
+        sync_state.setdefault("attribute", incremental_attribute)
+        if sync_state["attribute"] != incremental_attribute:
+            msg = f"**nx_graph** was synced with attribute {sync_state['attribute']}"
+            raise ValueError(msg)
 
-                # 1. Process NetworkX node
-                self.__process_nx_node(
-                    i,
-                    nx_id,
-                    nx_node,
-                    nx_map,
-                    adb_docs,
-                    adb_v_cols,
-                    has_one_v_col,
-                )
+        # Maps the ArangoDB vertex IDs to NetworkX node IDs, across syncs
+        adb_map: Dict[str, NxId] = sync_state.setdefault("adb_map", {})
+        # Maps the ArangoDB edge IDs to (from node ID, to node ID, key) tuples
+        nx_edge_ids: Dict[str, Tuple[NxId, NxId, Any]] = sync_state.setdefault(
+            "edges", {}
+        )
+        # Counts the parallel ArangoDB edges collapsed into each NetworkX edge
+        # (i.e of the non-multigraph classes)
+        nx_edge_counts: Dict[Any, int] = sync_state.setdefault("edge_counts", {})
 
-                # 2. Insert batch of nodes
-                if i and i % node_batch_size == 0:
-                    self.__insert_adb_docs(
-                        spinner_progress, adb_docs, use_async, **adb_import_kwargs
+        sync_key = incremental_attribute or "_rev"
+
+        def sync_adb_docs(
+            adb_docs: List[Json],
+            col: str,
+            is_edge: bool,
+            attributes: Set[str],
+            col_filter: Json,
+            col_state: Json,
+        ) -> None:
+            revisions: Dict[str, str] = col_state["revisions"]
+
+            synced_adb_docs: List[Json] = []
+            for adb_doc in adb_docs:
+                adb_id: str = adb_doc["_id"]
+                rev: str = adb_doc["_rev"]
+                # (a missing incremental attribute is treated as null)
+                value = adb_doc.get(sync_key)
+                if explicit_metagraph:
+                    for key in {"_rev", sync_key} - attributes:
+                        adb_doc.pop(key, None)
+
+                if incremental_attribute and value is not None:
+                    watermark = col_state["watermark"]
+                    col_state["watermark"] = (
+                        value if watermark is None else max(watermark, value)
+                    )
+
+                # (e.g the unchanged documents at the watermark, fetched again)
+                if revisions.get(adb_id) == rev:
+                    continue
+
+                revisions[adb_id] = rev
+                synced_adb_docs.append(adb_doc)
+
+                # Modified documents replace their previous NetworkX node or edge
+                if is_edge:
+                    self.__remove_nx_edge(
+                        nx_graph, nx_edge_ids.pop(adb_id, None), nx_edge_counts
                     )
+                else:
+                    nx_id = adb_map.get(adb_id, adb_id)
+                    if nx_id in nx_graph:
+                        nx_graph.nodes[nx_id].clear()
+
+            adb_docs = synced_adb_docs
 
-            # Insert remaining nodes
-            self.__insert_adb_docs(
-                spinner_progress, adb_docs, use_async, **adb_import_kwargs
+            if not is_edge:
+                self.__process_adb_vertices(
+                    adb_docs, col, adb_map, nx_graph, structure_only, system_attributes
+                )
+                return
+
+            if col_filter.get("restrictToVertices", False):
+                adb_docs = self.__restrict_adb_edges(
+                    adb_docs, adb_map, nx_graph.has_node
+                )
+
+            adb_ids = [adb_e["_id"] for adb_e in adb_docs]
+            nx_edges = self.__prepare_adb_edges(adb_docs, col, adb_map)
+            self.__strip_adb_system_attributes(adb_docs, col, system_attributes)
+
+            # (only the multigraph classes return the keys of the new edges)
+            nx_keys = nx_graph.add_edges_from(
+                (from_id, to_id, {} if structure_only else nx_edge)
+                for from_id, to_id, nx_edge in nx_edges
+            ) or [None] * len(nx_edges)
+
+            for adb_id, (from_id, to_id, _), key in zip(adb_ids, nx_edges, nx_keys):
+                nx_edge_ids[adb_id] = (from_id, to_id, key)
+
+                if not nx_graph.is_multigraph():
+                    count_key = self.__get_nx_edge_count_key(nx_graph, from_id, to_id)
+                    nx_edge_counts[count_key] = nx_edge_counts.get(count_key, 0) + 1
+
+        adb_cols: List[Tuple[str, bool, Set[str]]] = [
+            (v_col, False, atribs)
+            for v_col, atribs in metagraph["vertexCollections"].items()
+        ]
+        adb_cols += [
+            (e_col, True, atribs)
+            for e_col, atribs in metagraph.get("edgeCollections", {}).items()
+        ]
+
+        col_states: Json = sync_state.setdefault("collections", {})
+
+        # The IDs of the ArangoDB edges to fetch again, by edge collection
+        refetch_adb_ids: DefaultDict[str, List[str]] = defaultdict(list)
+
+        for col, is_edge, atribs in adb_cols:
+            col_filter = collection_filters.get(col, {})
+            col_state: Json = col_states.setdefault(
+                col, {"revisions": {}, "watermark": None}
             )
 
-        ##################
-        # NetworkX Edges #
-        ##################
+            # 1. Find the deleted (& modified) ArangoDB documents
+            deleted_adb_ids, changed_adb_ids = self.__scan_adb_changes(
+                col, col_filter, col_state, incremental_attribute, **adb_export_kwargs
+            )
 
-        from_node_id: NxId
-        to_node_id: NxId
-        nx_edge: NxData
+            # 2. Remove the NetworkX nodes & edges of the deleted documents
+            removed_nx_ids: Set[NxId] = set()
+            for adb_id in deleted_adb_ids:
+                if is_edge:
+                    self.__remove_nx_edge(
+                        nx_graph, nx_edge_ids.pop(adb_id, None), nx_edge_counts
+                    )
+                else:
+                    nx_id = adb_map.pop(adb_id, adb_id)
+                    if nx_id in nx_graph:
+                        nx_graph.remove_node(nx_id)
+                        removed_nx_ids.add(nx_id)
 
-        nx_edges = nx_graph.edges(data=True)
-        edge_batch_size = batch_size or len(nx_edges)
+            # The remaining edges of the removed nodes (i.e the ArangoDB edges
+            # left dangling) are fetched again, as in a full export
+            if removed_nx_ids:
+                for adb_id, (from_id, to_id, _) in list(nx_edge_ids.items()):
+                    if from_id in removed_nx_ids or to_id in removed_nx_ids:
+                        self.__remove_nx_edge(
+                            nx_graph, nx_edge_ids.pop(adb_id), nx_edge_counts
+                        )
 
-        bar_progress = get_bar_progress("(NX → ADB): Edges", "#5E3108")
-        bar_progress_task = bar_progress.add_task("Edges", total=len(nx_edges))
+                        e_col = adb_id.split("/", 1)[0]
+                        refetch_adb_ids[e_col].append(adb_id)
+                        if e_col in col_states:
+                            col_states[e_col]["revisions"].pop(adb_id, None)
 
-        with Live(Group(bar_progress, spinner_progress)):
-            for i, (from_node_id, to_node_id, nx_edge) in enumerate(nx_edges):
-                bar_progress.advance(bar_progress_task)
+            logger.debug(f"'{col}': {len(deleted_adb_ids)} deleted documents")
 
-                # 1. Process NetworkX edge
-                self.__process_nx_edge(
-                    i,
-                    from_node_id,
-                    to_node_id,
-                    nx_edge,
-                    nx_map,
-                    adb_docs,
-                    adb_e_cols,
-                    has_one_e_col,
+            # 3. Fetch the created & modified ArangoDB documents
+            sync_filter = col_filter
+            if changed_adb_ids is not None:
+                if not changed_adb_ids:
+                    continue
+
+                sync_filter = self.__merge_adb_filter(
+                    col_filter, "doc._id IN @sync_ids", {"sync_ids": changed_adb_ids}
+                )
+            elif col_state["watermark"] is not None:
+                sync_filter = self.__merge_adb_filter(
+                    col_filter,
+                    "doc.@sync_attribute >= @sync_watermark OR doc._id IN @sync_ids",
+                    {
+                        "sync_attribute": incremental_attribute,
+                        "sync_watermark": col_state["watermark"],
+                        "sync_ids": refetch_adb_ids.get(col, []),
+                    },
                 )
 
-                # 2. Insert batch of edges
-                if i and i % edge_batch_size == 0:
-                    self.__insert_adb_docs(
-                        spinner_progress, adb_docs, use_async, **adb_import_kwargs
-                    )
+            cursor = self.__execute_adb_query(
+                col,
+                is_edge,
+                set(atribs) | {"_rev", sync_key},
+                explicit_metagraph,
+                None,
+                sync_filter,
+                **adb_export_kwargs,
+            )
 
-            # Insert remaining edges
-            self.__insert_adb_docs(
-                spinner_progress, adb_docs, use_async, **adb_import_kwargs
+            # 4. Upsert the NetworkX nodes & edges of the fetched documents
+            self.__process_adb_cursor(
+                "#FA7D05" if is_edge else "#079DE8",
+                cursor,
+                self.__db.collection(col).count()
+                if changed_adb_ids is None
+                else len(changed_adb_ids),
+                partial(
+                    sync_adb_docs,
+                    col=col,
+                    is_edge=is_edge,
+                    attributes=atribs,
+                    col_filter=col_filter,
+                    col_state=col_state,
+                ),
+                col,
+                prefetch_depth,
+                prefetch_max_docs,
             )
 
-        logger.info(f"Created ArangoDB '{name}' Graph")
-        return adb_graph
+    def __scan_adb_changes(
+        self,
+        col: str,
+        col_filter: Json,
+        col_state: Json,
+        incremental_attribute: Optional[str],
+        **adb_export_kwargs: Any,
+    ) -> Tuple[List[str], Optional[List[str]]]:
+        """ArangoDB -> NetworkX: Scans the IDs (and the _rev values, if
+        **incremental_attribute** is None) of the documents of a collection, to
+        find the documents deleted (or modified) since the previous sync.
 
-    #################################
-    # Private: ArangoDB -> NetworkX #
-    #################################
+        :param col: The ArangoDB collection.
+        :type col: str
+        :param col_filter: The (validated) metagraph **collectionFilters** entry
+            of **col**, if any.
+        :type col_filter: Dict[str, Any]
+        :param col_state: The sync state of **col**. The deleted documents are
+            removed from its revisions.
+        :type col_state: Dict[str, Any]
+        :param incremental_attribute: The watermark attribute (if any).
+        :type incremental_attribute: str | None
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        :return: The IDs of the deleted documents, along with the IDs of the
+            created & modified documents (or None if they are unknown, i.e if
+            **incremental_attribute** is specified, or on the first sync).
+        :rtype: Tuple[List[str], List[str] | None]
+        """
+        revisions: Dict[str, Any] = col_state["revisions"]
+        if not revisions:
+            return [], None
 
-    def __fetch_adb_docs(
+        cursor = self.__execute_adb_query(
+            col,
+            False,
+            set(),
+            True,
+            None,
+            col_filter,
+            "doc._id" if incremental_attribute else "[doc._id, doc._rev]",
+            **adb_export_kwargs,
+        )
+
+        scanned_adb_ids: Set[str] = set()
+        changed_adb_ids: List[str] = []
+        with get_export_spinner_progress(f"ADB Sync Scan: '{col}'") as p:
+            p.add_task(col)
+
+            scanned: Any
+            for batch in self.__iterate_adb_cursor(cursor):
+                for scanned in batch:
+                    if incremental_attribute:
+                        scanned_adb_ids.add(scanned)
+                        continue
+
+                    adb_id, rev = scanned
+                    scanned_adb_ids.add(adb_id)
+                    if revisions.get(adb_id) != rev:
+                        changed_adb_ids.append(adb_id)
+
+        deleted_adb_ids = [i for i in revisions if i not in scanned_adb_ids]
+        for adb_id in deleted_adb_ids:
+            del revisions[adb_id]
+
+        return deleted_adb_ids, None if incremental_attribute else changed_adb_ids
+
+    def __remove_nx_edge(
+        self,
+        nx_graph: NXGraph,
+        nx_edge_id: Optional[Tuple[NxId, NxId, Any]],
+        nx_edge_counts: Dict[Any, int],
+    ) -> None:
+        """ArangoDB -> NetworkX: Removes the NetworkX edge of an ArangoDB edge,
+        if it still exists. If **nx_graph** is not a multigraph, the NetworkX
+        edge is only removed along with the last ArangoDB edge collapsed into it.
+
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param nx_edge_id: The (from node ID, to node ID, key) tuple of the edge,
+            where key is None if **nx_graph** is not a multigraph.
+        :type nx_edge_id: Tuple[NxId, NxId, Any] | None
+        :param nx_edge_counts: Counts the ArangoDB edges collapsed into each
+            NetworkX edge (see `__get_nx_edge_count_key()`), if **nx_graph** is
+            not a multigraph.
+        :type nx_edge_counts: Dict[Any, int]
+        """
+        if nx_edge_id is None:
+            return
+
+        from_id, to_id, key = nx_edge_id
+        if nx_graph.is_multigraph():
+            if nx_graph.has_edge(from_id, to_id, key):
+                nx_graph.remove_edge(from_id, to_id, key)
+            return
+
+        # (a NetworkX edge synced before the counts were kept counts as one)
+        count_key = self.__get_nx_edge_count_key(nx_graph, from_id, to_id)
+        count = nx_edge_counts.pop(count_key, 1) - 1
+        if count > 0:
+            nx_edge_counts[count_key] = count
+        elif nx_graph.has_edge(from_id, to_id):
+            nx_graph.remove_edge(from_id, to_id)
+
+    def __get_nx_edge_count_key(
+        self, nx_graph: NXGraph, from_id: NxId, to_id: NxId
+    ) -> Any:
+        """ArangoDB -> NetworkX: Returns the key of a (non-multigraph) NetworkX
+        edge in the sync state edge counts, which ignores the direction of the
+        edge if **nx_graph** is undirected.
+
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param from_id: The NetworkX ID of the source node.
+        :type from_id: adbnx_adapter.typings.NxId
+        :param to_id: The NetworkX ID of the target node.
+        :type to_id: adbnx_adapter.typings.NxId
+        :return: The key of the edge.
+        :rtype: Any
+        """
+        if nx_graph.is_directed():
+            return (from_id, to_id)
+
+        return frozenset((from_id, to_id))
+
+    def __get_adb_key_ranges(
+        self, col: str, num_partitions: int
+    ) -> List[Tuple[Optional[str], Optional[str]]]:
+        """ArangoDB -> NetworkX: Splits a collection into ranges of _key of
+        about the same number of documents, so that each partition only scans
+        its own range of the primary index (instead of the entire collection).
+
+        The range bounds are looked up with one (index-only) query per bound,
+        each one resuming from the previous bound, so that the primary index is
+        only walked once overall (instead of once per bound).
+
+        :param col: The ArangoDB collection.
+        :type col: str
+        :param num_partitions: The number of partitions.
+        :type num_partitions: int
+        :return: The (inclusive start, exclusive end) _key ranges, where a None
+            bound is unbounded. There are fewer ranges than **num_partitions**
+            if the collection has fewer documents.
+        :rtype: List[Tuple[str | None, str | None]]
+        """
+        col_size = self.__db.collection(col).count()
+
+        # (a small collection yields duplicate offsets, i.e empty ranges)
+        offsets = {i * col_size // num_partitions for i in range(1, num_partitions)}
+
+        key_bounds: List[Optional[str]] = [None]
+        prev_offset = 0
+        for offset in sorted(offsets - {0}):
+            # i.e the _key at **offset**, skipping from the previous bound
+            aql_filter = ""
+            bind_vars: Json = {"@col": col, "skip": offset - prev_offset}
+            if key_bounds[-1] is not None:
+                aql_filter = "FILTER doc._key >= @key_start"
+                bind_vars["key_start"] = key_bounds[-1]
+
+            cursor: Cursor = self.__db.aql.execute(
+                f"FOR doc IN @@col {aql_filter} SORT doc._key "
+                + "LIMIT @skip, 1 RETURN doc._key",
+                bind_vars=bind_vars,
+            )
+            adb_keys = list(cursor)
+            if not adb_keys:
+                break  # (i.e the collection has shrunk since it was counted)
+
+            key_bounds.extend(adb_keys)
+            prev_offset = offset
+
+        key_bounds.append(None)
+        return list(zip(key_bounds[:-1], key_bounds[1:]))
+
+    def __enqueue_adb_docs(
         self,
+        batch_queue: "Queue[Tuple[str, int, bool, int, Optional[List[Json]]]]",
+        stop_event: Event,
         col: str,
+        partition: int,
+        key_range: Optional[Tuple[Optional[str], Optional[str]]],
         is_edge: bool,
         attributes: Set[str],
         explicit_metagraph: bool,
+        col_filter: Json,
+        aql_return_value: Optional[str] = None,
         **adb_export_kwargs: Any,
-    ) -> Tuple[Cursor, int]:
-        """ArangoDB -> NetworkX: Fetches ArangoDB documents within a collection.
+    ) -> None:
+        """ArangoDB -> NetworkX: Drains the cursor of a collection (partition)
+        into **batch_queue** (runs on a worker thread).
 
+        :param batch_queue: The queue shared with the consuming thread.
+        :type batch_queue: queue.Queue
+        :param stop_event: Set by the consuming thread to stop the fetching.
+        :type stop_event: threading.Event
         :param col: The ArangoDB collection.
         :type col: str
+        :param partition: The index of the slice of **col** to fetch.
+        :type partition: int
+        :param key_range: The (inclusive start, exclusive end) _key range of
+            the slice (see `__get_adb_key_ranges()`). If None, the entire
+            collection is fetched.
+        :type key_range: Tuple[str | None, str | None] | None
         :param is_edge: True if **col** is an edge collection.
         :type is_edge: bool
         :param attributes: The set of document attributes.
         :type attributes: Set[str]
         :param explicit_metagraph: If True, only return the set of **attributes**
             specified when fetching the documents of the collection **col**.
-            If False, all document attributes are included.
         :type explicit_metagraph: bool
+        :param col_filter: The (validated) metagraph **collectionFilters** entry
+            of **col**, if any.
+        :type col_filter: Dict[str, Any]
+        :param aql_return_value: The AQL expression to return for each document,
+            if not the document itself.
+        :type aql_return_value: str | None
         :param adb_export_kwargs: Keyword arguments to specify AQL query options when
             fetching documents from the ArangoDB instance.
         :type adb_export_kwargs: Any
-        :return: The document cursor along with the total collection size.
-        :rtype: Tuple[arango.cursor.Cursor, int]
         """
-        aql_return_value = "doc"
-        if explicit_metagraph:
-            default_keys = ["_id", "_key"]
-            default_keys += ["_from", "_to"] if is_edge else []
-            aql_return_value = f"KEEP(doc, {list(attributes) + default_keys})"
+        col_size = 0
 
-        col_size: int = self.__db.collection(col).count()
-
-        with get_export_spinner_progress(f"ADB Export: '{col}' ({col_size})") as p:
-            p.add_task(col)
+        def put(docs: Optional[List[Json]]) -> None:
+            while not stop_event.is_set():
+                try:
+                    batch_queue.put(
+                        (col, partition, is_edge, col_size, docs), timeout=0.1
+                    )
+                    return
+                except Full:
+                    continue
 
-            cursor: Cursor = self.__db.aql.execute(
-                f"FOR doc IN @@col RETURN {aql_return_value}",
-                bind_vars={"@col": col},
-                **{**adb_export_kwargs, **{"stream": True}},
+        try:
+            col_size = self.__db.collection(col).count()
+            cursor = self.__execute_adb_query(
+                col,
+                is_edge,
+                attributes,
+                explicit_metagraph,
+                key_range,
+                col_filter,
+                aql_return_value,
+                **adb_export_kwargs,
             )
 
-            return cursor, col_size
+            for batch in self.__iterate_adb_cursor(cursor):
+                if stop_event.is_set():
+                    break
+
+                put(list(batch))
+        finally:
+            put(None)
+
+    def __process_adb_batch(
+        self,
+        docs: List[Json],
+        col: str,
+        is_edge: bool,
+        adb_map: Dict[str, NxId],
+        nx_graph: NXGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        col_filter: Optional[Json] = None,
+    ) -> None:
+        """ArangoDB -> NetworkX: Processes a batch of ArangoDB documents.
+
+        :param docs: The ArangoDB documents.
+        :type docs: List[Dict[str, Any]]
+        :param col: The ArangoDB collection of **docs**.
+        :type col: str
+        :param is_edge: True if **col** is an edge collection.
+        :type is_edge: bool
+        :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
+        :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param structure_only: If True, the NetworkX nodes & edges are created
+            without attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :param col_filter: The (validated) metagraph **collectionFilters** entry
+            of **col**, if any.
+        :type col_filter: Dict[str, Any] | None
+        """
+        if is_edge:
+            self.__process_adb_edges(
+                docs,
+                col,
+                adb_map,
+                nx_graph,
+                structure_only,
+                system_attributes,
+                (col_filter or {}).get("restrictToVertices", False),
+            )
+        else:
+            self.__process_adb_vertices(
+                docs, col, adb_map, nx_graph, structure_only, system_attributes
+            )
 
     def __process_adb_cursor(
         self,
         progress_color: str,
         cursor: Cursor,
-        col_size: int,
-        process_adb_doc: Callable[..., None],
+        col_size: Optional[int],
+        process_adb_docs: Callable[[List[Json]], None],
         col: str,
-        adb_map: Dict[str, NxId],
-        nx_graph: NXMultiDiGraph,
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
     ) -> None:
         """ArangoDB -> NetworkX: Processes the ArangoDB Cursors for vertices and edges.
 
@@ -479,83 +4561,424 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         :type progress_color: str
         :param cursor: The ArangoDB cursor for the current **col**.
         :type cursor: arango.cursor.Cursor
-        :param process_adb_doc: The function to process the cursor data.
-        :type process_adb_doc: Callable
+        :param process_adb_docs: The function to process the cursor batches.
+        :type process_adb_docs: Callable[[List[Dict[str, Any]]], None]
         :param col: The ArangoDB collection for the current **cursor**.
         :type col: str
-        :param col_size: The size of **col**.
-        :type col_size: int
-        :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
-        :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
-        :param nx_graph: The NetworkX graph.
-        :type nx_graph: networkx.classes.multidigraph.MultiDiGraph
+        :param col_size: The size of **col** (or None if unknown).
+        :type col_size: int | None
+        :param prefetch_depth: The number of batches to fetch ahead.
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents.
+        :type prefetch_max_docs: int | None
         """
 
         progress = get_bar_progress(f"(ADB → NX): '{col}'", progress_color)
         progress_task_id = progress.add_task(col, total=col_size)
 
         with Live(Group(progress)):
-            while not cursor.empty():
-                for doc in cursor.batch():
-                    progress.advance(progress_task_id)
+            for batch in self.__iterate_adb_cursor(
+                cursor, prefetch_depth, prefetch_max_docs
+            ):
+                docs = list(batch)
+                progress.advance(progress_task_id, len(docs))
+
+                process_adb_docs(docs)
+
+    def __iterate_adb_cursor(
+        self,
+        cursor: Union[Cursor, Iterator[List[Json]]],
+        prefetch_depth: int = 0,
+        prefetch_max_docs: Optional[int] = None,
+    ) -> Iterator[Iterable[Json]]:
+        """ArangoDB -> NetworkX: Iterates over the batches of an ArangoDB cursor.
+
+        If **prefetch_depth** is greater than 0, the next batches are fetched
+        on a background thread while the current batch is being consumed.
+
+        :param cursor: The ArangoDB cursor, or an iterator of document batches
+            (see `__page_adb_docs()`).
+        :type cursor: arango.cursor.Cursor | Iterator[List[Dict[str, Any]]]
+        :param prefetch_depth: The number of batches to fetch ahead.
+        :type prefetch_depth: int
+        :param prefetch_max_docs: The maximum number of prefetched documents held
+            in memory at once (a single batch is always allowed through).
+        :type prefetch_max_docs: int | None
+        :return: The cursor batches.
+        :rtype: Iterator[Iterable[Dict[str, Any]]]
+        """
+        batches: Iterator[List[Json]]
+        if isinstance(cursor, Cursor):
+            if prefetch_depth == 0:
+                while not cursor.empty():
+                    yield cursor.batch()
+
+                    cursor.batch().clear()
+                    if cursor.has_more():
+                        cursor.fetch()
+
+                return
+
+            batches = self.__read_adb_cursor(cursor)
+        else:
+            batches = cursor
+            if prefetch_depth == 0:
+                yield from batches
+                return
+
+        # Stores prefetched batches, an exception raised by the prefetching
+        # thread, or None to mark the end of the cursor
+        batch_queue: Queue[Union[List[Json], BaseException, None]] = Queue(
+            maxsize=prefetch_depth
+        )
+
+        buffered_docs = 0
+        buffer_condition = Condition()
+        stop_event = Event()
+
+        def put(item: Union[List[Json], BaseException, None]) -> None:
+            while not stop_event.is_set():
+                try:
+                    batch_queue.put(item, timeout=0.1)
+                    return
+                except Full:
+                    continue
+
+        def prefetch() -> None:
+            nonlocal buffered_docs
+
+            try:
+                for docs in batches:
+                    if stop_event.is_set():
+                        break
+
+                    with buffer_condition:
+                        buffer_condition.wait_for(
+                            lambda: stop_event.is_set()
+                            or buffered_docs == 0
+                            or prefetch_max_docs is None
+                            or buffered_docs + len(docs) <= prefetch_max_docs
+                        )
+                        buffered_docs += len(docs)
+
+                    put(docs)
+            except BaseException as e:
+                put(e)
+            finally:
+                put(None)
+
+        thread = Thread(target=prefetch, daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                item = batch_queue.get()
+
+                if item is None:
+                    break
+
+                if isinstance(item, BaseException):
+                    raise item
+
+                yield item
+
+                with buffer_condition:
+                    buffered_docs -= len(item)
+                    buffer_condition.notify()
+        finally:
+            stop_event.set()
+            with buffer_condition:
+                buffer_condition.notify()
+
+            thread.join()
+
+    def __read_adb_cursor(self, cursor: Cursor) -> Iterator[List[Json]]:
+        """ArangoDB -> NetworkX: Reads the batches of an ArangoDB cursor, where
+        the next batch is only fetched once the current one has been consumed.
+
+        :param cursor: The ArangoDB cursor.
+        :type cursor: arango.cursor.Cursor
+        :return: The cursor batches.
+        :rtype: Iterator[List[Dict[str, Any]]]
+        """
+        while not cursor.empty():
+            docs = list(cursor.batch())
+            cursor.batch().clear()
+
+            yield docs
+
+            if cursor.has_more():
+                cursor.fetch()
+
+    def __process_adb_vertices(
+        self,
+        adb_vertices: List[Json],
+        v_col: str,
+        adb_map: Dict[str, NxId],
+        nx_graph: NXGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+    ) -> None:
+        """ArangoDB -> NetworkX: Processes a batch of ArangoDB vertices.
+
+        :param adb_vertices: The ArangoDB vertices.
+        :type adb_vertices: List[Dict[str, Any]]
+        :param v_col: The ArangoDB vertex collection.
+        :type v_col: str
+        :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
+        :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param structure_only: If True, the NetworkX nodes are created without
+            attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        """
+        self.__prepare_adb_vertices(adb_vertices, v_col, adb_map)
+
+        if structure_only:
+            nx_graph.add_nodes_from(adb_v["_id"] for adb_v in adb_vertices)
+            return
+
+        nx_nodes = [(adb_v["_id"], adb_v) for adb_v in adb_vertices]
+        self.__strip_adb_system_attributes(adb_vertices, v_col, system_attributes)
+        nx_graph.add_nodes_from(nx_nodes)
+
+    def __process_adb_edges(
+        self,
+        adb_edges: List[Json],
+        e_col: str,
+        adb_map: Dict[str, NxId],
+        nx_graph: NXGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        restrict_to_nodes: bool = False,
+    ) -> None:
+        """ArangoDB -> NetworkX: Processes a batch of ArangoDB edges.
+
+        :param adb_edges: The ArangoDB edges.
+        :type adb_edges: List[Dict[str, Any]]
+        :param e_col: The ArangoDB edge collection.
+        :type e_col: str
+        :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
+        :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param structure_only: If True, the NetworkX edges are created without
+            attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :param restrict_to_nodes: If True, only keep the edges whose endpoints are
+            already nodes of **nx_graph**.
+        :type restrict_to_nodes: bool
+        """
+        if restrict_to_nodes:
+            adb_edges = self.__restrict_adb_edges(adb_edges, adb_map, nx_graph.has_node)
+
+        nx_edges = self.__prepare_adb_edges(adb_edges, e_col, adb_map)
+
+        if structure_only:
+            nx_graph.add_edges_from((from_id, to_id) for from_id, to_id, _ in nx_edges)
+            return
+
+        self.__strip_adb_system_attributes(adb_edges, e_col, system_attributes)
+        nx_graph.add_edges_from(nx_edges)
+
+    def __process_adb_edge_rows(
+        self,
+        adb_edge_rows: List[List[Any]],
+        e_col: str,
+        adb_map: Dict[str, NxId],
+        nx_graph: NXGraph,
+        structure_only: bool = False,
+        system_attributes: str = "keep",
+        has_attributes: bool = False,
+        restrict_to_nodes: bool = False,
+    ) -> None:
+        """ArangoDB -> NetworkX: Processes a batch of ArangoDB edges fetched as
+        arrays (see `__build_adb_edge_row()`).
+
+        :param adb_edge_rows: The ArangoDB edge arrays.
+        :type adb_edge_rows: List[List[Any]]
+        :param e_col: The ArangoDB edge collection.
+        :type e_col: str
+        :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
+        :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
+        :param nx_graph: The NetworkX graph.
+        :type nx_graph: networkx.classes.graph.Graph
+        :param structure_only: If True, the arrays only hold the endpoints, and
+            the NetworkX edges are created without attributes.
+        :type structure_only: bool
+        :param system_attributes: How to store the ArangoDB system attributes.
+        :type system_attributes: str
+        :param has_attributes: If True, the last item of each array is the
+            object of the (explicit) edge attributes.
+        :type has_attributes: bool
+        :param restrict_to_nodes: If True, only keep the edges whose endpoints are
+            already nodes of **nx_graph**.
+        :type restrict_to_nodes: bool
+        """
+        get_nx_id = adb_map.get
+
+        if restrict_to_nodes:
+            has_node = nx_graph.has_node
+            adb_edge_rows = [
+                row
+                for row in adb_edge_rows
+                if has_node(get_nx_id(row[0], row[0]))
+                and has_node(get_nx_id(row[1], row[1]))
+            ]
+
+        if structure_only:
+            nx_graph.add_edges_from(
+                (get_nx_id(row[0], row[0]), get_nx_id(row[1], row[1]))
+                for row in adb_edge_rows
+            )
+            return
+
+        nx_edges: List[Tuple[NxId, NxId, Json]] = []
+        for row in adb_edge_rows:
+            from_id: str = row[0]
+            to_id: str = row[1]
+
+            nx_edge: Json
+            if system_attributes == "keep":
+                nx_edge = {
+                    "_id": row[2],
+                    "_key": row[3],
+                    "_from": from_id,
+                    "_to": to_id,
+                }
+            elif system_attributes == "compact":
+                nx_edge = {"_key": row[2], "_collection": e_col}
+            else:
+                nx_edge = {}
+
+            if has_attributes:
+                nx_edge.update(row[-1])
 
-                    process_adb_doc(doc, col, adb_map, nx_graph)
+            nx_edges.append(
+                (get_nx_id(from_id, from_id), get_nx_id(to_id, to_id), nx_edge)
+            )
 
-                cursor.batch().clear()
-                if cursor.has_more():
-                    cursor.fetch()
+        nx_graph.add_edges_from(nx_edges)
 
-    def __process_adb_vertex(
+    def __prepare_adb_vertices(
         self,
-        adb_v: Json,
+        adb_vertices: List[Json],
         v_col: str,
         adb_map: Dict[str, NxId],
-        nx_graph: NXMultiDiGraph,
     ) -> None:
-        """ArangoDB -> NetworkX: Processes an ArangoDB vertex.
+        """ArangoDB -> NetworkX: Runs the controller on a batch of ArangoDB
+        vertices, and records any custom NetworkX node IDs in **adb_map**.
 
-        :param adb_v: The ArangoDB vertex.
-        :type adb_v: Dict[str, Any]
+        :param adb_vertices: The ArangoDB vertices.
+        :type adb_vertices: List[Dict[str, Any]]
         :param v_col: The ArangoDB vertex collection.
         :type v_col: str
         :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
         :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
-        :param nx_graph: The NetworkX graph.
-        :type nx_graph: networkx.classes.multidigraph.MultiDiGraph
         """
-        if not self.__prepare_adb_vertex_method_is_empty:
-            adb_id: str = adb_v["_id"]
-            self.__cntrl._prepare_arangodb_vertex(adb_v, v_col)
-            nx_id: str = adb_v["_id"]
+        if self.__prepare_adb_vertex_method_is_empty:
+            return
+
+        adb_ids: List[str] = [adb_v["_id"] for adb_v in adb_vertices]
+        self.__cntrl._prepare_arangodb_vertices(adb_vertices, v_col)
+
+        for adb_id, adb_v in zip(adb_ids, adb_vertices):
+            nx_id: NxId = adb_v["_id"]
+
+            if adb_id != nx_id:
+                adb_map[adb_id] = nx_id
+
+    def __prepare_adb_edges(
+        self,
+        adb_edges: List[Json],
+        e_col: str,
+        adb_map: Dict[str, NxId],
+    ) -> List[Tuple[NxId, NxId, Json]]:
+        """ArangoDB -> NetworkX: Runs the controller on a batch of ArangoDB
+        edges, and resolves their NetworkX endpoints.
+
+        :param adb_edges: The ArangoDB edges.
+        :type adb_edges: List[Dict[str, Any]]
+        :param e_col: The ArangoDB edge collection.
+        :type e_col: str
+        :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
+        :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
+        :return: The (from node ID, to node ID, edge) tuples.
+        :rtype: List[Tuple[NxId, NxId, Dict[str, Any]]]
+        """
+        # The endpoints are resolved before the controller gets to modify the edges
+        nx_edges: List[Tuple[NxId, NxId, Json]] = []
+        for adb_e in adb_edges:
+            from_id: str = adb_e["_from"]
+            to_id: str = adb_e["_to"]
+            nx_edges.append(
+                (adb_map.get(from_id, from_id), adb_map.get(to_id, to_id), adb_e)
+            )
 
-            if adb_id != nx_id:
-                adb_map[adb_id] = nx_id
+        if not self.__prepare_adb_edge_method_is_empty:
+            self.__cntrl._prepare_arangodb_edges(adb_edges, e_col)
 
-        nx_graph.add_node(adb_v["_id"], **adb_v)
+        return nx_edges
 
-    def __process_adb_edge(
+    def __restrict_adb_edges(
         self,
-        adb_e: Json,
-        e_col: str,
+        adb_edges: List[Json],
         adb_map: Dict[str, NxId],
-        nx_graph: NXMultiDiGraph,
-    ) -> None:
-        """ArangoDB -> NetworkX: Processes an ArangoDB edge.
+        has_node: Callable[[NxId], bool],
+    ) -> List[Json]:
+        """ArangoDB -> NetworkX: Filters out the ArangoDB edges whose endpoints
+        have not been exported (e.g because of vertex collection filters).
 
-        :param adb_e: The ArangoDB edge.
-        :type adb_e: Dict[str, Any]
-        :param e_col: The ArangoDB edge collection.
-        :type e_col: str
+        :param adb_edges: The ArangoDB edges.
+        :type adb_edges: List[Dict[str, Any]]
         :param adb_map: Maps ArangoDB vertex IDs to NetworkX node IDs.
         :type adb_map: Dict[str, adbnx_adapter.typings.NxId]
-        :param nx_graph: The NetworkX graph.
-        :type nx_graph: networkx.classes.multidigraph.MultiDiGraph
+        :param has_node: Returns True if a NetworkX node ID has been exported.
+        :type has_node: Callable[[adbnx_adapter.typings.NxId], bool]
+        :return: The remaining ArangoDB edges.
+        :rtype: List[Dict[str, Any]]
+        """
+        restricted_adb_edges: List[Json] = []
+        for adb_e in adb_edges:
+            from_id: str = adb_e["_from"]
+            to_id: str = adb_e["_to"]
+            if has_node(adb_map.get(from_id, from_id)) and has_node(
+                adb_map.get(to_id, to_id)
+            ):
+                restricted_adb_edges.append(adb_e)
+
+        return restricted_adb_edges
+
+    def __strip_adb_system_attributes(
+        self, adb_docs: List[Json], col: str, system_attributes: str
+    ) -> None:
+        """ArangoDB -> NetworkX: Drops or compacts the system attributes of a
+        batch of ArangoDB documents, once their NetworkX IDs have been resolved.
+
+        :param adb_docs: The ArangoDB documents.
+        :type adb_docs: List[Dict[str, Any]]
+        :param col: The ArangoDB collection of **adb_docs**.
+        :type col: str
+        :param system_attributes: Either "keep", "drop" or "compact".
+        :type system_attributes: str
         """
-        from_node_id: NxId = adb_map.get(adb_e["_from"], adb_e["_from"])
-        to_node_id: NxId = adb_map.get(adb_e["_to"], adb_e["_to"])
+        if system_attributes == "keep":
+            return
+
+        is_compact = system_attributes == "compact"
+        for adb_doc in adb_docs:
+            for attribute in ("_id", "_rev", "_from", "_to"):
+                adb_doc.pop(attribute, None)
 
-        self.__cntrl._prepare_arangodb_edge(adb_e, e_col)
-        nx_graph.add_edge(from_node_id, to_node_id, **adb_e)
+            if is_compact:
+                adb_doc["_collection"] = col
+            else:
+                adb_doc.pop("_key", None)
 
     #################################
     # Private: NetworkX -> ArangoDB #
@@ -597,6 +5020,314 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
                 orphan_collections,
             )
 
+    def __compile_nx_routing(
+        self, param: str, routing: Optional[Json], adb_cols: List[str]
+    ) -> Optional[Tuple[str, Dict[Any, str], Optional[str]]]:
+        """NetworkX -> ArangoDB: Validates a routing specification against the
+        ArangoDB collections of the graph, and compiles it into an attribute
+        value lookup.
+
+        :param param: The routing parameter name (for error messages).
+        :type param: str
+        :param routing: The routing specification (see `networkx_to_arangodb()`).
+        :type routing: Dict[str, Any] | None
+        :param adb_cols: The ArangoDB (vertex or edge) collections of the graph.
+        :type adb_cols: List[str]
+        :return: The (attribute, mapping, default) lookup, or None if
+            **routing** is None.
+        :rtype: Tuple[str, Dict[Any, str], str | None] | None
+        :raise ValueError: If invalid **routing**.
+        """
+        if routing is None:
+            return None
+
+        if not isinstance(routing, dict) or not isinstance(
+            routing.get("attribute"), str
+        ):
+            raise ValueError(f"**{param}** must specify an 'attribute' name")
+
+        unknown_fields = routing.keys() - {"attribute", "mapping", "default"}
+        if unknown_fields:
+            raise ValueError(f"Unknown **{param}** fields: {sorted(unknown_fields)}")
+
+        mapping = routing.get("mapping")
+        if mapping is None:
+            mapping = {col: col for col in adb_cols}
+        elif not isinstance(mapping, dict):
+            raise ValueError(f"**{param}** 'mapping' must be a dictionary")
+
+        default = routing.get("default")
+        invalid_cols = [
+            col
+            for col in [*mapping.values(), default]
+            if col is not None and col not in adb_cols
+        ]
+
+        if invalid_cols:
+            msg = f"**{param}** routes to {invalid_cols}, which are not in {adb_cols}"
+            raise ValueError(msg)
+
+        return routing["attribute"], dict(mapping), default
+
+    def __route_nx_items(
+        self,
+        nx_items: List[Tuple[Any, ...]],
+        nx_router: Tuple[str, Dict[Any, str], Optional[str]],
+    ) -> List[str]:
+        """NetworkX -> ArangoDB: Looks up the ArangoDB collections of a chunk
+        of NetworkX nodes (or edges) from their routing attribute values.
+
+        :param nx_items: The NetworkX nodes (or edges), with their data.
+        :type nx_items: List[Tuple[Any, ...]]
+        :param nx_router: The compiled routing specification.
+        :type nx_router: Tuple[str, Dict[Any, str], str | None]
+        :return: The ArangoDB collection names, in the order of **nx_items**.
+        :rtype: List[str]
+        :raise ValueError: If an attribute value is unhashable, or unmapped
+            without default.
+        """
+        attribute, mapping, default = nx_router
+
+        cols: List[str] = []
+        for *nx_ids, nx_data in nx_items:
+            value = nx_data.get(attribute)
+
+            try:
+                col = mapping.get(value, default)
+            except TypeError as e:
+                msg = f"Unhashable '{attribute}' value {value!r} of NetworkX "
+                msg += self.__describe_nx_item(nx_ids)
+                raise ValueError(msg) from e
+
+            if col is None:
+                msg = f"Unmapped '{attribute}' value {value!r} of NetworkX "
+                msg += self.__describe_nx_item(nx_ids)
+                msg += ", and no default collection is specified"
+                raise ValueError(msg)
+
+            cols.append(col)
+
+        return cols
+
+    def __describe_nx_item(self, nx_ids: List[Any]) -> str:
+        """NetworkX -> ArangoDB: Describes a NetworkX node (or edge) in error
+        messages.
+
+        :param nx_ids: The NetworkX node ID (or the IDs of the edge endpoints,
+            along with the edge key of a multigraph).
+        :type nx_ids: List[Any]
+        :return: e.g "node 'a'" or "edge ('a', 'b')".
+        :rtype: str
+        """
+        if len(nx_ids) == 1:
+            return f"node {nx_ids[0]!r}"
+
+        return f"edge {tuple(nx_ids)!r}"
+
+    def __chunk_nx_items(
+        self, nx_items: Iterable[Any], batch_size: int
+    ) -> Iterator[Tuple[int, List[Any], bool]]:
+        """NetworkX -> ArangoDB: Splits the NetworkX nodes (or edges) into
+        chunks of at most __NX_CHUNK_SIZE items, which never overlap two
+        batches of **batch_size** items.
+
+        :param nx_items: The NetworkX nodes (or edges), with their data.
+        :type nx_items: Iterable[Any]
+        :param batch_size: The number of items per insertion batch.
+        :type batch_size: int
+        :return: An iterator of (index of the first item, chunk of items,
+            True if the chunk ends a batch) tuples.
+        :rtype: Iterator[Tuple[int, List[Any], bool]]
+        """
+        batch_size = max(batch_size, 1)
+        nx_iter = iter(nx_items)
+
+        i = 0
+        while True:
+            chunk_size = min(self.__NX_CHUNK_SIZE, batch_size - i % batch_size)
+            chunk = list(islice(nx_iter, chunk_size))
+            if not chunk:
+                return
+
+            yield i, chunk, (i + len(chunk)) % batch_size == 0
+            i += len(chunk)
+
+    def __process_nx_nodes(
+        self,
+        i: int,
+        nx_nodes: List[Tuple[NxId, NxData]],
+        nx_map: Dict[NxId, str],
+        adb_docs: DefaultDict[str, List[Json]],
+        adb_v_cols: List[str],
+        has_one_v_col: bool,
+        preserve_nx_graph: bool = False,
+        nx_node_router: Optional[Tuple[str, Dict[Any, str], Optional[str]]] = None,
+    ) -> None:
+        """NetworkX -> ArangoDB: Processes a chunk of NetworkX nodes. Relies on
+        the batch identify/keyify controller methods if overridden.
+
+        :param i: The index of the first node of the chunk.
+        :type i: int
+        :param nx_nodes: The (id, data) tuples of the NetworkX nodes.
+        :type nx_nodes: List[Tuple[adbnx_adapter.typings.NxId,
+            adbnx_adapter.typings.NxData]]
+        :param nx_map: Maps NetworkX node IDs to ArangoDB vertex IDs.
+        :type nx_map: Dict[adbnx_adapter.typings.NxId, str]
+        :param adb_docs: To-be-inserted ArangoDB documents.
+        :type adb_docs: DefaultDict[str, List[Dict[str, Any]]]
+        :param adb_v_cols: The ArangoDB vertex collections.
+        :type adb_v_cols: List[str]
+        :param has_one_v_col: True if the Graph has one Vertex collection.
+        :type has_one_v_col: bool
+        :param preserve_nx_graph: If True, the ArangoDB vertices are shallow
+            copies of the NetworkX nodes.
+        :type preserve_nx_graph: bool
+        :param nx_node_router: The compiled **node_routing** specification,
+            used instead of the identify controller methods if specified.
+        :type nx_node_router: Tuple[str, Dict[Any, str], str | None] | None
+        :raise ValueError: If a node is identified as an unknown collection,
+            or if the controller returns the wrong number of collections or keys.
+        """
+        if not self.__process_nx_nodes_in_batches and nx_node_router is None:
+            for j, (nx_id, nx_node) in enumerate(nx_nodes, i):
+                self.__process_nx_node(
+                    j,
+                    nx_id,
+                    nx_node,
+                    nx_map,
+                    adb_docs,
+                    adb_v_cols,
+                    has_one_v_col,
+                    preserve_nx_graph,
+                )
+
+            return
+
+        logger.debug(f"N{i}-N{i + len(nx_nodes) - 1}")
+
+        if nx_node_router is not None:
+            cols = self.__route_nx_items(nx_nodes, nx_node_router)
+        elif has_one_v_col:
+            cols = [adb_v_cols[0]] * len(nx_nodes)
+        else:
+            cols = self.__cntrl._identify_networkx_nodes(nx_nodes, adb_v_cols)
+
+        keys = self.__cntrl._keyify_networkx_nodes(i, nx_nodes, cols)
+
+        if not len(cols) == len(keys) == len(nx_nodes):
+            msg = f"Expected {len(nx_nodes)} node collections & keys, "
+            msg += f"got {len(cols)} & {len(keys)}"
+            raise ValueError(msg)
+
+        # (routed collections are validated up front)
+        is_valid = has_one_v_col or nx_node_router is not None
+        if not is_valid and not set(cols).issubset(adb_v_cols):
+            for (nx_id, _), col in zip(nx_nodes, cols):
+                if col not in adb_v_cols:
+                    msg = (
+                        f"'{nx_id}' identified as '{col}', which is not in {adb_v_cols}"
+                    )
+                    raise ValueError(msg)
+
+        for (nx_id, nx_node), col, key in zip(nx_nodes, cols, keys):
+            adb_vertex = {**nx_node} if preserve_nx_graph else nx_node
+            adb_vertex["_key"] = key
+
+            _id = f"{col}/{key}"
+            if _id != nx_id:
+                nx_map[nx_id] = _id
+
+            self.__cntrl._prepare_networkx_node(adb_vertex, col)
+            adb_docs[col].append(adb_vertex)
+
+    def __process_nx_edges(
+        self,
+        i: int,
+        nx_edges: List[Tuple[NxId, NxId, NxData]],
+        nx_map: Dict[NxId, str],
+        adb_docs: DefaultDict[str, List[Json]],
+        adb_e_cols: List[str],
+        has_one_e_col: bool,
+        preserve_nx_graph: bool = False,
+        nx_edge_router: Optional[Tuple[str, Dict[Any, str], Optional[str]]] = None,
+    ) -> None:
+        """NetworkX -> ArangoDB: Processes a chunk of NetworkX edges. Relies on
+        the batch identify/keyify controller methods if overridden.
+
+        :param i: The index of the first edge of the chunk.
+        :type i: int
+        :param nx_edges: The (from_node_id, to_node_id, data) tuples of the
+            NetworkX edges.
+        :type nx_edges: List[Tuple[adbnx_adapter.typings.NxId,
+            adbnx_adapter.typings.NxId, adbnx_adapter.typings.NxData]]
+        :param nx_map: Maps NetworkX node IDs to ArangoDB vertex IDs.
+        :type nx_map: Dict[adbnx_adapter.typings.NxId, str]
+        :param adb_docs: To-be-inserted ArangoDB documents.
+        :type adb_docs: DefaultDict[str, List[Dict[str, Any]]]
+        :param adb_e_cols: The ArangoDB edge collections.
+        :type adb_e_cols: List[str]
+        :param has_one_e_col: True if the Graph has one Edge collection.
+        :type has_one_e_col: bool
+        :param preserve_nx_graph: If True, the ArangoDB edges are shallow
+            copies of the NetworkX edges.
+        :type preserve_nx_graph: bool
+        :param nx_edge_router: The compiled **edge_routing** specification,
+            used instead of the identify controller methods if specified.
+        :type nx_edge_router: Tuple[str, Dict[Any, str], str | None] | None
+        :raise ValueError: If an edge is identified as an unknown collection,
+            or if the controller returns the wrong number of collections or keys.
+        """
+        if not self.__process_nx_edges_in_batches and nx_edge_router is None:
+            for j, (from_node_id, to_node_id, nx_edge) in enumerate(nx_edges, i):
+                self.__process_nx_edge(
+                    j,
+                    from_node_id,
+                    to_node_id,
+                    nx_edge,
+                    nx_map,
+                    adb_docs,
+                    adb_e_cols,
+                    has_one_e_col,
+                    preserve_nx_graph,
+                )
+
+            return
+
+        logger.debug(f"E{i}-E{i + len(nx_edges) - 1}")
+
+        if nx_edge_router is not None:
+            cols = self.__route_nx_items(nx_edges, nx_edge_router)
+        elif has_one_e_col:
+            cols = [adb_e_cols[0]] * len(nx_edges)
+        else:
+            cols = self.__cntrl._identify_networkx_edges(nx_edges, nx_map, adb_e_cols)
+
+        keys = self.__cntrl._keyify_networkx_edges(i, nx_edges, nx_map, cols)
+
+        if not len(cols) == len(keys) == len(nx_edges):
+            msg = f"Expected {len(nx_edges)} edge collections & keys, "
+            msg += f"got {len(cols)} & {len(keys)}"
+            raise ValueError(msg)
+
+        # (routed collections are validated up front)
+        is_valid = has_one_e_col or nx_edge_router is not None
+        if not is_valid and not set(cols).issubset(adb_e_cols):
+            for (from_node_id, to_node_id, _), col in zip(nx_edges, cols):
+                if col not in adb_e_cols:
+                    msg = f"({from_node_id}, {to_node_id}) identified as '{col}', "
+                    msg += f"which is not in {adb_e_cols}"
+                    raise ValueError(msg)
+
+        for (from_node_id, to_node_id, nx_edge), col, key in zip(nx_edges, cols, keys):
+            adb_edge = {**nx_edge} if preserve_nx_graph else nx_edge
+            adb_edge["_from"] = nx_map.get(from_node_id, from_node_id)
+            adb_edge["_to"] = nx_map.get(to_node_id, to_node_id)
+            if key:
+                adb_edge["_key"] = key
+
+            self.__cntrl._prepare_networkx_edge(adb_edge, col)
+            adb_docs[col].append(adb_edge)
+
     def __process_nx_node(
         self,
         i: int,
@@ -606,6 +5337,7 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         adb_docs: DefaultDict[str, List[Json]],
         adb_v_cols: List[str],
         has_one_v_col: bool,
+        preserve_nx_graph: bool = False,
     ) -> None:
         """NetworkX -> ArangoDB: Processes a NetworkX node.
 
@@ -623,8 +5355,12 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         :type adb_v_cols: List[str]
         :param has_one_v_col: True if the Graph has one Vertex collection.
         :type has_one_v_col: bool
+        :param preserve_nx_graph: If True, the ArangoDB vertex is a shallow copy
+            of **nx_node**, instead of **nx_node** itself.
+        :type preserve_nx_graph: bool
         """
-        logger.debug(f"N{i}: {nx_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"N{i}: {nx_id}")
 
         col = (
             adb_v_cols[0]
@@ -638,14 +5374,19 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
 
         key = self.__cntrl._keyify_networkx_node(i, nx_id, nx_node, col)
 
-        nx_node["_key"] = key
+        # The copy is required to preserve the NetworkX data: the documents are
+        # only serialized once imported (possibly by a worker thread), and the
+        # controller may modify any of their attributes, so restoring the data
+        # in place would expose the modifications in the meantime
+        adb_vertex = {**nx_node} if preserve_nx_graph else nx_node
+        adb_vertex["_key"] = key
 
         _id = f"{col}/{key}"
         if _id != nx_id:
             nx_map[nx_id] = _id
 
-        self.__cntrl._prepare_networkx_node(nx_node, col)
-        adb_docs[col].append(nx_node)
+        self.__cntrl._prepare_networkx_node(adb_vertex, col)
+        adb_docs[col].append(adb_vertex)
 
     def __process_nx_edge(
         self,
@@ -657,6 +5398,7 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         adb_docs: DefaultDict[str, List[Json]],
         adb_e_cols: List[str],
         has_one_e_col: bool,
+        preserve_nx_graph: bool = False,
     ) -> None:
         """NetworkX -> ArangoDB: Processes a NetworkX edge.
 
@@ -676,9 +5418,12 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         :type adb_e_cols: List[str]
         :param has_one_e_col: True if the Graph has one Edge collection.
         :type has_one_e_col: bool
+        :param preserve_nx_graph: If True, the ArangoDB edge is a shallow copy
+            of **nx_edge**, instead of **nx_edge** itself.
+        :type preserve_nx_graph: bool
         """
-        edge_str = f"({from_node_id}, {to_node_id})"
-        logger.debug(f"E{i}: {edge_str}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"E{i}: ({from_node_id}, {to_node_id})")
 
         col = (
             adb_e_cols[0]
@@ -693,6 +5438,7 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         )
 
         if not has_one_e_col and col not in adb_e_cols:
+            edge_str = f"({from_node_id}, {to_node_id})"
             msg = f"{edge_str} identified as '{col}', which is not in {adb_e_cols}"
             raise ValueError(msg)
 
@@ -705,19 +5451,22 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
             col,
         )
 
-        nx_edge["_from"] = nx_map.get(from_node_id, from_node_id)
-        nx_edge["_to"] = nx_map.get(to_node_id, to_node_id)
+        adb_edge = {**nx_edge} if preserve_nx_graph else nx_edge
+        adb_edge["_from"] = nx_map.get(from_node_id, from_node_id)
+        adb_edge["_to"] = nx_map.get(to_node_id, to_node_id)
         if key:
-            nx_edge["_key"] = key
+            adb_edge["_key"] = key
 
-        self.__cntrl._prepare_networkx_edge(nx_edge, col)
-        adb_docs[col].append(nx_edge)
+        self.__cntrl._prepare_networkx_edge(adb_edge, col)
+        adb_docs[col].append(adb_edge)
 
     def __insert_adb_docs(
         self,
         spinner_progress: Progress,
         adb_docs: DefaultDict[str, List[Json]],
         use_async: bool,
+        import_pool: Optional[Json] = None,
+        import_result: Optional[Json] = None,
         **adb_import_kwargs: Any,
     ) -> None:
         """NetworkX -> ArangoDB: Insert the ArangoDB documents.
@@ -728,6 +5477,14 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         :type adb_docs: DefaultDict[str, List[Json]]
         :param use_async: Performs asynchronous ArangoDB ingestion if enabled.
         :type use_async: bool
+        :param import_pool: If specified, the documents of each collection are
+            submitted to this thread pool (see `networkx_to_arangodb()`),
+            instead of being imported by the calling thread.
+        :type import_pool: Dict[str, Any] | None
+        :param import_result: If specified, the results of the imports of the
+            calling thread are combined into this dictionary (the results of
+            **import_pool** are combined into **import_pool["result"]**).
+        :type import_result: Dict[str, Any] | None
         :param adb_import_kwargs: Keyword arguments to specify additional
             parameters for ArangoDB document insertion. Full parameter list:
             https://docs.python-arango.com/en/main/specs.html#arango.collection.Collection.import_bulk
@@ -742,15 +5499,456 @@ class ADBNX_Adapter(Abstract_ADBNX_Adapter):
         adb_cols = list(adb_docs.keys())
 
         for col in adb_cols:
-            doc_list = adb_docs[col]
+            doc_list = adb_docs.pop(col)
 
-            action = f"ADB Import: '{col}' ({len(doc_list)})"
-            spinner_progress_task = spinner_progress.add_task("", action=action)
+            if import_pool is None:
+                result = self.__import_adb_docs(
+                    db, spinner_progress, col, doc_list, **adb_import_kwargs
+                )
 
-            result = db.collection(col).import_bulk(doc_list, **adb_import_kwargs)
-            logger.debug(result)
+                if import_result is not None:
+                    self.__merge_adb_import_result(import_result, result)
 
-            del adb_docs[col]
+                continue
 
-            spinner_progress.stop_task(spinner_progress_task)
-            spinner_progress.update(spinner_progress_task, visible=False)
+            # Blocks until the pool can hold another batch
+            import_pool["slots"].acquire()
+
+            try:
+                # Re-raises the error of any failed import, before submitting more
+                self.__collect_adb_import_results(import_pool, wait=False)
+
+                future: Future[Json] = import_pool["executor"].submit(
+                    self.__import_adb_docs,
+                    db,
+                    spinner_progress,
+                    col,
+                    doc_list,
+                    **adb_import_kwargs,
+                )
+            except BaseException:
+                import_pool["slots"].release()
+                raise
+
+            future.add_done_callback(lambda _: import_pool["slots"].release())
+            import_pool["futures"].append(future)
+
+    def __import_adb_docs(
+        self,
+        db: StandardDatabase,
+        spinner_progress: Progress,
+        col: str,
+        doc_list: List[Json],
+        **adb_import_kwargs: Any,
+    ) -> Json:
+        """NetworkX -> ArangoDB: Imports a batch of ArangoDB documents into a
+        collection (may run on a worker thread).
+
+        :param db: The ArangoDB database (or asynchronous execution) wrapper.
+        :type db: arango.database.StandardDatabase
+        :param spinner_progress: The spinner progress bar.
+        :type spinner_progress: rich.progress.Progress
+        :param col: The ArangoDB collection.
+        :type col: str
+        :param doc_list: The to-be-inserted ArangoDB documents.
+        :type doc_list: List[Json]
+        :param adb_import_kwargs: Keyword arguments to specify additional
+            parameters for ArangoDB document insertion.
+        :param adb_import_kwargs: Any
+        :return: The import result.
+        :rtype: Dict[str, Any]
+        """
+        action = f"ADB Import: '{col}' ({len(doc_list)})"
+        spinner_progress_task = spinner_progress.add_task("", action=action)
+
+        result = db.collection(col).import_bulk(doc_list, **adb_import_kwargs)
+        logger.debug(result)
+
+        spinner_progress.stop_task(spinner_progress_task)
+        spinner_progress.update(spinner_progress_task, visible=False)
+
+        return result if isinstance(result, dict) else {}
+
+    def __collect_adb_import_results(self, import_pool: Json, wait: bool) -> None:
+        """NetworkX -> ArangoDB: Aggregates the results of the completed imports
+        of a thread pool into **import_pool["result"]**.
+
+        :param import_pool: The import thread pool.
+        :type import_pool: Dict[str, Any]
+        :param wait: If True, waits for all pending imports. Otherwise, only
+            the completed imports are collected.
+        :type wait: bool
+        :raise arango.exceptions.DocumentInsertError: If an import failed.
+        """
+        pending_futures: List[Future[Json]] = []
+        for future in import_pool["futures"]:
+            if not wait and not future.done():
+                pending_futures.append(future)
+                continue
+
+            self.__merge_adb_import_result(import_pool["result"], future.result())
+
+        import_pool["futures"] = pending_futures
+
+    def __merge_adb_import_result(self, import_result: Json, result: Json) -> None:
+        """NetworkX -> ArangoDB: Combines the result of an import into
+        **import_result** (i.e sums the counts, and concatenates the details).
+
+        :param import_result: The combined import results.
+        :type import_result: Dict[str, Any]
+        :param result: The result of an import.
+        :type result: Dict[str, Any]
+        """
+        for key, value in result.items():
+            if isinstance(value, list):
+                import_result.setdefault(key, []).extend(value)
+            elif isinstance(value, int) and not isinstance(value, bool):
+                import_result[key] = import_result.get(key, 0) + value
+
+    ####################
+    # Private: asyncio #
+    ####################
+
+    def __get_aiohttp(self) -> Any:
+        """Imports the optional aiohttp package.
+
+        :return: The aiohttp module.
+        :rtype: module
+        :raise ImportError: If aiohttp is not installed.
+        """
+        try:
+            import aiohttp
+        except ImportError as e:  # pragma: no cover
+            msg = "The asyncio methods require aiohttp: pip install aiohttp"
+            raise ImportError(msg) from e
+
+        return aiohttp
+
+    def __get_adb_conn_async(
+        self, url: Optional[str], auth: Union[Tuple[str, str], str, None]
+    ) -> Json:
+        """Builds the database URL & the authentication headers of the
+        asyncio methods (the aiohttp session is added by the caller).
+
+        :param url: The URL of the ArangoDB host.
+        :type url: str | None
+        :param auth: The (username, password) credentials, or a JWT token.
+        :type auth: Tuple[str, str] | str | None
+        :return: The "url" & "headers" of the requests.
+        :rtype: Dict[str, Any]
+        :raise ValueError: If missing **url**.
+        :raise TypeError: If invalid **auth**.
+        """
+        if not url:
+            raise ValueError("**url** must be specified (e.g 'http://localhost:8529')")
+
+        headers: Dict[str, str] = {}
+        if isinstance(auth, tuple):
+            credentials = base64.b64encode(":".join(auth).encode()).decode()
+            headers["Authorization"] = f"Basic {credentials}"
+        elif isinstance(auth, str):
+            headers["Authorization"] = f"bearer {auth}"
+        elif auth is not None:
+            msg = "**auth** must be a (username, password) tuple or a JWT token"
+            raise TypeError(msg)
+
+        return {"url": f"{url.rstrip('/')}/_db/{self.__db.name}", "headers": headers}
+
+    def __get_adb_cursor_options(self, adb_export_kwargs: Json) -> Json:
+        """ArangoDB -> NetworkX: Converts AQL query options to the body
+        parameters of the ArangoDB cursor API.
+
+        :param adb_export_kwargs: The AQL query options.
+        :type adb_export_kwargs: Dict[str, Any]
+        :return: The cursor API body parameters (excluding the query).
+        :rtype: Dict[str, Any]
+        :raise ValueError: If an option is not supported.
+        """
+        body_keys = {"batch_size": "batchSize", "ttl": "ttl"}
+        body_keys["memory_limit"] = "memoryLimit"
+        option_keys = {"max_runtime": "maxRuntime", "fail_on_warning": "failOnWarning"}
+
+        cursor_options: Json = {"options": {"stream": True}}
+        for key, value in adb_export_kwargs.items():
+            if key in body_keys:
+                cursor_options[body_keys[key]] = value
+            elif key in option_keys:
+                cursor_options["options"][option_keys[key]] = value
+            else:
+                msg = f"Unsupported AQL query option '{key}' (expected one of "
+                msg += f"{sorted(body_keys.keys() | option_keys.keys())})"
+                raise ValueError(msg)
+
+        return cursor_options
+
+    def __get_adb_import_params(self, adb_import_kwargs: Json) -> Json:
+        """NetworkX -> ArangoDB: Converts document import options to the query
+        parameters of the ArangoDB import API.
+
+        :param adb_import_kwargs: The document import options.
+        :type adb_import_kwargs: Dict[str, Any]
+        :return: The import API query parameters (excluding the collection),
+            with the boolean options as "true" or "false".
+        :rtype: Dict[str, Any]
+        :raise ValueError: If an option is not supported.
+        """
+        param_keys = {
+            "halt_on_error": "complete",
+            "details": "details",
+            "from_prefix": "fromPrefix",
+            "to_prefix": "toPrefix",
+            "overwrite": "overwrite",
+            "on_duplicate": "onDuplicate",
+            "sync": "waitForSync",
+        }
+
+        import_params: Json = {"type": "array"}
+        for key, value in adb_import_kwargs.items():
+            if key not in param_keys:
+                msg = f"Unsupported document import option '{key}' "
+                msg += f"(expected one of {sorted(param_keys)})"
+                raise ValueError(msg)
+
+            # (aiohttp only accepts str, int & float query parameters)
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+
+            import_params[param_keys[key]] = value
+
+        return import_params
+
+    async def __gather_async(self, coroutines: Iterable[Awaitable[Any]]) -> List[Any]:
+        """Runs coroutines concurrently, and cancels the remaining ones as soon
+        as one of them fails.
+
+        :param coroutines: The coroutines.
+        :type coroutines: Iterable[Awaitable[Any]]
+        :return: The results of **coroutines**.
+        :rtype: List[Any]
+        """
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            raise
+
+    async def __send_adb_request_async(
+        self,
+        adb_conn: Json,
+        request: Request,
+        error_class: Type[ArangoServerError],
+    ) -> Json:
+        """Sends a request to the ArangoDB database of **adb_conn**.
+
+        :param adb_conn: The aiohttp session, along with the database URL &
+            the authentication headers (see `__get_adb_conn_async()`).
+        :type adb_conn: Dict[str, Any]
+        :param request: The python-arango request.
+        :type request: arango.request.Request
+        :param error_class: The python-arango error raised if the request fails.
+        :type error_class: Type[arango.exceptions.ArangoServerError]
+        :return: The deserialized response body.
+        :rtype: Dict[str, Any]
+        :raise arango.exceptions.ArangoServerError: If the request fails.
+        """
+        url = adb_conn["url"] + request.endpoint
+
+        async with adb_conn["session"].request(
+            request.method,
+            url,
+            params=request.params,
+            data=None if request.data is None else json.dumps(request.data),
+            headers={**request.headers, **adb_conn["headers"]},
+        ) as http_response:
+            raw_body = await http_response.text()
+
+        response = Response(
+            request.method,
+            url,
+            http_response.headers,
+            http_response.status,
+            http_response.reason or "",
+            raw_body,
+        )
+
+        # (the error responses of proxies may not be JSON)
+        response.body = raw_body
+        with suppress(ValueError):
+            response.body = json.loads(raw_body) if raw_body else {}
+
+        response.is_success = 200 <= response.status_code < 300
+        if not response.is_success:
+            error: Json = response.body if isinstance(response.body, dict) else {}
+            response.error_code = error.get("errorNum")
+            response.error_message = error.get("errorMessage")
+            raise error_class(response, request)
+
+        body: Json = response.body
+        return body
+
+    async def __process_adb_cursor_async(
+        self,
+        adb_conn: Json,
+        query: str,
+        bind_vars: Json,
+        cursor_options: Json,
+        process_adb_docs: Callable[[List[Json]], None],
+    ) -> None:
+        """ArangoDB -> NetworkX: Executes a stream query, and processes its
+        cursor batches as they arrive.
+
+        :param adb_conn: The aiohttp session, along with the database URL &
+            the authentication headers (see `__get_adb_conn_async()`).
+        :type adb_conn: Dict[str, Any]
+        :param query: The AQL query.
+        :type query: str
+        :param bind_vars: The bind parameters of **query**.
+        :type bind_vars: Dict[str, Any]
+        :param cursor_options: The cursor API body parameters.
+        :type cursor_options: Dict[str, Any]
+        :param process_adb_docs: The function to process the cursor batches.
+        :type process_adb_docs: Callable[[List[Dict[str, Any]]], None]
+        """
+        data = {"query": query, "bindVars": bind_vars, **cursor_options}
+        request = Request(method="post", endpoint="/_api/cursor", data=data)
+        body = await self.__send_adb_request_async(
+            adb_conn, request, AQLQueryExecuteError
+        )
+
+        try:
+            process_adb_docs(body["result"])
+
+            while body.get("hasMore", False):
+                request = Request(method="post", endpoint=f"/_api/cursor/{body['id']}")
+                body = await self.__send_adb_request_async(
+                    adb_conn, request, CursorNextError
+                )
+
+                process_adb_docs(body["result"])
+        except BaseException:
+            # Release the server-side cursor (best effort)
+            if body.get("hasMore", False):
+                request = Request(
+                    method="delete", endpoint=f"/_api/cursor/{body['id']}"
+                )
+                with suppress(ArangoServerError):
+                    await self.__send_adb_request_async(
+                        adb_conn, request, CursorCloseError
+                    )
+
+            raise
+
+    async def __create_adb_graph_async(
+        self,
+        adb_conn: Json,
+        name: str,
+        overwrite_graph: bool,
+        edge_definitions: Optional[List[Json]] = None,
+        orphan_collections: Optional[List[str]] = None,
+    ) -> Tuple[List[str], List[str]]:
+        """NetworkX -> ArangoDB: Creates the ArangoDB graph.
+
+        :param adb_conn: The aiohttp session, along with the database URL &
+            the authentication headers (see `__get_adb_conn_async()`).
+        :type adb_conn: Dict[str, Any]
+        :param name: The ArangoDB graph name.
+        :type name: str
+        :param overwrite_graph: Overwrites the graph if it already exists.
+        :type overwrite_graph: bool
+        :param edge_definitions: ArangoDB edge definitions.
+        :type edge_definitions: List[Dict[str, Any]]
+        :param orphan_collections: ArangoDB orphan collections.
+        :type orphan_collections: List[str]
+        :return: The vertex & edge collections of the ArangoDB graph.
+        :rtype: Tuple[List[str], List[str]]
+        """
+        if overwrite_graph:
+            logger.debug("Overwrite graph flag is True. Deleting old graph.")
+            request = Request(method="delete", endpoint=f"/_api/gharial/{name}")
+            try:
+                await self.__send_adb_request_async(adb_conn, request, GraphDeleteError)
+            except GraphDeleteError as e:
+                if e.http_code != 404:
+                    raise
+
+        try:
+            request = Request(method="get", endpoint=f"/_api/gharial/{name}")
+            body = await self.__send_adb_request_async(
+                adb_conn, request, GraphPropertiesError
+            )
+            logger.debug(f"Graph {name} already exists")
+        except GraphPropertiesError as e:
+            if e.http_code != 404:
+                raise
+
+            logger.debug(f"Creating graph {name}")
+            data = {
+                "name": name,
+                "edgeDefinitions": [
+                    {
+                        "collection": edge_definition["edge_collection"],
+                        "from": edge_definition["from_vertex_collections"],
+                        "to": edge_definition["to_vertex_collections"],
+                    }
+                    for edge_definition in edge_definitions or []
+                ],
+                "orphanCollections": orphan_collections or [],
+            }
+
+            request = Request(method="post", endpoint="/_api/gharial", data=data)
+            body = await self.__send_adb_request_async(
+                adb_conn, request, GraphCreateError
+            )
+
+        adb_graph: Json = body["graph"]
+        adb_v_cols = set(adb_graph["orphanCollections"])
+        adb_e_cols: List[str] = []
+        for edge_definition in adb_graph["edgeDefinitions"]:
+            adb_v_cols.update(edge_definition["from"] + edge_definition["to"])
+            adb_e_cols.append(edge_definition["collection"])
+
+        return sorted(adb_v_cols), adb_e_cols
+
+    async def __insert_adb_docs_async(
+        self,
+        adb_conn: Json,
+        adb_docs: DefaultDict[str, List[Json]],
+        import_params: Json,
+    ) -> None:
+        """NetworkX -> ArangoDB: Insert the ArangoDB documents, concurrently
+        for each collection.
+
+        :param adb_conn: The aiohttp session, along with the database URL &
+            the authentication headers (see `__get_adb_conn_async()`).
+        :type adb_conn: Dict[str, Any]
+        :param adb_docs: To-be-inserted ArangoDB documents
+        :type adb_docs: DefaultDict[str, List[Json]]
+        :param import_params: The import API query parameters.
+        :type import_params: Dict[str, Any]
+        """
+        if len(adb_docs) == 0:
+            return
+
+        requests = [
+            Request(
+                method="post",
+                endpoint="/_api/import",
+                data=doc_list,
+                params={**import_params, "collection": col},
+            )
+            for col, doc_list in adb_docs.items()
+        ]
+
+        adb_docs.clear()
+
+        results = await self.__gather_async(
+            self.__send_adb_request_async(adb_conn, request, DocumentInsertError)
+            for request in requests
+        )
+
+        for result in results:
+            logger.debug(result)
@@ -46,6 +46,45 @@ class ADBNX_Controller(Abstract_ADBNX_Controller):
         """
         pass
 
+    def _prepare_arangodb_vertices(self, adb_vertices: List[Json], col: str) -> None:
+        """Prepare a batch of ArangoDB vertices before they get inserted into the
+        NetworkX graph.
+
+        Batch variant of `_prepare_arangodb_vertex()`, called once per cursor
+        batch instead of once per vertex. Override this method instead of
+        `_prepare_arangodb_vertex()` to avoid the per-vertex method call
+        overhead. Custom NetworkX node ids can be derived by updating the "_id"
+        attribute of the vertices, in place.
+
+        NOTE: The default implementation calls `_prepare_arangodb_vertex()` on
+        every vertex of **adb_vertices**.
+
+        :param adb_vertices: The ArangoDB vertex objects to (optionally) modify.
+        :type adb_vertices: List[Dict[str, Any]]
+        :param col: The ArangoDB collection the vertices belong to.
+        :type col: str
+        """
+        for adb_vertex in adb_vertices:
+            self._prepare_arangodb_vertex(adb_vertex, col)
+
+    def _prepare_arangodb_edges(self, adb_edges: List[Json], col: str) -> None:
+        """Prepare a batch of ArangoDB edges before they get inserted into the
+        NetworkX graph.
+
+        Batch variant of `_prepare_arangodb_edge()`, called once per cursor
+        batch instead of once per edge.
+
+        NOTE: The default implementation calls `_prepare_arangodb_edge()` on
+        every edge of **adb_edges**.
+
+        :param adb_edges: The ArangoDB edge objects to (optionally) modify.
+        :type adb_edges: List[Dict[str, Any]]
+        :param col: The ArangoDB collection the edges belong to.
+        :type col: str
+        """
+        for adb_edge in adb_edges:
+            self._prepare_arangodb_edge(adb_edge, col)
+
     def _identify_networkx_node(
         self, nx_node_id: NxId, nx_node: NxData, adb_v_cols: List[str]
     ) -> str:
@@ -174,6 +213,136 @@ class ADBNX_Controller(Abstract_ADBNX_Controller):
         """
         return str(i)
 
+    def _identify_networkx_nodes(
+        self, nx_nodes: List[Tuple[NxId, NxData]], adb_v_cols: List[str]
+    ) -> List[str]:
+        """Given a chunk of NetworkX nodes, and a list of ArangoDB vertex
+        collections defined, identify which ArangoDB vertex collection each
+        node should belong to.
+
+        Batch variant of `_identify_networkx_node()`, called once per chunk
+        of nodes instead of once per node. Override this method instead of
+        `_identify_networkx_node()` to avoid the per-node method call overhead.
+
+        NOTE: The default implementation calls `_identify_networkx_node()` on
+        every node of **nx_nodes**.
+
+        :param nx_nodes: The (id, data) tuples of the NetworkX nodes.
+        :type nx_nodes: List[Tuple[adbnx_adapter.typings.NxId,
+            adbnx_adapter.typings.NxData]]
+        :param adb_v_cols: All ArangoDB vertex collections specified
+            by the **edge_definitions** parameter of networkx_to_arangodb()
+        :type adb_v_cols: List[str]
+        :return: The ArangoDB collection names, in the order of **nx_nodes**.
+        :rtype: List[str]
+        """
+        return [
+            self._identify_networkx_node(nx_node_id, nx_node, adb_v_cols)
+            for nx_node_id, nx_node in nx_nodes
+        ]
+
+    def _identify_networkx_edges(
+        self,
+        nx_edges: List[Tuple[NxId, NxId, NxData]],
+        nx_map: Dict[NxId, str],
+        adb_e_cols: List[str],
+    ) -> List[str]:
+        """Given a chunk of NetworkX edges, and a list of ArangoDB edge
+        collections defined, identify which ArangoDB edge collection each
+        edge should belong to.
+
+        Batch variant of `_identify_networkx_edge()`, called once per chunk
+        of edges instead of once per edge.
+
+        NOTE: The default implementation calls `_identify_networkx_edge()` on
+        every edge of **nx_edges**.
+
+        :param nx_edges: The (from_node_id, to_node_id, data) tuples of the
+            NetworkX edges.
+        :type nx_edges: List[Tuple[adbnx_adapter.typings.NxId,
+            adbnx_adapter.typings.NxId, adbnx_adapter.typings.NxData]]
+        :param nx_map: A mapping of NetworkX node ids to ArangoDB vertex ids.
+        :type nx_map: Dict[NxId, str]
+        :param adb_e_cols: All ArangoDB edge collections specified
+            by the **edge_definitions** parameter of
+            ADBNX_Adapter.networkx_to_arangodb()
+        :type adb_e_cols: List[str]
+        :return: The ArangoDB collection names, in the order of **nx_edges**.
+        :rtype: List[str]
+        """
+        return [
+            self._identify_networkx_edge(
+                nx_edge, from_node_id, to_node_id, nx_map, adb_e_cols
+            )
+            for from_node_id, to_node_id, nx_edge in nx_edges
+        ]
+
+    def _keyify_networkx_nodes(
+        self, i: int, nx_nodes: List[Tuple[NxId, NxData]], cols: List[str]
+    ) -> List[str]:
+        """Given a chunk of NetworkX nodes, derive their ArangoDB keys.
+
+        Batch variant of `_keyify_networkx_node()`, called once per chunk
+        of nodes instead of once per node.
+
+        NOTE: The default implementation calls `_keyify_networkx_node()` on
+        every node of **nx_nodes**.
+
+        :param i: The index of the first node of **nx_nodes** in the list of nodes.
+        :type i: int
+        :param nx_nodes: The (id, data) tuples of the NetworkX nodes.
+        :type nx_nodes: List[Tuple[adbnx_adapter.typings.NxId,
+            adbnx_adapter.typings.NxData]]
+        :param cols: The ArangoDB collections that the nodes belong to,
+            in the order of **nx_nodes**.
+        :type cols: List[str]
+        :return: Valid ArangoDB _key values, in the order of **nx_nodes**.
+        :rtype: List[str]
+        """
+        return [
+            self._keyify_networkx_node(j, nx_node_id, nx_node, col)
+            for j, ((nx_node_id, nx_node), col) in enumerate(zip(nx_nodes, cols), i)
+        ]
+
+    def _keyify_networkx_edges(
+        self,
+        i: int,
+        nx_edges: List[Tuple[NxId, NxId, NxData]],
+        nx_map: Dict[NxId, str],
+        cols: List[str],
+    ) -> List[Union[str, None]]:
+        """Given a chunk of NetworkX edges, derive their ArangoDB keys. A None
+        key results in an auto-generated key.
+
+        Batch variant of `_keyify_networkx_edge()`, called once per chunk
+        of edges instead of once per edge.
+
+        NOTE: The default implementation calls `_keyify_networkx_edge()` on
+        every edge of **nx_edges**.
+
+        :param i: The index of the first edge of **nx_edges** in the list of edges.
+        :type i: int
+        :param nx_edges: The (from_node_id, to_node_id, data) tuples of the
+            NetworkX edges.
+        :type nx_edges: List[Tuple[adbnx_adapter.typings.NxId,
+            adbnx_adapter.typings.NxId, adbnx_adapter.typings.NxData]]
+        :param nx_map: A mapping of NetworkX node ids to ArangoDB vertex ids.
+        :type nx_map: Dict[NxId, str]
+        :param cols: The ArangoDB collections that the edges belong to,
+            in the order of **nx_edges**.
+        :type cols: List[str]
+        :return: Valid ArangoDB _key values (or None), in the order of **nx_edges**.
+        :rtype: List[str | None]
+        """
+        return [
+            self._keyify_networkx_edge(
+                j, nx_edge, from_node_id, to_node_id, nx_map, col
+            )
+            for j, ((from_node_id, to_node_id, nx_edge), col) in enumerate(
+                zip(nx_edges, cols), i
+            )
+        ]
+
     def _prepare_networkx_node(self, nx_node: Json, col: str) -> None:
         """Optionally modify a NetworkX node before it gets inserted into the ArangoDB
         collection **col**.
@@ -1,9 +1,9 @@
 __all__ = ["Json", "ArangoMetagraph", "NxId", "NxData"]
 
-from typing import Any, Dict, Set, Tuple, Union
+from typing import Any, Dict, Tuple, Union
 
 Json = Dict[str, Any]
-ArangoMetagraph = Dict[str, Dict[str, Set[str]]]
+ArangoMetagraph = Dict[str, Dict[str, Any]]
 
 NxId = Union[int, float, bool, str, Tuple[Any, ...]]
 NxData = Dict[Any, Any]
@@ -4,7 +4,7 @@ import subprocess
 import urllib.request as urllib
 import zipfile
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Tuple
 
 import networkx as nx
 from arango import ArangoClient
@@ -18,6 +18,8 @@ from adbnx_adapter.typings import Json, NxData, NxId
 PROJECT_DIR = Path(__file__).parent.parent
 
 db: StandardDatabase
+db_url: str
+db_auth: Tuple[str, str]
 adbnx_adapter: ADBNX_Adapter
 imdb_adbnx_adapter: ADBNX_Adapter
 grid_adbnx_adapter: ADBNX_Adapter
@@ -46,10 +48,12 @@ def pytest_configure(config: Any) -> None:
     print("Database: " + con["dbName"])
     print("----------------------------------------")
 
-    global db
+    global db, db_url, db_auth
     db = ArangoClient(hosts=con["url"]).db(
         con["dbName"], con["username"], con["password"], verify=True
     )
+    db_url = con["url"]
+    db_auth = (con["username"], con["password"])
 
     global adbnx_adapter, imdb_adbnx_adapter, grid_adbnx_adapter, football_adbnx_adapter
     adbnx_adapter = ADBNX_Adapter(db)
@@ -140,6 +144,21 @@ class IMDB_ADBNX_Controller(ADBNX_Controller):
         return
 
 
+class Edge_Hook_IMDB_ADBNX_Controller(IMDB_ADBNX_Controller):
+    def _prepare_arangodb_edge(self, adb_edge: Json, col: str) -> None:
+        return
+
+
+class Faulty_IMDB_ADBNX_Controller(IMDB_ADBNX_Controller):
+    def __init__(self, num_edges: int) -> None:
+        self.num_edges = num_edges
+
+    def _prepare_arangodb_edge(self, adb_edge: Json, col: str) -> None:
+        self.num_edges -= 1
+        if self.num_edges == 0:
+            raise RuntimeError("Faulty edge")
+
+
 class Grid_ADBNX_Controller(ADBNX_Controller):
     def _prepare_arangodb_vertex(self, adb_vertex: Json, col: str) -> None:
         adb_vertex["_id"] = tuple(
@@ -157,9 +176,36 @@ class Grid_ADBNX_Controller(ADBNX_Controller):
         return adb_v_key
 
 
+class Batch_Grid_ADBNX_Controller(Grid_ADBNX_Controller):
+    def _keyify_networkx_nodes(
+        self, i: int, nx_nodes: List[Tuple[NxId, NxData]], cols: List[str]
+    ) -> List[str]:
+        return [f"{x}{y}" for (x, y), _ in nx_nodes]  # type: ignore
+
+
 class Football_ADBNX_Controller(ADBNX_Controller):
     def _keyify_networkx_node(
         self, i: int, nx_node_id: NxId, nx_node: NxData, col: str
     ) -> str:
         adb_v_key: str = self._string_to_arangodb_key_helper(str(nx_node_id))
         return adb_v_key
+
+
+class Hooks_ADBNX_Controller(ADBNX_Controller):
+    def _prepare_arangodb_vertex(self, adb_vertex: Json, col: str) -> None:
+        adb_vertex["_id"] = adb_vertex["_id"].replace("/", ":")
+        adb_vertex["col"] = col
+
+    def _prepare_arangodb_edge(self, adb_edge: Json, col: str) -> None:
+        adb_edge["col"] = col
+
+
+class Batch_Hooks_ADBNX_Controller(ADBNX_Controller):
+    def _prepare_arangodb_vertices(self, adb_vertices: List[Json], col: str) -> None:
+        for adb_vertex in adb_vertices:
+            adb_vertex["_id"] = adb_vertex["_id"].replace("/", ":")
+            adb_vertex["col"] = col
+
+    def _prepare_arangodb_edges(self, adb_edges: List[Json], col: str) -> None:
+        for adb_edge in adb_edges:
+            adb_edge["col"] = col
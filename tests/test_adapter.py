@@ -1,15 +1,31 @@
-from typing import Any, Dict, List, Optional, Set
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
 import pytest
+from arango.exceptions import ArangoServerError
 from arango.graph import Graph as ADBGraph
+from networkx.classes.digraph import DiGraph as NXDiGraph
 from networkx.classes.graph import Graph as NXGraph
+from networkx.classes.multidigraph import MultiDiGraph as NXMultiDiGraph
+from networkx.classes.multigraph import MultiGraph as NXMultiGraph
+from networkx.generators.ego import ego_graph
 
 from adbnx_adapter import ADBNX_Adapter, ADBNX_Controller, ADBNX_Controller_Full_Cycle
 from adbnx_adapter.typings import ArangoMetagraph, Json, NxData, NxId
 
 from .conftest import (
+    Batch_Grid_ADBNX_Controller,
+    Batch_Hooks_ADBNX_Controller,
+    Edge_Hook_IMDB_ADBNX_Controller,
+    Faulty_IMDB_ADBNX_Controller,
+    Hooks_ADBNX_Controller,
+    IMDB_ADBNX_Controller,
     adbnx_adapter,
     db,
+    db_auth,
+    db_url,
     football_adbnx_adapter,
     get_drivers_graph,
     get_football_graph,
@@ -87,6 +103,1003 @@ def test_adb_to_nx(
     assert_networkx_data(nx_g, metagraph, True)
 
 
+@pytest.mark.parametrize(
+    "adapter, name, metagraph, max_workers",
+    [
+        (
+            adbnx_adapter,
+            "fraud-detection",
+            {
+                "vertexCollections": {
+                    "account": {"Balance", "account_type", "customer_id", "rank"},
+                    "bank": {"Country", "Id", "bank_id", "bank_name"},
+                    "customer": {"Name", "Sex", "Ssn", "rank"},
+                },
+                "edgeCollections": {
+                    "accountHolder": {},
+                    "transaction": {"transaction_amt"},
+                },
+            },
+            2,
+        ),
+        (
+            imdb_adbnx_adapter,
+            "IMDBGraph",
+            {
+                "vertexCollections": {"Users": {"Age", "Gender"}, "Movies": {}},
+                "edgeCollections": {"Ratings": {"Rating"}},
+            },
+            4,
+        ),
+    ],
+)
+def test_adb_to_nx_concurrently(
+    adapter: ADBNX_Adapter,
+    name: str,
+    metagraph: ArangoMetagraph,
+    max_workers: int,
+) -> None:
+    nx_g = adapter.arangodb_to_networkx(
+        name, metagraph, max_workers=max_workers, batch_size=100
+    )
+    assert_networkx_data(nx_g, metagraph, True)
+
+    nx_g_serial = adapter.arangodb_to_networkx(name, metagraph, batch_size=100)
+    assert nx_g.number_of_nodes() == nx_g_serial.number_of_nodes()
+    assert nx_g.number_of_edges() == nx_g_serial.number_of_edges()
+
+    with pytest.raises(ValueError):
+        adapter.arangodb_to_networkx(name, metagraph, max_workers=0)
+
+
+def test_adb_to_nx_concurrently_failure() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Missing_Collection": {}},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    # A failing worker must not leave the other workers blocked
+    with pytest.raises(ArangoServerError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph", metagraph, max_workers=2, batch_size=1
+        )
+
+    metagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": {}},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    # Nor must a failing controller
+    with pytest.raises(RuntimeError):
+        ADBNX_Adapter(db, Faulty_IMDB_ADBNX_Controller(10)).arangodb_to_networkx(
+            "IMDBGraph", metagraph, max_workers=2, batch_size=1
+        )
+
+
+def test_adb_to_nx_concurrently_restricted() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"account": {"Balance"}},
+        "edgeCollections": {"accountHolder": {}, "transaction": {}},
+        "collectionFilters": {
+            "account": {"limit": 10},
+            "transaction": {"restrictToVertices": True},
+        },
+    }
+
+    # The endpoints created by 'accountHolder' must be considered
+    # by 'transaction', regardless of the order of the batches
+    nx_g_serial = adbnx_adapter.arangodb_to_networkx(
+        "fraud-detection", metagraph, batch_size=10
+    )
+    nx_g = adbnx_adapter.arangodb_to_networkx(
+        "fraud-detection", metagraph, batch_size=10, max_workers=2
+    )
+    assert set(nx_g.edges) == set(nx_g_serial.edges)
+
+
+def test_adb_to_nx_partitioned() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"account": {"Balance"}},
+        "edgeCollections": {"transaction": {"transaction_amt"}},
+    }
+
+    nx_g = adbnx_adapter.arangodb_to_networkx(
+        "fraud-detection",
+        metagraph,
+        partitions={"account": 2, "transaction": 3},
+        batch_size=50,
+    )
+    assert_networkx_data(nx_g, metagraph, True)
+    assert nx_g.number_of_nodes() == db.collection("account").count()
+    assert nx_g.number_of_edges() == db.collection("transaction").count()
+
+    # More partitions than documents only yields fewer (non-empty) key ranges
+    num_accounts = db.collection("account").count()
+    nx_g = adbnx_adapter.arangodb_to_networkx(
+        "fraud-detection",
+        metagraph,
+        partitions={"account": num_accounts + 10},
+        max_workers=4,
+    )
+    assert nx_g.number_of_nodes() == num_accounts
+
+    with pytest.raises(ValueError):
+        adbnx_adapter.arangodb_to_networkx(
+            "fraud-detection", metagraph, partitions={"transaction": 0}
+        )
+
+    with pytest.raises(ValueError):
+        adbnx_adapter.arangodb_to_networkx(
+            "fraud-detection", metagraph, partitions={"acount": 2}
+        )
+
+    # The partition bounds cannot be overridden by a collection filter
+    for bind_var in ["key_start", "key_end"]:
+        with pytest.raises(ValueError):
+            adbnx_adapter.arangodb_to_networkx(
+                "fraud-detection",
+                {
+                    **metagraph,
+                    "collectionFilters": {
+                        "account": {
+                            "filter": f"doc._key != @{bind_var}",
+                            "bindVars": {bind_var: "0"},
+                        }
+                    },
+                },
+                partitions={"account": 2},
+            )
+
+
+@pytest.mark.parametrize(
+    "prefetch_depth, prefetch_max_docs",
+    [(1, None), (3, 100), (2, 1)],
+)
+def test_adb_to_nx_prefetch(
+    prefetch_depth: int, prefetch_max_docs: Optional[int]
+) -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age", "Gender"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx(
+        "IMDBGraph",
+        metagraph,
+        prefetch_depth=prefetch_depth,
+        prefetch_max_docs=prefetch_max_docs,
+        batch_size=50,
+    )
+    assert_networkx_data(nx_g, metagraph, True)
+    assert nx_g.number_of_edges() == db.collection("Ratings").count()
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph", metagraph, prefetch_depth=-1
+        )
+
+    # Prefetching only applies when collections are fetched one at a time
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph",
+            metagraph,
+            prefetch_depth=prefetch_depth,
+            prefetch_max_docs=prefetch_max_docs,
+            max_workers=2,
+        )
+
+
+@pytest.mark.parametrize(
+    "controller", [Hooks_ADBNX_Controller(), Batch_Hooks_ADBNX_Controller()]
+)
+def test_adb_to_nx_controller_hooks(controller: ADBNX_Controller) -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": set(), "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    adapter = ADBNX_Adapter(db, controller)
+    nx_g = adapter.arangodb_to_networkx("IMDBGraph", metagraph, batch_size=100)
+
+    assert nx_g.number_of_nodes() == sum(
+        db.collection(col).count() for col in metagraph["vertexCollections"]
+    )
+    assert nx_g.number_of_edges() == db.collection("Ratings").count()
+
+    for nx_id, nx_node in nx_g.nodes(data=True):
+        assert nx_id == f"{nx_node['col']}:{nx_node['_key']}"
+        assert nx_node["col"] in metagraph["vertexCollections"]
+
+    for from_node_id, to_node_id, nx_edge in nx_g.edges(data=True):
+        assert from_node_id == nx_edge["_from"].replace("/", ":")
+        assert to_node_id == nx_edge["_to"].replace("/", ":")
+        assert nx_edge["col"] == "Ratings"
+
+
+@pytest.mark.parametrize(
+    "nx_graph_class, structure_only",
+    [
+        (NXGraph, False),
+        (NXDiGraph, True),
+        (NXMultiGraph, True),
+        (NXMultiDiGraph, True),
+    ],
+)
+def test_adb_to_nx_graph_class(
+    nx_graph_class: Type[NXGraph], structure_only: bool
+) -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age", "Gender"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx(
+        "IMDBGraph",
+        metagraph,
+        nx_graph_class=nx_graph_class,
+        structure_only=structure_only,
+        batch_size=100,
+    )
+    assert type(nx_g) is nx_graph_class
+
+    num_v = sum(db.collection(col).count() for col in metagraph["vertexCollections"])
+    assert nx_g.number_of_nodes() == num_v
+
+    num_e = db.collection("Ratings").count()
+    if nx_g.is_multigraph():
+        assert nx_g.number_of_edges() == num_e
+    else:
+        assert nx_g.number_of_edges() <= num_e
+
+    for adb_edge in db.collection("Ratings"):
+        assert nx_g.has_edge(adb_edge["_from"], adb_edge["_to"])
+
+    if structure_only:
+        assert all(nx_node == {} for _, nx_node in nx_g.nodes(data=True))
+        assert all(nx_edge == {} for *_, nx_edge in nx_g.edges(data=True))
+    else:
+        v_metagraph: ArangoMetagraph = {
+            "vertexCollections": metagraph["vertexCollections"],
+            "edgeCollections": {},
+        }
+        assert_networkx_data(nx_g, v_metagraph, True)
+
+    with pytest.raises(TypeError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph", metagraph, nx_graph_class=dict
+        )
+
+
+@pytest.mark.parametrize("system_attributes", ["drop", "compact"])
+def test_adb_to_nx_system_attributes(system_attributes: str) -> None:
+    nx_g = imdb_adbnx_adapter.arangodb_collections_to_networkx(
+        "IMDBGraph",
+        {"Users", "Movies"},
+        {"Ratings"},
+        system_attributes=system_attributes,
+        batch_size=100,
+    )
+
+    for nx_id, nx_node in nx_g.nodes(data=True):
+        assert not {"_id", "_rev"} & nx_node.keys()
+
+        if system_attributes == "compact":
+            assert nx_id == f"{nx_node['_collection']}/{nx_node['_key']}"
+        else:
+            assert "_key" not in nx_node
+
+    for *_, nx_edge in nx_g.edges(data=True):
+        assert not {"_id", "_rev", "_from", "_to"} & nx_edge.keys()
+        assert "Rating" in nx_edge
+
+        if system_attributes == "compact":
+            assert nx_edge["_collection"] == "Ratings"
+        else:
+            assert "_key" not in nx_edge
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph", {"vertexCollections": {}}, system_attributes="intern"
+        )
+
+
+def test_adb_to_nx_collection_filters() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+        "collectionFilters": {
+            "Users": {
+                "filter": "doc.Age >= @min_age",
+                "bindVars": {"min_age": 30},
+                "sample": 0.5,
+                "sampling": "hash",
+            },
+            "Movies": {"limit": 100},
+            "Ratings": {"restrictToVertices": True},
+        },
+    }
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx(
+        "IMDBGraph", metagraph, batch_size=100
+    )
+
+    users = {nx_id for nx_id in nx_g if nx_id.startswith("Users/")}
+    movies = {nx_id for nx_id in nx_g if nx_id.startswith("Movies/")}
+    assert 0 < len(users) < db.collection("Users").count()
+    assert len(movies) == 100
+    assert all(nx_g.nodes[nx_id]["Age"] >= 30 for nx_id in users)
+    assert all(u in users and v in movies for u, v in nx_g.edges())
+
+    # Hash sampling is deterministic
+    nx_g_2 = imdb_adbnx_adapter.arangodb_to_networkx(
+        "IMDBGraph", metagraph, batch_size=100, max_workers=2
+    )
+    assert users == {nx_id for nx_id in nx_g_2 if nx_id.startswith("Users/")}
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph", metagraph, partitions={"Movies": 2}
+        )
+
+    for limit in (0, -1):
+        with pytest.raises(ValueError):
+            imdb_adbnx_adapter.arangodb_to_networkx(
+                "IMDBGraph",
+                {
+                    "vertexCollections": {"Users": set()},
+                    "collectionFilters": {"Users": {"limit": limit}},
+                },
+            )
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph",
+            {
+                "vertexCollections": {"Users": set()},
+                "collectionFilters": {"Users": {"restrictToVertices": True}},
+            },
+        )
+
+
+def test_adb_to_nx_edge_aggregations() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": set(), "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+
+    aggregated_nx_g = imdb_adbnx_adapter.arangodb_to_networkx(
+        "IMDBGraph",
+        {
+            **metagraph,
+            "edgeAggregations": {
+                "Ratings": {
+                    "count": ["count"],
+                    "total": ["sum", "Rating"],
+                    "highest": ["max", "Rating"],
+                }
+            },
+        },
+        nx_graph_class=NXDiGraph,
+    )
+
+    assert aggregated_nx_g.number_of_nodes() == nx_g.number_of_nodes()
+    assert aggregated_nx_g.number_of_edges() == len(set(nx_g.edges()))
+    for from_id, to_id, edge in aggregated_nx_g.edges(data=True):
+        ratings = [e["Rating"] for e in nx_g.get_edge_data(from_id, to_id).values()]
+        assert edge == {
+            "_from": from_id,
+            "_to": to_id,
+            "count": len(ratings),
+            "total": sum(ratings),
+            "highest": max(ratings),
+        }
+
+    for edge_aggregations in [
+        {"Users": {"count": ["count"]}},
+        {"Ratings": {"median": ["median", "Rating"]}},
+        {"Ratings": {"total": ["sum"]}},
+        {"Ratings": {"_key": ["count"]}},
+    ]:
+        with pytest.raises(ValueError):
+            imdb_adbnx_adapter.arangodb_to_networkx(
+                "IMDBGraph", {**metagraph, "edgeAggregations": edge_aggregations}
+            )
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx_incremental(
+            "IMDBGraph",
+            {**metagraph, "edgeAggregations": {"Ratings": {"count": ["count"]}}},
+        )
+
+
+@pytest.mark.parametrize("incremental_attribute", [None, "sync_ts"])
+def test_adb_to_nx_incremental(incremental_attribute: Optional[str]) -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    users = db.collection("Users")
+    ratings = db.collection("Ratings")
+    user: Json = next(users.all(limit=1))
+    rating: Json = next(ratings.all(limit=1))
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx_incremental(
+        "IMDBGraph",
+        metagraph,
+        incremental_attribute=incremental_attribute,
+    )
+    assert "adbnx_sync" in nx_g.graph
+
+    try:
+        # (the other documents have no "sync_ts" attribute)
+        users.update({"_key": user["_key"], "Age": -1, "sync_ts": 1})
+        new_user = users.insert({"Age": 99, "sync_ts": 1})
+        new_rating = ratings.insert(
+            {"_from": new_user["_id"], "_to": rating["_to"], "Rating": 5, "sync_ts": 1}
+        )
+        ratings.delete(rating)
+
+        nx_g = imdb_adbnx_adapter.arangodb_to_networkx_incremental(
+            "IMDBGraph",
+            metagraph,
+            nx_graph=nx_g,
+            incremental_attribute=incremental_attribute,
+        )
+
+        assert nx_g.nodes[user["_id"]]["Age"] == -1
+        assert nx_g.nodes[new_user["_id"]]["Age"] == 99
+        assert rating["_id"] not in nx_g.graph["adbnx_sync"]["edges"]
+
+        full_nx_g = imdb_adbnx_adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+        assert dict(nx_g.nodes(data=True)) == dict(full_nx_g.nodes(data=True))
+        assert nx_g.number_of_edges() == full_nx_g.number_of_edges()
+
+        # The edge left dangling by the deleted vertex is kept
+        users.delete(new_user)
+        nx_g = imdb_adbnx_adapter.arangodb_to_networkx_incremental(
+            "IMDBGraph",
+            metagraph,
+            nx_graph=nx_g,
+            incremental_attribute=incremental_attribute,
+        )
+        assert nx_g.nodes[new_user["_id"]] == {}
+        assert new_rating["_id"] in nx_g.graph["adbnx_sync"]["edges"]
+
+        full_nx_g = imdb_adbnx_adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+        assert nx_g.number_of_edges() == full_nx_g.number_of_edges()
+
+        with pytest.raises(ValueError):
+            imdb_adbnx_adapter.arangodb_to_networkx_incremental(
+                "IMDBGraph",
+                metagraph,
+                nx_graph=nx_g,
+                incremental_attribute="other_ts",
+            )
+
+        # The options of the other entry points are not AQL query options
+        with pytest.raises(ValueError):
+            imdb_adbnx_adapter.arangodb_to_networkx(
+                "IMDBGraph", metagraph, nx_graph=nx_g, incremental=True
+            )
+
+        with pytest.raises(ValueError):
+            imdb_adbnx_adapter.arangodb_to_networkx_incremental(
+                "IMDBGraph", metagraph, nx_graph=nx_g, max_workers=2
+            )
+    finally:
+        users.replace(user)
+        ratings.insert(rating)
+        users.delete(new_user, ignore_missing=True)
+        ratings.delete(new_rating, ignore_missing=True)
+
+
+@pytest.mark.parametrize("incremental_attribute", [None, "sync_ts"])
+def test_adb_to_nx_incremental_collapsed_edges(
+    incremental_attribute: Optional[str],
+) -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": set(), "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    ratings = db.collection("Ratings")
+    rating: Json = next(ratings.all(limit=1))
+    edge = (rating["_from"], rating["_to"])
+
+    # (the other documents have no "sync_ts" attribute)
+    parallel_rating = ratings.insert({**rating, "_key": None, "sync_ts": 1})
+
+    def sync(nx_g: Optional[NXGraph] = None) -> NXGraph:
+        return imdb_adbnx_adapter.arangodb_to_networkx_incremental(
+            "IMDBGraph",
+            metagraph,
+            nx_graph=nx_g,
+            incremental_attribute=incremental_attribute,
+            nx_graph_class=NXDiGraph,
+        )
+
+    try:
+        nx_g = sync()
+
+        # The collapsed edge is only removed along with its last ArangoDB edge
+        ratings.delete(parallel_rating)
+        nx_g = sync(nx_g)
+        assert nx_g.has_edge(*edge)
+
+        # A document modified at the watermark (i.e in the same tick) is synced
+        ratings.update({"_key": rating["_key"], "Rating": -1, "sync_ts": 1})
+        nx_g = sync(nx_g)
+        assert nx_g.edges[edge]["Rating"] == -1
+
+        ratings.delete(rating["_key"])
+        nx_g = sync(nx_g)
+        assert not nx_g.has_edge(*edge)
+    finally:
+        ratings.insert(rating, overwrite=True)
+        ratings.delete(parallel_rating, ignore_missing=True)
+
+
+def test_adb_graph_to_nx_incremental() -> None:
+    nx_g = imdb_adbnx_adapter.arangodb_graph_to_networkx("imdb", incremental=True)
+    assert "adbnx_sync" in nx_g.graph
+
+    nx_g = imdb_adbnx_adapter.arangodb_graph_to_networkx("imdb", nx_g, incremental=True)
+    full_nx_g = imdb_adbnx_adapter.arangodb_graph_to_networkx("imdb")
+    assert nx_g.number_of_nodes() == full_nx_g.number_of_nodes()
+    assert nx_g.number_of_edges() == full_nx_g.number_of_edges()
+
+
+@pytest.mark.parametrize("depth, direction", [(1, "outbound"), (2, "any")])
+def test_adb_neighborhood_to_nx(depth: int, direction: str) -> None:
+    seeds = [user["_id"] for user in db.collection("Users").all(limit=3)]
+
+    nx_g = imdb_adbnx_adapter.arangodb_neighborhood_to_networkx(
+        "imdb", seeds, depth, direction, batch_size=100
+    )
+
+    full_nx_g = imdb_adbnx_adapter.arangodb_graph_to_networkx("imdb")
+    if direction == "any":
+        full_nx_g_view = full_nx_g.to_undirected(as_view=True)
+    else:
+        full_nx_g_view = full_nx_g
+
+    nx_ids: Set[NxId] = set()
+    for seed in seeds:
+        nx_ids |= set(ego_graph(full_nx_g_view, seed, depth))
+
+    assert set(nx_g.nodes) == nx_ids
+    assert nx_g.number_of_edges() == full_nx_g.subgraph(nx_ids).number_of_edges()
+    assert all(nx_g.nodes[nx_id] == full_nx_g.nodes[nx_id] for nx_id in nx_g)
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_neighborhood_to_networkx("imdb", seeds, -1)
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_neighborhood_to_networkx(
+            "imdb", seeds, direction="sideways"
+        )
+
+    for bad_seeds in ([], ["Users"], ["Invalid/1"], ["Users/missing"]):
+        with pytest.raises(ValueError):
+            imdb_adbnx_adapter.arangodb_neighborhood_to_networkx("imdb", bad_seeds)
+
+
+def test_adb_to_nx_edge_driven() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+        "collectionFilters": {"Ratings": {"limit": 50}},
+    }
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx_edge_driven(
+        "IMDBGraph", metagraph, batch_size=10
+    )
+    full_nx_g = imdb_adbnx_adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+
+    referenced_nx_ids = {nx_id for edge in full_nx_g.edges() for nx_id in edge}
+    assert set(nx_g.nodes) == referenced_nx_ids
+    assert nx_g.number_of_edges() == 50
+    assert all(nx_g.nodes[nx_id] == full_nx_g.nodes[nx_id] for nx_id in nx_g)
+
+    # The vertex "limit" spans all chunks of referenced vertices
+    metagraph["collectionFilters"]["Users"] = {"limit": 5}
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx_edge_driven(
+        "IMDBGraph", metagraph, batch_size=2
+    )
+    assert sum(1 for _, data in nx_g.nodes(data="Age") if data is not None) == 5
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx_edge_driven(
+            "IMDBGraph", metagraph, max_workers=2
+        )
+
+
+def test_adb_to_nx_cache(tmp_path: Path) -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    adapter = ADBNX_Adapter(db, IMDB_ADBNX_Controller(), cache_dir=str(tmp_path))
+    nx_g = adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    cached_nx_g = adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+    assert dict(cached_nx_g.nodes(data=True)) == dict(nx_g.nodes(data=True))
+    assert cached_nx_g.number_of_edges() == nx_g.number_of_edges()
+
+    # A cache hit is not estimated, but the options are still validated
+    cached_nx_g = adapter.arangodb_to_networkx("IMDBGraph", metagraph, memory_budget=1)
+    assert cached_nx_g.number_of_nodes() == nx_g.number_of_nodes()
+
+    with pytest.raises(ValueError):
+        adapter.arangodb_to_networkx("IMDBGraph", metagraph, prefetch_depth=-1)
+
+    # A different export option is a cache miss
+    adapter.arangodb_to_networkx("IMDBGraph", metagraph, structure_only=True)
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+    # A random sample is never cached
+    sample_metagraph: ArangoMetagraph = {
+        **metagraph,
+        "collectionFilters": {"Ratings": {"sample": 0.5}},
+    }
+    adapter.arangodb_to_networkx("IMDBGraph", sample_metagraph)
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+    # A modified collection is a cache miss
+    users = db.collection("Users")
+    user: Json = next(users.all(limit=1))
+    users.update({"_key": user["_key"], "Age": -1})
+    try:
+        nx_g = adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+        assert nx_g.nodes[user["_id"]]["Age"] == -1
+        assert len(list(tmp_path.glob("*.pickle"))) == 3
+    finally:
+        users.replace(user)
+
+    adapter = ADBNX_Adapter(db, cache_dir=str(tmp_path), cache_max_bytes=1)
+    adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    # Concurrent cache misses of the same export write distinct temporary files
+    adapter = ADBNX_Adapter(db, cache_dir=str(tmp_path / "concurrent"))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        nx_graphs = list(
+            executor.map(
+                lambda _: adapter.arangodb_to_networkx("IMDBGraph", metagraph),
+                range(4),
+            )
+        )
+
+    assert {nx_g.number_of_edges() for nx_g in nx_graphs} == {
+        nx_graphs[0].number_of_edges()
+    }
+    assert len(list((tmp_path / "concurrent").glob("*.pickle"))) == 1
+    assert not list((tmp_path / "concurrent").glob("*.tmp"))
+
+    with pytest.raises(ValueError):
+        ADBNX_Adapter(db, cache_dir=str(tmp_path), cache_max_bytes=0)
+
+
+def test_estimate_export() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+        "collectionFilters": {"Ratings": {"limit": 10}},
+    }
+
+    estimate = imdb_adbnx_adapter.estimate_export(metagraph, sample_size=10)
+    assert set(estimate["collections"]) == {"Users", "Movies", "Ratings"}
+    assert (
+        estimate["collections"]["Users"]["documents"] == db.collection("Users").count()
+    )
+    assert estimate["collections"]["Ratings"]["documents"] == 10
+    assert estimate["documents"] == sum(
+        col["documents"] for col in estimate["collections"].values()
+    )
+    assert estimate["transfer_bytes"] > 0
+    assert estimate["memory_bytes"] > 0
+    assert estimate["duration"] > 0
+
+    structure_estimate = imdb_adbnx_adapter.estimate_export(
+        metagraph, structure_only=True, sample_size=10
+    )
+    assert structure_estimate["documents"] == estimate["documents"]
+    assert structure_estimate["transfer_bytes"] < estimate["transfer_bytes"]
+
+    # The aggregated edges are counted once per (_from, _to) pair
+    aggregated_estimate = imdb_adbnx_adapter.estimate_export(
+        {
+            "vertexCollections": {"Users": set(), "Movies": set()},
+            "edgeCollections": {"Ratings": set()},
+            "edgeAggregations": {"Ratings": {"count": ["count"]}},
+        },
+        sample_size=10,
+    )
+    ratings = db.collection("Ratings").all()
+    assert aggregated_estimate["collections"]["Ratings"]["documents"] == len(
+        {(rating["_from"], rating["_to"]) for rating in ratings}
+    )
+
+    with pytest.raises(MemoryError):
+        imdb_adbnx_adapter.arangodb_to_networkx("IMDBGraph", metagraph, memory_budget=1)
+
+    # The options are validated before the estimate
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph", metagraph, memory_budget=1, system_attributes="all"
+        )
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx(
+        "IMDBGraph", metagraph, memory_budget=estimate["memory_bytes"] * 10
+    )
+    assert nx_g.number_of_edges() == 10
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.estimate_export(metagraph, sample_size=0)
+
+
+def test_adb_to_nx_async() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+
+    async def export_concurrently() -> List[NXGraph]:
+        return list(
+            await asyncio.gather(
+                *(
+                    imdb_adbnx_adapter.arangodb_to_networkx_async(
+                        "IMDBGraph", metagraph, url=db_url, auth=db_auth, batch_size=100
+                    )
+                    for _ in range(3)
+                )
+            )
+        )
+
+    for async_nx_g in asyncio.run(export_concurrently()):
+        assert dict(async_nx_g.nodes(data=True)) == dict(nx_g.nodes(data=True))
+        assert async_nx_g.number_of_edges() == nx_g.number_of_edges()
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            imdb_adbnx_adapter.arangodb_to_networkx_async(
+                "IMDBGraph", metagraph, url=db_url, auth=db_auth, stream=False
+            )
+        )
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            imdb_adbnx_adapter.arangodb_to_networkx_async("IMDBGraph", metagraph)
+        )
+
+    with pytest.raises(TypeError):
+        asyncio.run(
+            imdb_adbnx_adapter.arangodb_to_networkx_async(
+                "IMDBGraph", metagraph, url=db_url, auth=["root", ""]  # type: ignore
+            )
+        )
+
+
+def test_adb_to_nx_stream() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx(
+        "IMDBGraph", metagraph, batch_size=100
+    )
+
+    streamed_nx_g = NXMultiDiGraph()
+    for col, is_edge, batch in imdb_adbnx_adapter.arangodb_to_networkx_stream(
+        "IMDBGraph", metagraph, batch_size=100
+    ):
+        assert is_edge is (col == "Ratings")
+        assert len(batch) <= 100
+
+        if is_edge:
+            streamed_nx_g.add_edges_from(batch)
+        else:
+            streamed_nx_g.add_nodes_from(batch)
+
+    assert dict(streamed_nx_g.nodes(data=True)) == dict(nx_g.nodes(data=True))
+    assert streamed_nx_g.number_of_edges() == nx_g.number_of_edges()
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx_stream(
+            "IMDBGraph", metagraph, system_attributes="invalid"
+        )
+
+
+@pytest.mark.parametrize(
+    "target_batch_bytes, target_batch_latency",
+    [(10000, None), (None, 0.05), (1000, 0.5)],
+)
+def test_adb_to_nx_adaptive_batch_size(
+    target_batch_bytes: Optional[int], target_batch_latency: Optional[float]
+) -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+    adaptive_nx_g = imdb_adbnx_adapter.arangodb_to_networkx(
+        "IMDBGraph",
+        metagraph,
+        target_batch_bytes=target_batch_bytes,
+        target_batch_latency=target_batch_latency,
+        batch_size=10,
+    )
+
+    assert dict(adaptive_nx_g.nodes(data=True)) == dict(nx_g.nodes(data=True))
+    assert adaptive_nx_g.number_of_edges() == nx_g.number_of_edges()
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph", metagraph, target_batch_bytes=0
+        )
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx(
+            "IMDBGraph", metagraph, target_batch_bytes=1000, max_workers=2
+        )
+
+
+def test_adb_to_nx_checkpoint(tmp_path: Path) -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx("IMDBGraph", metagraph)
+    checkpoint_path = tmp_path / "IMDBGraph.pickle"
+
+    adapter = ADBNX_Adapter(db, Faulty_IMDB_ADBNX_Controller(num_edges=1000))
+    with pytest.raises(RuntimeError):
+        adapter.arangodb_to_networkx_checkpointed(
+            "IMDBGraph",
+            metagraph,
+            str(checkpoint_path),
+            checkpoint_interval=1e-6,
+            batch_size=100,
+        )
+
+    assert checkpoint_path.exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+    with pytest.raises(ValueError):
+        adapter.arangodb_to_networkx_checkpointed(
+            "IMDBGraph", metagraph, str(checkpoint_path)
+        )
+
+    resumed_nx_g = adapter.resume_arangodb_to_networkx(str(checkpoint_path))
+    assert not checkpoint_path.exists()
+    assert dict(resumed_nx_g.nodes(data=True)) == dict(nx_g.nodes(data=True))
+    assert resumed_nx_g.number_of_edges() == nx_g.number_of_edges()
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx_checkpointed(
+            "IMDBGraph", metagraph, str(checkpoint_path), max_workers=2
+        )
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx_checkpointed(
+            "IMDBGraph",
+            {**metagraph, "edgeAggregations": {"Ratings": {"count": ["count"]}}},
+            str(checkpoint_path),
+        )
+
+    with pytest.raises(ValueError):
+        imdb_adbnx_adapter.arangodb_to_networkx_checkpointed(
+            "IMDBGraph", metagraph, str(checkpoint_path), checkpoint_interval=0
+        )
+
+
+@pytest.mark.parametrize(
+    "structure_only, system_attributes, max_workers",
+    [
+        (False, "keep", None),
+        (False, "drop", None),
+        (False, "compact", 2),
+        (True, "keep", None),
+    ],
+)
+def test_adb_to_nx_edge_rows(
+    structure_only: bool, system_attributes: str, max_workers: Optional[int]
+) -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": set(), "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    # The edges are fetched as arrays, unless there is an edge controller hook
+    nx_g, doc_nx_g = (
+        ADBNX_Adapter(db, cntrl).arangodb_to_networkx(
+            "IMDBGraph",
+            metagraph,
+            structure_only=structure_only,
+            system_attributes=system_attributes,
+            max_workers=max_workers,
+        )
+        for cntrl in [IMDB_ADBNX_Controller(), Edge_Hook_IMDB_ADBNX_Controller()]
+    )
+
+    assert dict(nx_g.nodes(data=True)) == dict(doc_nx_g.nodes(data=True))
+    assert nx_g.number_of_edges() == doc_nx_g.number_of_edges()
+    for from_id, to_id, key, nx_edge in nx_g.edges(keys=True, data=True):
+        assert nx_edge == doc_nx_g.edges[from_id, to_id, key]
+
+
+def test_adb_to_csr() -> None:
+    metagraph: ArangoMetagraph = {
+        "vertexCollections": {"Users": {"Age"}, "Movies": set()},
+        "edgeCollections": {"Ratings": {"Rating"}},
+    }
+
+    csr = imdb_adbnx_adapter.arangodb_to_csr("IMDBGraph", metagraph, batch_size=100)
+    nx_g = imdb_adbnx_adapter.arangodb_to_networkx(
+        "IMDBGraph", metagraph, batch_size=100
+    )
+
+    num_nodes = nx_g.number_of_nodes()
+    num_edges = nx_g.number_of_edges()
+    assert len(csr["node_ids"]) == len(csr["node_index"]) == num_nodes
+    assert len(csr["indptr"]) == num_nodes + 1
+    assert len(csr["indices"]) == csr["indptr"][-1] == num_edges
+    assert len(csr["node_attributes"]["Age"]) == num_nodes
+    assert len(csr["edge_attributes"]["Rating"]) == num_edges
+
+    node_ids = csr["node_ids"]
+    for i, nx_id in enumerate(node_ids):
+        assert csr["node_index"][nx_id] == i
+        assert nx_g.out_degree(nx_id) == csr["indptr"][i + 1] - csr["indptr"][i]
+
+        for j in range(csr["indptr"][i], csr["indptr"][i + 1]):
+            nx_edges = nx_g.get_edge_data(nx_id, node_ids[csr["indices"][j]])
+            ratings = [nx_edge["Rating"] for nx_edge in nx_edges.values()]
+            assert csr["edge_attributes"]["Rating"][j] in ratings
+
+    # The aggregated edges only have their aggregations as columns
+    csr = imdb_adbnx_adapter.arangodb_to_csr(
+        "IMDBGraph",
+        {**metagraph, "edgeAggregations": {"Ratings": {"count": ["count"]}}},
+    )
+    assert set(csr["edge_attributes"]) == {"count"}
+    assert len(csr["indices"]) == len(set(nx_g.edges()))
+    assert csr["edge_attributes"]["count"].sum() == num_edges
+
+    # List-valued attributes (equal-length or ragged) are 1-D object columns
+    users = db.collection("Users")
+    user_a, user_b = list(users.all(limit=2))
+    users.update({"_key": user_a["_key"], "Tags": ["a", "b"]})
+    users.update({"_key": user_b["_key"], "Tags": ["c", "d"]})
+    try:
+        csr = imdb_adbnx_adapter.arangodb_to_csr(
+            "IMDBGraph", {"vertexCollections": {"Users": {"Tags"}}}
+        )
+        tags = csr["node_attributes"]["Tags"]
+        assert tags.shape == (len(csr["node_ids"]),)
+        assert tags[csr["node_index"][user_a["_id"]]] == ["a", "b"]
+
+        users.update({"_key": user_b["_key"], "Tags": ["c"]})
+        csr = imdb_adbnx_adapter.arangodb_to_csr(
+            "IMDBGraph", {"vertexCollections": {"Users": {"Tags"}}}
+        )
+        assert csr["node_attributes"]["Tags"][csr["node_index"][user_b["_id"]]] == ["c"]
+    finally:
+        users.replace(user_a)
+        users.replace(user_b)
+
+
 @pytest.mark.parametrize(
     "adapter, name, v_cols, e_cols",
     [
@@ -222,6 +1235,242 @@ def test_nx_to_adb(
     assert_arangodb_data(adapter, nx_g, adb_g)
 
 
+def test_nx_to_adb_async() -> None:
+    nx_g = get_grid_graph(5)
+    edge_definitions = [
+        {
+            "edge_collection": "to_v3",
+            "from_vertex_collections": ["Grid_Node_v3"],
+            "to_vertex_collections": ["Grid_Node_v3"],
+        }
+    ]
+
+    adb_g = asyncio.run(
+        grid_adbnx_adapter.networkx_to_arangodb_async(
+            "Grid_v3",
+            nx_g,
+            edge_definitions,
+            overwrite_graph=True,
+            batch_size=10,
+            url=db_url,
+            auth=db_auth,
+            on_duplicate="replace",
+        )
+    )
+    assert_arangodb_data(grid_adbnx_adapter, nx_g, adb_g)
+
+    # The boolean import options are sent as query parameters
+    adb_g = asyncio.run(
+        grid_adbnx_adapter.networkx_to_arangodb_async(
+            "Grid_v3",
+            nx_g,
+            batch_size=10,
+            url=db_url,
+            auth=db_auth,
+            on_duplicate="update",
+            overwrite=False,
+            halt_on_error=True,
+            details=True,
+        )
+    )
+    assert_arangodb_data(grid_adbnx_adapter, nx_g, adb_g)
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            grid_adbnx_adapter.networkx_to_arangodb_async(
+                "Grid_v3", nx_g, url=db_url, auth=db_auth, use_async=True
+            )
+        )
+
+    with pytest.raises(ValueError):
+        asyncio.run(grid_adbnx_adapter.networkx_to_arangodb_async("Grid_v3", nx_g))
+
+    db.delete_graph("Grid_v3", drop_collections=True)
+
+
+@pytest.mark.parametrize("max_workers, queue_depth", [(4, 2), (None, 1)])
+def test_nx_to_adb_import_pool(
+    max_workers: Optional[int], queue_depth: Optional[int]
+) -> None:
+    nx_g = get_grid_graph(10)
+    edge_definitions = [
+        {
+            "edge_collection": "to_v4",
+            "from_vertex_collections": ["Grid_Node_v4"],
+            "to_vertex_collections": ["Grid_Node_v4"],
+        }
+    ]
+
+    adb_g = grid_adbnx_adapter.networkx_to_arangodb(
+        "Grid_v4",
+        nx_g,
+        edge_definitions,
+        overwrite_graph=True,
+        batch_size=10,
+        max_workers=max_workers,
+        queue_depth=queue_depth,
+        on_duplicate="replace",
+    )
+    assert_arangodb_data(grid_adbnx_adapter, nx_g, adb_g)
+
+    # The partial failures of the imports are reported in the combined result
+    import_result: Dict[str, Any] = {}
+    grid_adbnx_adapter.networkx_to_arangodb(
+        "Grid_v4",
+        nx_g,
+        batch_size=10,
+        max_workers=max_workers,
+        queue_depth=queue_depth,
+        import_result=import_result,
+        on_duplicate="error",
+        halt_on_error=False,
+        details=True,
+    )
+    num_docs = nx_g.number_of_nodes() + nx_g.number_of_edges()
+    assert import_result["created"] + import_result["errors"] == num_docs
+    assert import_result["errors"] >= nx_g.number_of_nodes()
+    assert len(import_result["details"]) == import_result["errors"]
+
+    invalid_kwargs: List[Dict[str, Any]] = [
+        {"max_workers": 0},
+        {"max_workers": 2, "queue_depth": -1},
+        {"queue_depth": 1, "use_async": True},
+        {"max_workers": 2, "use_async": True},
+    ]
+    for kwargs in invalid_kwargs:
+        with pytest.raises(ValueError):
+            grid_adbnx_adapter.networkx_to_arangodb("Grid_v4", nx_g, **kwargs)
+
+    db.delete_graph("Grid_v4", drop_collections=True)
+
+
+def test_nx_to_adb_preserve_nx_graph() -> None:
+    nx_g = get_grid_graph(5)
+    for nx_id, nx_node in nx_g.nodes(data=True):
+        nx_node["x"] = nx_id[0]
+
+    edge_definitions = [
+        {
+            "edge_collection": "to_v5",
+            "from_vertex_collections": ["Grid_Node_v5"],
+            "to_vertex_collections": ["Grid_Node_v5"],
+        }
+    ]
+
+    adb_g = grid_adbnx_adapter.networkx_to_arangodb(
+        "Grid_v5",
+        nx_g,
+        edge_definitions,
+        overwrite_graph=True,
+        batch_size=10,
+        preserve_nx_graph=True,
+    )
+    assert_arangodb_data(grid_adbnx_adapter, nx_g, adb_g)
+
+    assert all(nx_node.keys() == {"x"} for _, nx_node in nx_g.nodes(data=True))
+    assert all(nx_edge == {} for *_, nx_edge in nx_g.edges(data=True))
+
+    db.delete_graph("Grid_v5", drop_collections=True)
+
+
+def test_nx_to_adb_batch_hooks() -> None:
+    nx_g = get_grid_graph(5)
+    edge_definitions = [
+        {
+            "edge_collection": "to_v6",
+            "from_vertex_collections": ["Grid_Node_v6"],
+            "to_vertex_collections": ["Grid_Node_v6"],
+        }
+    ]
+
+    adapter = ADBNX_Adapter(db, Batch_Grid_ADBNX_Controller())
+    adb_g = adapter.networkx_to_arangodb(
+        "Grid_v6", nx_g, edge_definitions, overwrite_graph=True, batch_size=10
+    )
+    assert_arangodb_data(grid_adbnx_adapter, nx_g, adb_g)
+    assert db.collection("Grid_Node_v6").has("12")
+
+    class Invalid_ADBNX_Controller(Batch_Grid_ADBNX_Controller):
+        def _identify_networkx_nodes(
+            self, nx_nodes: List[Tuple[NxId, NxData]], adb_v_cols: List[str]
+        ) -> List[str]:
+            return ["Invalid"] * len(nx_nodes)
+
+    edge_definitions.append(
+        {
+            "edge_collection": "from_v6",
+            "from_vertex_collections": ["Other_Grid_Node_v6"],
+            "to_vertex_collections": ["Grid_Node_v6"],
+        }
+    )
+
+    with pytest.raises(ValueError):
+        ADBNX_Adapter(db, Invalid_ADBNX_Controller()).networkx_to_arangodb(
+            "Grid_v6", nx_g, edge_definitions, overwrite_graph=True
+        )
+
+    db.delete_graph("Grid_v6", drop_collections=True)
+
+
+def test_nx_to_adb_routing() -> None:
+    db.delete_graph("Drivers", ignore_missing=True, drop_collections=True)
+
+    nx_g = get_drivers_graph()
+    for nx_id, nx_node in nx_g.nodes(data=True):
+        nx_node["type"] = nx_id.split("-")[0]
+
+    nx_g.edges["P-John", "C-BMW"]["relation"] = "owns"
+
+    e_d = [
+        {
+            "edge_collection": "drives",
+            "from_vertex_collections": ["Person"],
+            "to_vertex_collections": ["Car"],
+        },
+        {
+            "edge_collection": "owns",
+            "from_vertex_collections": ["Person"],
+            "to_vertex_collections": ["Car"],
+        },
+    ]
+
+    node_routing = {"attribute": "type", "mapping": {"P": "Person", "C": "Car"}}
+    edge_routing = {"attribute": "relation", "default": "drives"}
+
+    adbnx_adapter.networkx_to_arangodb(
+        "Drivers",
+        nx_g,
+        e_d,
+        node_routing=node_routing,
+        edge_routing=edge_routing,
+    )
+
+    assert db.collection("Person").count() == 2
+    assert db.collection("Car").count() == 2
+    assert db.collection("drives").count() == 1
+    assert db.collection("owns").count() == 1
+
+    bad_routings: List[Dict[str, Any]] = [
+        {"node_routing": {"mapping": {"P": "Person"}}},
+        {"node_routing": {"attribute": "type", "mapping": {"P": "Invalid"}}},
+        {"node_routing": {"attribute": "type", "mapping": {"P": "Person"}}},
+        {"node_routing": node_routing, "edge_routing": {"attribute": "relation"}},
+    ]
+
+    for bad_routing in bad_routings:
+        with pytest.raises(ValueError):
+            adbnx_adapter.networkx_to_arangodb("Drivers", nx_g, e_d, **bad_routing)
+
+    # An unhashable routing value is reported along with its node
+    nx_g.nodes["P-John"]["type"] = ["P"]
+    with pytest.raises(ValueError, match="P-John"):
+        adbnx_adapter.networkx_to_arangodb(
+            "Drivers", nx_g, e_d, node_routing=node_routing
+        )
+
+    db.delete_graph("Drivers", ignore_missing=True, drop_collections=True)
+
+
 def test_nx_to_adb_invalid_collections() -> None:
     db.delete_graph("Drivers", ignore_missing=True, drop_collections=True)
 